@@ -47,12 +47,45 @@ class WordEntry {
     };
   }
 
+  static const cambridgeUrlPrefix =
+      'https://dictionary.cambridge.org/dictionary/english-chinese-traditional/';
+  static final _slugStrip = RegExp(r'[^A-Za-z0-9_\-]');
+
   static List<WordEntry> decodeList(String jsonStr) {
     final rawList = json.decode(jsonStr) as List<dynamic>;
     return rawList
         .map((item) => WordEntry.fromJson(item as Map<String, dynamic>))
         .toList();
   }
+
+  /// 精簡格式（schema v2，見 scripts/vocab_schema.py）的一筆資料：
+  /// 短鍵名、省略空白欄位，cambridgeUrl 未寫出時由 word 推導
+  factory WordEntry.fromCompactJson(Map<String, dynamic> json) {
+    final word = json['w'] as String? ?? '';
+    return WordEntry(
+      word: word,
+      translation: json['t'] as String? ?? '',
+      partOfSpeech: json['p'] as String? ?? '',
+      exampleEn: json['ee'] as String? ?? '',
+      exampleZh: json['ez'] as String? ?? '',
+      cambridgeUrl: json['u'] as String? ??
+          cambridgeUrlPrefix + word.replaceAll(_slugStrip, ''),
+      level: json['l'] as int? ?? 1,
+      audioUrl: json['a'] as String? ?? '',
+    );
+  }
+
+  /// 解碼 words_v2.json：{"version": 2, "words": [...]}
+  static List<WordEntry> decodeV2(String jsonStr) {
+    final doc = json.decode(jsonStr) as Map<String, dynamic>;
+    final version = doc['version'];
+    if (version != 2) {
+      throw FormatException('不支援的 schema 版本: $version');
+    }
+    return (doc['words'] as List<dynamic>)
+        .map((item) => WordEntry.fromCompactJson(item as Map<String, dynamic>))
+        .toList();
+  }
 }
 
 
@@ -1,3 +1,5 @@
+import 'dart:convert';
+
 import 'package:flutter/services.dart' show AssetBundle, rootBundle;
 
 import '../models/word_entry.dart';
@@ -9,10 +11,18 @@ class WordRepository {
 
   final AssetBundle _bundle;
   List<WordEntry> _cache;
+  final Map<int, List<WordEntry>> _levelCache = {};
 
   Future<List<WordEntry>> loadWords({int? level}) async {
+    // 只需要單一級別時，優先載入該級別的分片，不必解碼整個 words.json
+    if (level != null && _cache.isEmpty) {
+      final shard = await _loadLevelShard(level);
+      if (shard != null) {
+        return shard;
+      }
+    }
+
     if (_cache.isEmpty) {
-      // 先嘗試載入 words.json，如果不存在則使用 sample_words.json
       try {
         final raw = await _bundle.loadString('assets/data/words.json');
         _cache = WordEntry.decodeList(raw);
@@ -24,18 +34,79 @@ class WordRepository {
     }
     
     if (level != null) {
-      return _cache.where((word) => word.level == level).toList();
+      return _levelCache[level] ??= _cache.where((word) => word.level == level).toList();
     }
     
     return _cache;
   }
   
-  List<int> getAvailableLevels() {
+  Future<List<WordEntry>?> _loadLevelShard(int level) async {
+    final cached = _levelCache[level];
+    if (cached != null) {
+      return cached;
+    }
+    try {
+      // 級別分片為精簡格式（見 scripts/vocab_shards.py）
+      final raw = await _bundle.loadString('assets/data/words_level_$level.json');
+      return _levelCache[level] = WordEntry.decodeV2(raw);
+    } catch (e) {
+      // 沒有分片時改為載入完整的 words.json
+      return null;
+    }
+  }
+
+  /// 預先計算的干擾選項（words_distractors.json，每筆為 loadWords() 中的索引）；
+  /// 沒有文件或與目前的單字列表不符（單字數或 checksum 不同）時回傳 null
+  Future<List<List<int>>?> loadDistractors() async {
+    final words = await loadWords();
+    try {
+      final raw = await _bundle.loadString('assets/data/words_distractors.json');
+      final data = json.decode(raw) as Map<String, dynamic>;
+      if (data['count'] != words.length || data['checksum'] != wordsCrc32(words)) {
+        return null;
+      }
+      return (data['pools'] as List).map((pool) => (pool as List).cast<int>()).toList();
+    } catch (e) {
+      return null;
+    }
+  }
+
+  /// 單字列表的 CRC-32，與 scripts/vocab_core.py 的 words_crc32 相同：
+  /// 每筆為 "word\tlevel\tpartOfSpeech\ttranslation"，以換行連接後以 UTF-8 編碼
+  static int wordsCrc32(List<WordEntry> words) {
+    final text = words
+        .map((w) => '${w.word}\t${w.level}\t${w.partOfSpeech}\t${w.translation}')
+        .join('\n');
+    var crc = 0xFFFFFFFF;
+    for (final byte in utf8.encode(text)) {
+      crc = _crcTable[(crc ^ byte) & 0xFF] ^ (crc >> 8);
+    }
+    return crc ^ 0xFFFFFFFF;
+  }
+
+  static final List<int> _crcTable = List<int>.generate(256, (n) {
+    var c = n;
+    for (var k = 0; k < 8; k++) {
+      c = (c & 1) != 0 ? 0xEDB88320 ^ (c >> 1) : c >> 1;
+    }
+    return c;
+  });
+
+  /// 可選擇的級別：優先讀分片清單 words_manifest.json，不必載入整個單字列表；
+  /// 沒有清單時由完整的單字列表統計
+  Future<List<int>> getAvailableLevels() async {
     if (_cache.isEmpty) {
-      return [];
+      try {
+        final raw = await _bundle.loadString('assets/data/words_manifest.json');
+        final manifest = json.decode(raw) as Map<String, dynamic>;
+        return (manifest['levels'] as List)
+            .map((item) => (item as Map<String, dynamic>)['level'] as int)
+            .toList()
+          ..sort();
+      } catch (e) {
+        await loadWords();
+      }
     }
     return _cache.map((w) => w.level).toSet().toList()..sort();
   }
 }
-
-
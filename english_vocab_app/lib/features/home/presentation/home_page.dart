@@ -1,5 +1,3 @@
-import 'dart:async';
-
 import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import 'package:go_router/go_router.dart';
@@ -62,7 +60,7 @@ class _StudyContent extends ConsumerWidget {
       child: Column(
         crossAxisAlignment: CrossAxisAlignment.stretch,
         children: [
-          _LevelFilter(ref: ref),
+          const _LevelFilter(),
           const SizedBox(height: 16),
           _OverviewChips(state: state),
           const SizedBox(height: 24),
@@ -263,51 +261,36 @@ class _EmptyState extends StatelessWidget {
   }
 }
 
-class _LevelFilter extends ConsumerStatefulWidget {
-  const _LevelFilter({required this.ref});
-
-  final WidgetRef ref;
-
-  @override
-  ConsumerState<_LevelFilter> createState() => _LevelFilterState();
-}
-
-class _LevelFilterState extends ConsumerState<_LevelFilter> {
-  int? _selectedLevel;
+class _LevelFilter extends ConsumerWidget {
+  const _LevelFilter();
 
   @override
-  Widget build(BuildContext context) {
-    final repository = ref.read(wordRepositoryProvider);
-    final availableLevels = repository.getAvailableLevels();
+  Widget build(BuildContext context, WidgetRef ref) {
+    final availableLevels = ref.watch(availableLevelsProvider).valueOrNull ?? const <int>[];
+    final selectedLevel = ref.watch(selectedLevelProvider);
     
     if (availableLevels.isEmpty) {
       return const SizedBox.shrink();
     }
 
+    // 變更級別後 studySessionControllerProvider 會以新的級別重新載入
     return Wrap(
       spacing: 8,
       children: [
         FilterChip(
           label: const Text('全部'),
-          selected: _selectedLevel == null,
+          selected: selectedLevel == null,
           onSelected: (selected) {
             if (selected) {
-              setState(() => _selectedLevel = null);
-              unawaited(ref.refresh(studySessionControllerProvider.future));
+              ref.read(selectedLevelProvider.notifier).state = null;
             }
           },
         ),
         ...availableLevels.map((level) => FilterChip(
           label: Text('第$level級'),
-          selected: _selectedLevel == level,
+          selected: selectedLevel == level,
           onSelected: (selected) {
-            if (selected) {
-              setState(() => _selectedLevel = level);
-              // TODO: 更新 study session 以使用選定的級別
-            } else {
-              setState(() => _selectedLevel = null);
-            }
-            unawaited(ref.refresh(studySessionControllerProvider.future));
+            ref.read(selectedLevelProvider.notifier).state = selected ? level : null;
           },
         )),
       ],
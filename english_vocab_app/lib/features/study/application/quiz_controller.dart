@@ -12,10 +12,16 @@ final quizControllerProvider = AsyncNotifierProvider<QuizController, QuizState>(
 class QuizController extends AsyncNotifier<QuizState> {
   final _random = Random();
   late List<WordEntry> _words;
+  List<List<int>>? _distractors;
+
+  static const _optionCount = 4;
+  static const _maxRandomAttempts = 100;
 
   @override
   Future<QuizState> build() async {
-    _words = await ref.read(wordRepositoryProvider).loadWords();
+    final repository = ref.read(wordRepositoryProvider);
+    _words = await repository.loadWords();
+    _distractors = await repository.loadDistractors();
 
     if (_words.length < 2) {
       return QuizState.empty();
@@ -54,8 +60,9 @@ class QuizController extends AsyncNotifier<QuizState> {
   }
 
   QuizState _generateState({required int correctTally, required int questionNumber}) {
-    final question = _words[_random.nextInt(_words.length)];
-    final options = _shuffleOptions(question);
+    final index = _random.nextInt(_words.length);
+    final question = _words[index];
+    final options = _shuffleOptions(index);
     return QuizState(
       question: question,
       options: options,
@@ -67,11 +74,23 @@ class QuizController extends AsyncNotifier<QuizState> {
     );
   }
 
-  List<String> _shuffleOptions(WordEntry question) {
-    final options = <String>{question.translation};
-    while (options.length < 4 && options.length < _words.length) {
-      final candidate = _words[_random.nextInt(_words.length)].translation;
-      options.add(candidate);
+  List<String> _shuffleOptions(int index) {
+    final options = <String>{_words[index].translation};
+    // 優先使用預先計算的干擾選項（詞性相同、級別相近、翻譯不重疊）
+    final pool = _distractors?[index];
+    if (pool != null) {
+      for (final j in List<int>.of(pool)..shuffle(_random)) {
+        if (options.length >= _optionCount) {
+          break;
+        }
+        options.add(_words[j].translation);
+      }
+    }
+    // 不足時隨機抽取；限制次數，翻譯大多相同時也不會無限循環
+    for (var attempt = 0;
+        options.length < _optionCount && attempt < _maxRandomAttempts;
+        attempt++) {
+      options.add(_words[_random.nextInt(_words.length)].translation);
     }
     final optionList = options.toList();
     optionList.shuffle(_random);
@@ -14,6 +14,13 @@ final progressServiceProvider = Provider<ProgressService>((ref) {
   return ProgressService();
 });
 
+/// 學習時選擇的級別，null 為全部級別
+final selectedLevelProvider = StateProvider<int?>((ref) => null);
+
+final availableLevelsProvider = FutureProvider<List<int>>((ref) {
+  return ref.read(wordRepositoryProvider).getAvailableLevels();
+});
+
 final studySessionControllerProvider = AsyncNotifierProvider<StudySessionController, StudySessionState>(
   StudySessionController.new,
 );
@@ -26,7 +33,8 @@ class StudySessionController extends AsyncNotifier<StudySessionState> {
   @override
   Future<StudySessionState> build() async {
     final repository = ref.read(wordRepositoryProvider);
-    _words = await repository.loadWords();
+    // 選擇單一級別時只載入該級別的分片
+    _words = await repository.loadWords(level: ref.watch(selectedLevelProvider));
 
     final progress = ref.read(progressServiceProvider);
     _masteredWords = await progress.loadMasteredWords();
@@ -0,0 +1,636 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+單字資料處理的效能測試
+用法: python bench_vocab.py [項目...]
+不指定項目時執行全部；測試資料由 assets/data/words.json 重複產生
+"""
+
+import itertools
+import json
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import vocab_core
+
+SCRIPT_DIR = Path(__file__).parent
+WORDS_FILE = SCRIPT_DIR.parent / 'assets' / 'data' / 'words.json'
+
+
+def load_sample_words():
+    """讀取現有的 words.json 作為測試資料"""
+    with open(WORDS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def make_rows(words, count):
+    """將單字資料轉回 tab 分隔的原始資料行，重複到 count 行"""
+    base = [
+        f"{w['level']}\t{w['word']}\t{w['partOfSpeech']}\t{w['word']} ({w['partOfSpeech']})\t{w['translation']}\n"
+        for w in words
+    ]
+    rows = base * (count // len(base) + 1)
+    return rows[:count]
+
+
+def timed(func, *args, repeat=3):
+    """執行 repeat 次，回傳 (最短秒數, 最後一次的結果)"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def print_row(label, seconds, count, baseline=None):
+    """列印一行測試結果"""
+    rate = count / seconds if seconds else float('inf')
+    line = f"  {label:<28} {seconds * 1000:10.2f} ms {rate:14,.0f} 行/秒"
+    if baseline:
+        line += f"   x{baseline / seconds:.2f}"
+    print(line)
+
+
+# ---------------------------------------------------------------------------
+# 舊版逐行解析（parse_complete_vocab.parse_tab_separated_line 的原始寫法）
+# 只作為效能比較的基準，不應在其他地方使用
+# ---------------------------------------------------------------------------
+
+def _legacy_extract_base_word(word):
+    word = re.sub(r'\([^)]+\)', '', word)
+    if '/' in word:
+        word = word.split('/')[0]
+    return word.strip().lower()
+
+
+def _legacy_generate_cambridge_url(word):
+    base_word = _legacy_extract_base_word(word)
+    base_word = re.sub(r'[^\w\-]', '', base_word)
+    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{base_word}"
+
+
+def _legacy_parse_line(line):
+    line = line.strip()
+    if not line:
+        return None
+    if '\t' in line:
+        parts = line.split('\t')
+    else:
+        parts = re.split(r'\s{2,}', line)
+    if len(parts) < 5:
+        parts = line.split(' ', 4)
+    if len(parts) < 5:
+        return None
+    level_str = parts[0].strip()
+    if level_str.isdigit():
+        level = int(level_str)
+    elif '一' in level_str or '1' in level_str:
+        level = 1
+    elif '二' in level_str or '2' in level_str:
+        level = 2
+    elif '三' in level_str or '3' in level_str:
+        level = 3
+    elif '四' in level_str or '4' in level_str:
+        level = 4
+    elif '五' in level_str or '5' in level_str:
+        level = 5
+    elif '六' in level_str or '6' in level_str:
+        level = 6
+    else:
+        return None
+    word = parts[1].strip()
+    translation = parts[4].strip()
+    if not word or not translation:
+        return None
+    base_word = _legacy_extract_base_word(word)
+    if not base_word:
+        return None
+    return {
+        'word': base_word,
+        'translation': translation,
+        'partOfSpeech': parts[2].strip(),
+        'exampleEn': '',
+        'exampleZh': '',
+        'cambridgeUrl': _legacy_generate_cambridge_url(base_word),
+        'level': level,
+        'audioUrl': ''
+    }
+
+
+def _parse_all(parse, rows):
+    return [entry for entry in map(parse, rows) if entry]
+
+
+def bench_parse(words):
+    """共用解析核心 vs 舊版逐行解析"""
+    for count in (6_000, 600_000):
+        rows = make_rows(words, count)
+        legacy_time, legacy = timed(_parse_all, _legacy_parse_line, rows)
+        core_time, core = timed(_parse_all, vocab_core.parse_line, rows)
+        if legacy != core:
+            print("  警告: 兩種解析結果不一致")
+        print(f"{count:,} 行:")
+        print_row('舊版 parse_line', legacy_time, count)
+        print_row('vocab_core.parse_line', core_time, count, legacy_time)
+
+
+def make_frame(words, count):
+    """建立與 Excel 工作表相同欄位的 DataFrame，重複到 count 行"""
+    import pandas as pd
+
+    rows = [line.rstrip('\n').split('\t') for line in make_rows(words, count)]
+    df = pd.DataFrame(rows, columns=['級別', '單字', '屬性', '輸出', '中文'])
+    df['級別'] = df['級別'].astype('int64')
+    return df
+
+
+def bench_excel(words):
+    """process_excel 整欄運算 vs df.iterrows()"""
+    import process_excel
+    if process_excel.pd is None:
+        print("  略過: 需要安裝 pandas")
+        return
+
+    for count in (6_000, 600_000):
+        df = make_frame(words, count)
+        cols = process_excel.detect_columns(df.columns)
+        rows_time, (rows_words, _) = timed(process_excel.process_rows, df, *cols, repeat=1)
+        cols_time, (cols_words, _) = timed(process_excel.process_columns, df, *cols)
+        if json.dumps(rows_words, ensure_ascii=False) != json.dumps(cols_words, ensure_ascii=False):
+            print("  警告: 兩種處理結果不一致")
+        print(f"{count:,} 行:")
+        print_row('process_rows (iterrows)', rows_time, count)
+        print_row('process_columns', cols_time, count, rows_time)
+
+
+def make_workbook(words, count, path):
+    """寫出含標題行、count 行資料的 xlsx"""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(['級別', '單字', '屬性', '輸出', '中文'])
+    for line in make_rows(words, count):
+        level, *rest = line.rstrip('\n').split('\t')
+        sheet.append([int(level), *rest])
+    workbook.save(path)
+
+
+def _first_and_peak(func):
+    """回傳 (取得第一筆資料的秒數, 總秒數, 記憶體峰值 MB)
+    時間與記憶體分兩次量測，避免 tracemalloc 的額外開銷影響時間
+    """
+    start = time.perf_counter()
+    iterator = iter(func())
+    next(iterator, None)
+    first = time.perf_counter() - start
+    for _ in iterator:
+        pass
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    for _ in func():
+        pass
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return first, total, peak
+
+
+def bench_stream(words):
+    """唯讀串流讀取 vs pd.read_excel 的首行時間與記憶體峰值"""
+    import process_excel
+    try:
+        import openpyxl  # noqa: F401
+    except ImportError:
+        print("  略過: 需要安裝 openpyxl")
+        return
+
+    def streaming(path):
+        rows = process_excel.iter_sheet_rows(path)
+        header = next(rows)
+        sample = list(itertools.islice(rows, process_excel.SAMPLE_ROWS))
+        roles = process_excel.infer_column_roles(sample)
+        stats = {'rows': 0, 'skipped': 0}
+        return process_excel.stream_entries(itertools.chain(sample, rows), roles, stats)
+
+    def with_pandas(path):
+        df = process_excel.pd.read_excel(path, sheet_name=0)
+        return process_excel.process_columns(df, *process_excel.detect_columns(df.columns))[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (6_000, 60_000):
+            path = Path(tmp) / f'bench_{count}.xlsx'
+            make_workbook(words, count, path)
+            print(f"{count:,} 行:")
+            candidates = [('stream', lambda: streaming(path))]
+            if process_excel.pd is not None:
+                candidates.append(('pandas read_excel', lambda: with_pandas(path)))
+            for label, func in candidates:
+                first, total, peak = _first_and_peak(func)
+                print(f"  {label:<20} 首行 {first * 1000:9.1f} ms   總計 {total * 1000:9.1f} ms   峰值 {peak:8.1f} MB")
+
+
+def bench_binary(words):
+    """.vocab 二進位檔 (mmap) vs json.load 的檔案大小、開檔與隨機存取時間"""
+    import random
+    import vocab_binary
+
+    for count in (6_000, 600_000):
+        sample = (words * (count // len(words) + 1))[:count]
+        picks = random.Random(0).sample(range(count), 1_000)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = Path(tmp) / 'words.json'
+            bin_path = Path(tmp) / 'words.vocab'
+            with open(json_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps(sample, ensure_ascii=False, indent=2))
+            vocab_binary.write(sample, bin_path)
+
+            def with_json():
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return [data[i] for i in picks]
+
+            def with_binary():
+                with vocab_binary.VocabReader(bin_path) as vocab:
+                    return [vocab[i] for i in picks]
+
+            json_time, json_result = timed(with_json)
+            bin_time, bin_result = timed(with_binary)
+            if json_result != bin_result:
+                print("  警告: 兩種讀取結果不一致")
+            json_size = json_path.stat().st_size
+            bin_size = bin_path.stat().st_size
+            print(f"{count:,} 筆（words.json {json_size / 1024:,.0f} KB，"
+                  f".vocab {bin_size / 1024:,.0f} KB，{bin_size / json_size:.1%}）:")
+            print_row('json.load + 1000 次存取', json_time, count)
+            print_row('VocabReader + 1000 次存取', bin_time, count, json_time)
+
+
+def bench_ndjson(words):
+    """串流 NDJSON 輸出的記憶體峰值 vs 收集列表後 json.dump"""
+    import vocab_ndjson
+
+    def collect_and_dump(path, count):
+        with open(path, 'w', encoding='utf-8') as out:
+            result = [e for e in (vocab_core.parse_line(line) for line in make_rows(words, count)) if e]
+            vocab_core.count_levels(result)
+            json.dump(result, out, ensure_ascii=False, indent=2)
+
+    def streaming(path, count):
+        stats = {'rows': 0, 'skipped': 0}
+        # 逐行產生輸入，模擬逐行讀取文件
+        lines = (line for chunk in iter_row_chunks(words, count) for line in chunk)
+        vocab_ndjson.write_ndjson(vocab_ndjson.iter_entries(lines, stats), path)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in (6_000, 60_000, 600_000):
+            print(f"{count:,} 行:")
+            candidates = [('串流 NDJSON', streaming)]
+            if count <= 60_000:
+                candidates.append(('列表 + json.dump', collect_and_dump))
+            for label, func in candidates:
+                path = Path(tmp) / 'out'
+                start = time.perf_counter()
+                func(path, count)
+                seconds = time.perf_counter() - start
+                tracemalloc.start()
+                func(path, count)
+                peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+                tracemalloc.stop()
+                print(f"  {label:<20} {seconds * 1000:10.1f} ms   峰值 {peak:8.2f} MB")
+
+
+def iter_row_chunks(words, count, chunk=6_000):
+    """分批產生原始資料行，總共 count 行（不一次建立整個列表）"""
+    for start in range(0, count, chunk):
+        yield make_rows(words, min(chunk, count - start))
+
+
+def bench_encode(words):
+    """vocab_encode 專用編碼器 vs json.dump（縮排與精簡輸出）"""
+    import io
+    import vocab_encode
+
+    for count in (6_000, 600_000):
+        sample = (words * (count // len(words) + 1))[:count]
+        print(f"{count:,} 筆:")
+        for pretty in (True, False):
+            kwargs = {'indent': 2} if pretty else {'separators': (',', ':')}
+
+            def stdlib():
+                out = io.StringIO()
+                json.dump(sample, out, ensure_ascii=False, **kwargs)
+                return out.getvalue()
+
+            def fast():
+                out = io.StringIO()
+                vocab_encode.dump_words(sample, out, pretty)
+                return out.getvalue()
+
+            std_time, std_text = timed(stdlib, repeat=1 if count > 6_000 else 3)
+            fast_time, fast_text = timed(fast, repeat=1 if count > 6_000 else 3)
+            if std_text != fast_text:
+                print("  警告: 輸出與標準函式庫不同")
+            mode = '縮排' if pretty else '精簡'
+            print_row(f'json.dump ({mode})', std_time, count)
+            print_row(f'vocab_encode ({mode})', fast_time, count, std_time)
+
+
+def bench_patch(words):
+    """vocab_patch 產生與套用差異檔的時間（應隨筆數線性增加）"""
+    import random
+    import vocab_patch
+
+    rng = random.Random(0)
+    for count in (60_000, 1_000_000):
+        old = [dict(w, word=f"{w['word']}{i // len(words)}")
+               for i, w in zip(range(count), itertools.cycle(words))]
+        new = list(old)
+        # 約 1% 的單字有修改、新增或刪除
+        for _ in range(count // 100):
+            i = rng.randrange(len(new))
+            action = rng.randrange(3)
+            if action == 0:
+                new[i] = dict(new[i], translation=new[i]['translation'] + '（修正）')
+            elif action == 1:
+                new.insert(i, dict(new[i], word=new[i]['word'] + '-new'))
+            else:
+                del new[i]
+
+        diff_time, patch = timed(vocab_patch.make_patch, old, new, repeat=1)
+        apply_time, result = timed(vocab_patch.apply_patch, old, patch, repeat=1)
+        if result != new:
+            print("  警告: 套用結果與新版本不同")
+        size = len(json.dumps(patch, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        added, updated, removed = vocab_patch.patch_summary(patch)
+        print(f"{count:,} 筆（新增 {added}、修改 {updated}、刪除 {removed}，差異檔 {size / 1024:,.0f} KB）:")
+        print_row('make_patch', diff_time, count)
+        print_row('apply_patch（含雜湊檢查）', apply_time, count)
+
+
+def _letters(n):
+    """將整數轉為小寫字母字串，產生不重複的測試單字"""
+    out = ''
+    while True:
+        n, r = divmod(n, 26)
+        out += chr(97 + r)
+        if not n:
+            return out
+
+
+def bench_search(words):
+    """vocab_search 前綴索引 / 後綴陣列 vs 逐筆掃描"""
+    import vocab_search
+
+    queries = [('prefix', 'con'), ('prefix', 'st'), ('prefix', 'pre'),
+               ('substring', 'tion'), ('substring', 'ough'), ('substring', 'ment')]
+    for count in (6_000, 1_000_000):
+        if count <= len(words):
+            entries = words[:count]
+        else:
+            entries = [{'word': w['word'] + _letters(i // len(words))}
+                       for i, w in zip(range(count), itertools.cycle(words))]
+        headwords = [e['word'] for e in entries]
+        build_time, index = timed(vocab_search.SearchIndex.build, entries, repeat=1)
+        print(f"{count:,} 個單字（建立索引 {build_time * 1000:,.0f} ms，"
+              f"{len(index.suffixes):,} 個後綴）:")
+        for kind, query in queries:
+            if kind == 'prefix':
+                def scan():
+                    return [i for i, w in enumerate(headwords) if w.startswith(query)]
+                lookup = index.prefix
+            else:
+                def scan():
+                    return [i for i, w in enumerate(headwords) if query in w]
+                lookup = index.substring
+            scan_time, expected = timed(scan)
+            index_time, found = timed(lookup, query)
+            if sorted(found) != expected:
+                print("  警告: 索引結果與逐筆掃描不同")
+            print(f"  {kind:<9} {query!r:<7} 掃描 {scan_time * 1000:9.3f} ms   索引 {index_time * 1000:9.3f} ms"
+                  f"   x{scan_time / index_time:8.1f}   {len(found):,} 筆")
+
+
+def bench_zh(words):
+    """vocab_zh_index 中文倒排索引 vs 逐筆掃描"""
+    import vocab_zh_index
+
+    queries = ['能力', '快', '蘋果', '有能力的', '不']
+    for count in (6_000, 600_000):
+        entries = [w for _, w in zip(range(count), itertools.cycle(words))]
+        build_time, index = timed(vocab_zh_index.ZhIndex.build, entries, repeat=1)
+        print(f"{count:,} 個單字（建立索引 {build_time * 1000:,.0f} ms，{len(index.terms):,} 個詞彙，"
+              f"倒排資料 {len(index.postings) / 1024:,.0f} KB）:")
+        for query in queries:
+            scan_time, expected = timed(vocab_zh_index.scan_search, query, entries)
+            index_time, found = timed(index.search, query, entries, count)
+            if sorted(found) != expected:
+                print("  警告: 索引結果與逐筆掃描不同")
+            print(f"  {query:<6} 掃描 {scan_time * 1000:9.3f} ms   索引 {index_time * 1000:9.3f} ms"
+                  f"   x{scan_time / index_time:8.1f}   {len(found):,} 筆")
+
+
+def bench_facets(words):
+    """vocab_facets 級別 / 詞性位元圖 vs 逐筆篩選"""
+    import vocab_facets
+
+    queries = [([3], ['adj.']), ([1, 2], ['n.']), ([], ['v.', 'adj.']), ([6], [])]
+    for count in (6_000, 1_000_000):
+        entries = [w for _, w in zip(range(count), itertools.cycle(words))]
+        build_time, index = timed(vocab_facets.FacetIndex.build, entries, repeat=1)
+        print(f"{count:,} 個單字（建立位元圖 {build_time * 1000:,.0f} ms，"
+              f"{len(index.encode()) / 1024:,.0f} KB）:")
+        for levels, pos in queries:
+            scan_time, expected = timed(vocab_facets.filter_words, entries, levels, pos)
+            bits_time, bits = timed(index.query, levels, pos)
+            ids_time, found = timed(index.ids, bits)
+            if found != expected:
+                print("  警告: 位元圖結果與逐筆篩選不同")
+            label = f"級別 {levels or '全部'} 詞性 {pos or '全部'}"
+            print(f"  {label:<28} 篩選 {scan_time * 1000:9.3f} ms   位元圖 {bits_time * 1000:7.3f} ms"
+                  f"（含取出索引 {(bits_time + ids_time) * 1000:7.3f} ms）"
+                  f"   x{scan_time / (bits_time + ids_time):7.1f}   {len(found):,} 筆")
+
+
+def _pseudo_words(words, count, seed=0):
+    """以單字的二階字母模型產生類似英文的假單字，補足到 count 個不重複的單字"""
+    import random
+
+    rng = random.Random(seed)
+    following = {}
+    headwords = [w['word'] for w in words if w['word'].isalpha()]
+    for word in headwords:
+        text = '^^' + word + '$'
+        for i in range(len(text) - 2):
+            following.setdefault(text[i:i + 2], []).append(text[i + 2])
+    result = set(headwords[:count])
+    while len(result) < count:
+        text = '^^'
+        while text[-1] != '$' and len(text) < 16:
+            text += rng.choice(following[text[-2:]])
+        word = text[2:].rstrip('$')
+        if len(word) >= 3:
+            result.add(word)
+    return sorted(result)
+
+
+def bench_confusables(words):
+    """vocab_confusables 刪除變體分組 + numpy 帶狀編輯距離 vs 兩兩比對"""
+    import vocab_confusables
+
+    headwords = sorted({w['word'] for w in words})
+    sample = headwords[::len(headwords) // 1_000][:1_000]
+
+    def naive():
+        found = 0
+        for i, a in enumerate(sample):
+            for b in sample[i + 1:]:
+                shorter = min(len(a), len(b))
+                if shorter >= vocab_confusables.MIN_LENGTH:
+                    limit = vocab_confusables._limit(shorter, vocab_confusables.MAX_DISTANCE)
+                    found += vocab_confusables.edit_distance(a, b, limit) <= limit
+        return found
+
+    naive_time, naive_found = timed(naive, repeat=1)
+    fast_time, fast_found = timed(vocab_confusables.find_pairs, sample, repeat=1)
+    print(f"{len(sample):,} 個單字兩兩比對: {naive_time * 1000:,.0f} ms，"
+          f"分組 + numpy: {fast_time * 1000:,.1f} ms（{naive_found} / {len(fast_found)} 組）")
+    for count in (len(headwords), 100_000):
+        corpus = headwords if count == len(headwords) else _pseudo_words(words, count)
+        elapsed, pairs = timed(vocab_confusables.find_pairs, corpus, repeat=1)
+        estimate = naive_time * (len(corpus) / len(sample)) ** 2
+        print(f"{len(corpus):,} 個單字: {elapsed:,.2f} 秒，{len(pairs):,} 組"
+              f"（兩兩比對估計 {estimate:,.0f} 秒）")
+
+
+def bench_typo(words):
+    """vocab_typo 刪除變體索引 vs 逐一計算編輯距離"""
+    import random
+    import vocab_typo
+
+    rng = random.Random(1)
+
+    def misspell(word, edits):
+        for _ in range(edits):
+            position = rng.randrange(len(word) + 1)
+            letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+            operation = rng.randrange(3)
+            if operation == 0:
+                word = word[:position] + letter + word[position:]
+            elif operation == 1 and len(word) > 1:
+                word = word[:position] + word[position + 1:]
+            else:
+                word = word[:position] + letter + word[position + 1:]
+        return word
+
+    for count in (len(words), 100_000):
+        entries = words if count == len(words) else [{'word': w} for w in _pseudo_words(words, count)]
+        build_time, index = timed(vocab_typo.TypoIndex.build, entries, repeat=1)
+        print(f"{len(index.words):,} 個單字（建立索引 {build_time:,.1f} 秒，"
+              f"{len(index.variants):,} 個變體，{len(index.encode()) / 1024 / 1024:,.1f} MB）:")
+        for distance in (1, 2):
+            queries = [misspell(rng.choice(index.words), distance) for _ in range(20)]
+            brute_time, expected = timed(lambda: [vocab_typo.brute_force(q, index.words, distance)
+                                                  for q in queries], repeat=1)
+            lookup_time, found = timed(lambda: [index.lookup(q, distance) for q in queries])
+            if found != expected:
+                print("  警告: 索引結果與逐一計算不同")
+            brute_each = brute_time / len(queries) * 1e6
+            lookup_each = lookup_time / len(queries) * 1e6
+            print(f"  距離 {distance}: 逐一計算 {brute_each:12,.0f} µs/次   索引 {lookup_each:8,.0f} µs/次"
+                  f"   x{brute_each / lookup_each:8.1f}")
+
+
+def bench_normalize(words):
+    """normalize_headword 一次掃描 vs extract_base_word 兩次（單字 + 網址）"""
+    raw = []
+    with open(SCRIPT_DIR / 'words_input.txt', 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.strip().rsplit(' ', 1)
+            if len(parts) == 2:
+                raw.append(parts[0])
+    raw += [w['word'] for w in words]
+
+    def legacy():
+        return [(vocab_core.extract_base_word(w), vocab_core.cambridge_slug(vocab_core.extract_base_word(w)))
+                for w in raw]
+
+    def cold():
+        vocab_core.normalize_headword.cache_clear()
+        return [vocab_core.normalize_headword(w) for w in raw]
+
+    def warm():
+        return [vocab_core.normalize_headword(w) for w in raw]
+
+    legacy_time, expected = timed(legacy)
+    cold_time, found = timed(cold)
+    if [(key, slug) for key, _, slug in found] != expected:
+        print("  警告: 正規化結果與 extract_base_word 不同")
+    warm_time, _ = timed(warm)
+    print(f"{len(raw):,} 個單字（{sum(bool(forms) for _, forms, _ in found)} 個有其他寫法）:")
+    print_row('extract_base_word x2', legacy_time, len(raw))
+    print_row('normalize_headword（無快取）', cold_time, len(raw), legacy_time)
+    print_row('normalize_headword（快取）', warm_time, len(raw), legacy_time)
+    stats = vocab_core.normalize_cache_stats()
+    print(f"  快取命中率 {stats['hit_rate']:.1%}（{stats['size']}/{stats['maxsize']}）")
+
+
+def bench_schema(words):
+    """words_v2.json vs words.json 的大小與解碼時間（v2 含還原完整欄位）"""
+    import vocab_encode
+    import vocab_schema
+
+    for count in (6_000, 600_000):
+        sample = (words * (count // len(words) + 1))[:count]
+        v1_data = vocab_encode.encode_words(sample).encode('utf-8')
+        v2_data = vocab_schema.encode_v2(sample)
+        v1_time, v1 = timed(json.loads, v1_data)
+        v2_time, v2 = timed(lambda data: vocab_schema.expand_v2(json.loads(data)), v2_data)
+        if v1 != v2:
+            print("  警告: v2 還原後與 v1 不同")
+        print(f"{count:,} 筆（v1 {len(v1_data) / 1024:,.0f} KB，v2 {len(v2_data) / 1024:,.0f} KB，"
+              f"{len(v2_data) / len(v1_data):.1%}）:")
+        print_row('json.loads(v1)', v1_time, count)
+        print_row('v2 + expand_v2', v2_time, count, v1_time)
+
+
+BENCHMARKS = {
+    'parse': bench_parse,
+    'excel': bench_excel,
+    'stream': bench_stream,
+    'binary': bench_binary,
+    'ndjson': bench_ndjson,
+    'encode': bench_encode,
+    'patch': bench_patch,
+    'search': bench_search,
+    'zh': bench_zh,
+    'facets': bench_facets,
+    'confusables': bench_confusables,
+    'typo': bench_typo,
+    'normalize': bench_normalize,
+    'schema': bench_schema,
+}
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        print(f"未知的測試項目: {', '.join(unknown)}")
+        print(f"可用項目: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+
+    words = load_sample_words()
+    for name in names:
+        print(f"\n== {name}: {BENCHMARKS[name].__doc__} ==")
+        BENCHMARKS[name](words)
+
+
+if __name__ == '__main__':
+    main()
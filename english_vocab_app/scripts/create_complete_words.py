@@ -5,24 +5,13 @@
 此腳本會處理用戶提供的完整單字列表文本
 """
 
-import json
 import re
 import sys
 
-def extract_base_word(word: str) -> str:
-    """提取單字的基本形式"""
-    if '/' in word:
-        word = word.split('/')[0]
-    word = re.sub(r'\([^)]+\)', '', word)
-    return word.strip().lower()
+from vocab_core import count_levels, dedupe_words, make_entry, normalize_headword, print_level_counts, save_words_json
 
-def generate_cambridge_url(word: str) -> str:
-    """生成劍橋字典連結"""
-    base_word = extract_base_word(word)
-    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{base_word}"
-
-def parse_word_line(line: str, level: int):
-    """解析單行單字"""
+def parse_word_line(line: str, level: int, headwords: list = None):
+    """解析單行單字；headwords 不為 None 時加入原始單字欄位（供詞族找出括號中的寫法）"""
     line = line.strip()
     if not line:
         return None
@@ -37,20 +26,13 @@ def parse_word_line(line: str, level: int):
     word_part = match.group(1).strip()
     pos_part = match.group(2).strip()
     
-    base_word = extract_base_word(word_part)
+    base_word, _, slug = normalize_headword(word_part)
     if not base_word or len(base_word) < 1:
         return None
+    if headwords is not None:
+        headwords.append(word_part)
     
-    return {
-        'word': base_word,
-        'translation': '',  # 待補充
-        'partOfSpeech': pos_part,
-        'exampleEn': '',
-        'exampleZh': '',
-        'cambridgeUrl': generate_cambridge_url(base_word),
-        'level': level,
-        'audioUrl': ''
-    }
+    return make_entry(base_word, '', pos_part, level, slug)  # 翻譯待補充
 
 def main():
     # 從標準輸入或文件讀取
@@ -62,6 +44,7 @@ def main():
             text = f.read()
     
     words = []
+    headwords = []
     current_level = 0
     
     for line in text.split('\n'):
@@ -91,23 +74,20 @@ def main():
             continue
         
         if current_level > 0:
-            entry = parse_word_line(line, current_level)
+            entry = parse_word_line(line, current_level, headwords)
             if entry:
                 words.append(entry)
     
     # 統計
-    level_counts = {}
-    for w in words:
-        level_counts[w['level']] = level_counts.get(w['level'], 0) + 1
+    words = dedupe_words(words)
+    level_counts = count_levels(words)
     
     print(f"共 {len(words)} 個單字")
-    for level in sorted(level_counts.keys()):
-        print(f"第{level}級: {level_counts[level]} 個")
+    print_level_counts(level_counts)
     
     # 保存
     output = '../assets/data/words.json'
-    with open(output, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+    save_words_json(words, output, headwords=headwords)
     
     print(f"已保存到 {output}")
 
@@ -5,26 +5,13 @@
 由於單字數量龐大，此腳本會生成基礎結構，翻譯可後續補充
 """
 
-import json
 import re
 from typing import List, Dict, Optional
 
-def extract_base_word(word: str) -> str:
-    """提取單字的基本形式"""
-    # 處理 a/an 這種情況
-    if '/' in word:
-        word = word.split('/')[0]
-    # 移除括號內容，如 agree(ment)
-    word = re.sub(r'\([^)]+\)', '', word)
-    return word.strip().lower()
+from vocab_core import count_levels, dedupe_words, make_entry, normalize_headword, save_words_json
 
-def generate_cambridge_url(word: str) -> str:
-    """生成劍橋字典連結"""
-    base_word = extract_base_word(word)
-    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{base_word}"
-
-def parse_word_entry(line: str, level: int) -> Optional[Dict]:
-    """解析單行單字"""
+def parse_word_entry(line: str, level: int, headwords: Optional[List[str]] = None) -> Optional[Dict]:
+    """解析單行單字；headwords 不為 None 時加入原始單字欄位（供詞族找出括號中的寫法）"""
     line = line.strip()
     if not line:
         return None
@@ -39,23 +26,16 @@ def parse_word_entry(line: str, level: int) -> Optional[Dict]:
     pos_part = match.group(2).strip()
     
     # 提取基本單字（用於 URL 和顯示）
-    base_word = extract_base_word(word_part)
+    base_word, _, slug = normalize_headword(word_part)
     if not base_word:
         return None
+    if headwords is not None:
+        headwords.append(word_part)
     
-    return {
-        'word': base_word,
-        'translation': '',  # 待從劍橋字典獲取
-        'partOfSpeech': pos_part,
-        'exampleEn': '',
-        'exampleZh': '',
-        'cambridgeUrl': generate_cambridge_url(base_word),
-        'level': level,
-        'audioUrl': ''
-    }
+    return make_entry(base_word, '', pos_part, level, slug)  # 翻譯待從劍橋字典獲取
 
-def parse_all_words(text: str) -> List[Dict]:
-    """解析完整的單字列表"""
+def parse_all_words(text: str, headwords: Optional[List[str]] = None) -> List[Dict]:
+    """解析完整的單字列表；headwords 見 parse_word_entry"""
     words = []
     current_level = 0
     lines = text.split('\n')
@@ -89,7 +69,7 @@ def parse_all_words(text: str) -> List[Dict]:
         
         # 解析單字行
         if current_level > 0:
-            entry = parse_word_entry(line, current_level)
+            entry = parse_word_entry(line, current_level, headwords)
             if entry:
                 words.append(entry)
     
@@ -111,13 +91,12 @@ def main():
         print("或者直接在腳本中修改 WORD_LIST_TEXT 變量")
         return
     
-    words = parse_all_words(text)
+    headwords = []
+    words = parse_all_words(text, headwords)
     
     # 統計信息
-    level_counts = {}
-    for word in words:
-        level = word['level']
-        level_counts[level] = level_counts.get(level, 0) + 1
+    words = dedupe_words(words)
+    level_counts = count_levels(words)
     
     print(f"共解析到 {len(words)} 個單字")
     print("級別分布:")
@@ -126,8 +105,7 @@ def main():
     
     # 保存為 JSON
     output_file = '../assets/data/words.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+    save_words_json(words, output_file, headwords=headwords)
     
     print(f"\n已保存到 {output_file}")
     print("注意: translation 字段為空，需要後續從劍橋字典獲取翻譯")
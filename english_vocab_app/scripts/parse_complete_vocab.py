@@ -5,97 +5,110 @@
 格式: 級別\t單字\t屬性\t輸出\t中文
 """
 
+import argparse
 import json
-import re
 import sys
+import time
 from pathlib import Path
 
-def extract_base_word(word: str) -> str:
-    """提取單字的基本形式（去除括號、斜線等）"""
-    # 處理如 "he (him, his, himself)" -> "he"
-    word = re.sub(r'\([^)]+\)', '', word)
-    # 處理如 "a/an" -> "a"
-    if '/' in word:
-        word = word.split('/')[0]
-    return word.strip().lower()
+import vocab_compress
+import vocab_confusables
+import vocab_core
+import vocab_dedupe
+import vocab_distractors
+import vocab_facets
+import vocab_families
+import vocab_ids
+import vocab_incremental
+import vocab_ndjson
+import vocab_phonetic
+import vocab_schema
+import vocab_search
+import vocab_shards
+import vocab_sqlite
+import vocab_typo
+import vocab_variants
+import vocab_zh_index
+from vocab_core import BUILD_DIR, count_levels, parse_line, print_level_counts, save_words_json
 
-def generate_cambridge_url(word: str) -> str:
-    """生成劍橋字典連結"""
-    base_word = extract_base_word(word)
-    # 清理特殊字符，只保留字母、數字和連字符
-    base_word = re.sub(r'[^\w\-]', '', base_word)
-    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{base_word}"
-
-def parse_tab_separated_line(line: str):
-    """解析 tab 分隔的單行數據
-    格式: 級別\t單字\t屬性\t輸出\t中文
-    例如: 1\ta/an\tart.\ta/an (art.)\t一個/一個
+def rebuild_derived(words, output_file, lines):
+    """增量重建後更新分片、v2、干擾選項與詞族；words.json、產生程式與輸入都沒有變更的項目直接沿用
+    回傳 {項目: 結果}，沿用的項目為 None
     """
-    line = line.strip()
-    if not line:
-        return None
-    
-    # 使用 tab 分隔
-    if '\t' in line:
-        parts = line.split('\t')
-    else:
-        # 如果沒有 tab，嘗試用多個空格分隔（至少2個空格）
-        parts = re.split(r'\s{2,}', line)
-    
-    if len(parts) < 5:
-        # 嘗試用單個空格分隔（較不精確，但作為備選）
-        parts = line.split(' ', 4)
-    
-    if len(parts) < 5:
-        return None
-    
-    try:
-        level_str = parts[0].strip()
-        # 處理級別（可能是 "1" 或 "第一級" 等）
-        if level_str.isdigit():
-            level = int(level_str)
-        elif '一' in level_str or '1' in level_str:
-            level = 1
-        elif '二' in level_str or '2' in level_str:
-            level = 2
-        elif '三' in level_str or '3' in level_str:
-            level = 3
-        elif '四' in level_str or '4' in level_str:
-            level = 4
-        elif '五' in level_str or '5' in level_str:
-            level = 5
-        elif '六' in level_str or '6' in level_str:
-            level = 6
-        else:
-            return None
-        
-        word = parts[1].strip()
-        part_of_speech = parts[2].strip()
-        # parts[3] 是輸出格式，可以忽略
-        translation = parts[4].strip()
-        
-        if not word or not translation:
-            return None
-        
-        base_word = extract_base_word(word)
-        if not base_word:
-            return None
-        
-        return {
-            'word': base_word,
-            'translation': translation,
-            'partOfSpeech': part_of_speech,
-            'exampleEn': '',
-            'exampleZh': '',
-            'cambridgeUrl': generate_cambridge_url(base_word),
-            'level': level,
-            'audioUrl': ''
-        }
-    except (ValueError, IndexError) as e:
-        print(f"解析錯誤: {line[:80]}... - {e}", file=sys.stderr)
-        return None
+    data_dir = output_file.parent
+    headwords = list(vocab_variants.source_headwords(lines))
+    stages = vocab_incremental.load_stages(output_file)
+    run = lambda name, modules, outputs, func, extra=(): vocab_incremental.run_stage(
+        stages, name, vocab_incremental.stage_key(output_file, modules, extra), outputs, func)
+    results = {
+        '分片': run('shards', [vocab_shards, vocab_schema],
+                  [data_dir / vocab_shards.MANIFEST_NAME,
+                   BUILD_DIR / vocab_shards.PAGES_DIR_NAME / vocab_shards.MANIFEST_NAME],
+                  lambda: vocab_shards.write_shards(words, data_dir)),
+        'schema v2': run('v2', [vocab_schema], [BUILD_DIR / vocab_schema.V2_NAME],
+                         lambda: vocab_schema.write_v2(words, BUILD_DIR)),
+        '干擾選項': run('distractors', [vocab_distractors, vocab_facets, vocab_zh_index, vocab_core],
+                    [data_dir / vocab_distractors.DISTRACTORS_NAME],
+                    lambda: vocab_distractors.write_distractors(words, data_dir)),
+        '詞族': run('families', [vocab_families, vocab_facets, vocab_core],
+                  [data_dir / vocab_families.FAMILIES_NAME],
+                  lambda: vocab_families.write_families(words, data_dir, headwords), headwords),
+    }
+    vocab_incremental.save_stages(output_file, stages)
+    return results
+
+def compress_outputs(output_file):
+    """壓縮 words.json 與 words_v2.json，列出各版本的比較"""
+    files = [output_file, BUILD_DIR / vocab_schema.V2_NAME]
+    results = vocab_compress.compress_files(files, vocab_compress.DEFAULT_LEVELS)
+    print()
+    vocab_compress.print_compress_table(results)
+
+def build_sqlite(words):
+    """輸出 SQLite 資料庫"""
+    result = vocab_sqlite.build_database(words, BUILD_DIR / vocab_sqlite.DB_NAME)
+    print(f"SQLite 資料庫已保存到 {result['path']}（{result['bytes'] / 1024:.1f} KB，"
+          f"耗時 {result['seconds'] * 1000:.1f} ms）")
+
+def build_indexes(words, output_file, lines):
+    """建立搜尋用的索引；lines 為來源資料，用來找出單字的其他寫法"""
+    path = vocab_search.SearchIndex.build(words).save(BUILD_DIR / vocab_search.INDEX_NAME)
+    print(f"搜尋索引已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    path = vocab_zh_index.ZhIndex.build(words).save(BUILD_DIR / vocab_zh_index.INDEX_NAME)
+    print(f"中文索引已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    path = vocab_facets.FacetIndex.build(words).save(BUILD_DIR / vocab_facets.INDEX_NAME)
+    print(f"級別 / 詞性位元圖已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    id_map, _ = vocab_ids.build_id_map(words, output_file.parent / vocab_ids.REGISTRY_NAME)
+    path = id_map.save(BUILD_DIR / vocab_ids.INDEX_NAME)
+    print(f"單字 ID 完美雜湊已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    path = vocab_typo.TypoIndex.build(words).save(BUILD_DIR / vocab_typo.INDEX_NAME)
+    print(f"拼字索引已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    variant_map = vocab_variants.VariantMap.build(words, vocab_variants.source_headwords(lines))
+    path = variant_map.save(BUILD_DIR / vocab_variants.VARIANTS_NAME)
+    print(f"其他寫法對照表已保存到 {path}（{len(variant_map.variants)} 個寫法）")
+    vocab_variants.print_cache_stats()
+    path = vocab_phonetic.PhoneticIndex.build(words).save(BUILD_DIR / vocab_phonetic.PHONETIC_NAME)
+    print(f"發音鍵索引已保存到 {path}（{path.stat().st_size / 1024:.1f} KB）")
+    result = vocab_confusables.write_confusables(words)
+    print(f"容易混淆的單字已保存到 {result['path']}（{result['words']} 個單字，"
+          f"耗時 {result['seconds'] * 1000:.0f} ms）")
 
 def main():
+    parser = argparse.ArgumentParser(description='解析完整的單字列表並生成 words.json')
+    parser.add_argument('--incremental', action='store_true',
+                        help='只重新解析新增或修改過的行，其餘內容沿用現有的 words.json')
+    parser.add_argument('--duplicates', choices=vocab_dedupe.POLICIES, default=vocab_dedupe.DEFAULT_POLICY,
+                        help='重複單字的處理方式: 合併、保留第一筆或報錯（預設 merge，--ndjson 也適用）')
+    parser.add_argument('--ndjson', action='store_true',
+                        help='串流解析並輸出 JSON Lines（build/vocab/words.ndjson），記憶體用量固定')
+    parser.add_argument('--sqlite', action='store_true',
+                        help='另外輸出 SQLite 資料庫 build/vocab/words.db（見 vocab_sqlite.py）')
+    parser.add_argument('--index', action='store_true',
+                        help='另外建立搜尋索引到 build/vocab/（見 vocab_search.py）')
+    parser.add_argument('--compress', action='store_true',
+                        help='另外產生 gzip / bz2 / xz 壓縮版本並列出比較（見 vocab_compress.py）')
+    args = parser.parse_args()
+    
     # 輸入文件路徑
     script_dir = Path(__file__).parent
     input_file = script_dir / 'vocab_data.txt'
@@ -108,6 +121,23 @@ def main():
         print("格式: 級別\\t單字\\t屬性\\t輸出\\t中文", file=sys.stderr)
         sys.exit(1)
     
+    if args.ndjson:
+        # 逐行讀取、解析並寫出，不保留整個輸入或單字列表（重複的單字讀兩遍處理，見 vocab_ndjson）
+        ndjson_file = BUILD_DIR / vocab_ndjson.NDJSON_NAME
+        start = time.perf_counter()
+        try:
+            stats = vocab_ndjson.convert_file(input_file, ndjson_file, args.duplicates)
+        except vocab_dedupe.DuplicateWordError as e:
+            print(f"錯誤: {e}", file=sys.stderr)
+            sys.exit(1)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"串流輸出: 共 {stats['rows']} 行，跳過 {stats['skipped']} 行，耗時 {elapsed:.1f} ms")
+        vocab_dedupe.print_collisions(stats['collisions'])
+        print(f"\n共解析 {sum(stats['level_counts'].values())} 個單字")
+        print_level_counts(stats['level_counts'])
+        print(f"\n已保存到 {ndjson_file}")
+        return
+    
     # 讀取數據
     try:
         with open(input_file, 'r', encoding='utf-8') as f:
@@ -116,11 +146,48 @@ def main():
         print(f"讀取文件錯誤: {e}", file=sys.stderr)
         sys.exit(1)
     
+    if args.incremental:
+        start = time.perf_counter()
+        try:
+            stats = vocab_incremental.build(lines, output_file, args.duplicates)
+        except vocab_dedupe.DuplicateWordError as e:
+            print(f"錯誤: {e}", file=sys.stderr)
+            sys.exit(1)
+        words = json.loads(output_file.read_bytes())
+        derived = rebuild_derived(words, output_file, lines)
+        elapsed = (time.perf_counter() - start) * 1000
+        mode = "完整重建（沒有可用的清單）" if stats['full'] else "增量重建"
+        print(f"{mode}: 共 {stats['rows']} 行，沿用 {stats['reused']} 行，"
+              f"重新解析 {stats['parsed']} 行，跳過 {stats['skipped']} 行，耗時 {elapsed:.1f} ms")
+        vocab_dedupe.print_collisions(stats['collisions'])
+        print(f"\n共 {sum(stats['level_counts'].values())} 個單字")
+        print_level_counts(stats['level_counts'])
+        print(f"\n已保存到 {output_file}")
+        if derived['schema v2'] is not None:
+            vocab_schema.print_schema_report(derived['schema v2'], output_file.stat().st_size)
+        if derived['干擾選項'] is not None:
+            vocab_distractors.print_distractor_report(derived['干擾選項'])
+        if derived['詞族'] is not None:
+            vocab_families.print_family_report(derived['詞族'])
+        reused = [name for name, result in derived.items() if result is None]
+        if reused:
+            print(f"未變更，沿用: {'、'.join(reused)}")
+        # 增量重建不經過 save_words_json，另外更新 ID 登錄表
+        vocab_ids.print_registry_report(
+            vocab_ids.update_registry(words, output_file.parent / vocab_ids.REGISTRY_NAME))
+        if args.sqlite:
+            build_sqlite(words)
+        if args.index:
+            build_indexes(words, output_file, lines)
+        if args.compress:
+            compress_outputs(output_file)
+        return
+    
     words = []
     skipped = 0
     
     for line_num, line in enumerate(lines, 1):
-        entry = parse_tab_separated_line(line)
+        entry = parse_line(line)
         if entry:
             words.append(entry)
         else:
@@ -131,21 +198,30 @@ def main():
     if skipped > 10:
         print(f"... 還有 {skipped - 10} 行被跳過", file=sys.stderr)
     
+    # 合併重複的單字
+    try:
+        words, collisions = vocab_dedupe.dedupe(words, args.duplicates)
+    except vocab_dedupe.DuplicateWordError as e:
+        print(f"錯誤: {e}", file=sys.stderr)
+        sys.exit(1)
+    vocab_dedupe.print_collisions(collisions)
+    
     # 統計
-    level_counts = {}
-    for w in words:
-        level_counts[w['level']] = level_counts.get(w['level'], 0) + 1
+    level_counts = count_levels(words)
     
     print(f"\n共解析 {len(words)} 個單字")
-    for level in sorted(level_counts.keys()):
-        print(f"第{level}級: {level_counts[level]} 個")
+    print_level_counts(level_counts)
     
     # 保存 JSON
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+    save_words_json(words, output_file, headwords=vocab_variants.source_headwords(lines))
     
     print(f"\n已保存到 {output_file}")
+    if args.sqlite:
+        build_sqlite(words)
+    if args.index:
+        build_indexes(words, output_file, lines)
+    if args.compress:
+        compress_outputs(output_file)
 
 if __name__ == '__main__':
     main()
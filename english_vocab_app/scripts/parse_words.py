@@ -4,9 +4,10 @@
 解析學測英文單字列表並生成 JSON 數據文件
 """
 
-import json
 import re
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
+
+from vocab_core import dedupe_words, make_entry, normalize_headword, save_words_json
 
 def parse_word_line(line: str) -> Tuple[str, str]:
     """
@@ -29,22 +30,8 @@ def parse_word_line(line: str) -> Tuple[str, str]:
     
     return None, None
 
-def extract_base_word(word: str) -> str:
-    """提取單字的基本形式（移除斜線和括號）"""
-    # 處理 a/an 這種情況，取第一個
-    if '/' in word:
-        word = word.split('/')[0]
-    # 移除括號內容，如 agree(ment)
-    word = re.sub(r'\([^)]+\)', '', word)
-    return word.strip().lower()
-
-def generate_cambridge_url(word: str) -> str:
-    """生成劍橋字典連結"""
-    base_word = extract_base_word(word)
-    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{base_word}"
-
-def parse_word_list(text: str) -> List[Dict]:
-    """解析完整的單字列表文本"""
+def parse_word_list(text: str, headwords: Optional[List[str]] = None) -> List[Dict]:
+    """解析完整的單字列表文本；headwords 不為 None 時依序加入原始單字欄位（供詞族找出括號中的寫法）"""
     words = []
     current_level = 0
     lines = text.split('\n')
@@ -76,17 +63,10 @@ def parse_word_list(text: str) -> List[Dict]:
         if current_level > 0:
             word, pos = parse_word_line(line)
             if word:
-                base_word = extract_base_word(word)
-                words.append({
-                    'word': base_word,
-                    'translation': '',  # 待填入
-                    'partOfSpeech': pos,
-                    'exampleEn': '',
-                    'exampleZh': '',
-                    'cambridgeUrl': generate_cambridge_url(word),
-                    'level': current_level,
-                    'audioUrl': ''
-                })
+                base_word, _, slug = normalize_headword(word)
+                if headwords is not None:
+                    headwords.append(word)
+                words.append(make_entry(base_word, '', pos, current_level, slug))  # 翻譯待填入
     
     return words
 
@@ -104,15 +84,15 @@ def main():
         print("未找到 words_input.txt，請創建該文件並放入單字列表")
         return
     
-    words = parse_word_list(text)
+    headwords = []
+    words = dedupe_words(parse_word_list(text, headwords))
     
     print(f"共解析到 {len(words)} 個單字")
     print(f"級別分布: {dict((i, sum(1 for w in words if w['level'] == i)) for i in range(1, 7))}")
     
     # 保存為 JSON
     output_file = '../assets/data/words.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+    save_words_json(words, output_file, headwords=headwords)
     
     print(f"已保存到 {output_file}")
 
@@ -5,101 +5,37 @@
 處理學測6000字.xlsx
 """
 
-import json
+import argparse
+import itertools
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import vocab_cache
+from vocab_core import (
+    CAMBRIDGE_URL_PREFIX, HEADER_WORDS, count_levels, dedupe_words, make_entry,
+    normalize_headword, parse_level, print_level_counts, save_words_json,
+)
+
+# pandas 只有 columns / rows 模式需要；stream 模式只需要 openpyxl
 try:
     import pandas as pd
 except ImportError:
-    print("錯誤: 需要安裝 pandas 和 openpyxl")
-    print("請運行: pip install pandas openpyxl")
-    sys.exit(1)
-
-def extract_base_word(word: str) -> str:
-    """提取單字的基本形式"""
-    if not word:
-        return ""
-    # 去除括號內容
-    word = re.sub(r'\([^)]+\)', '', word)
-    # 如果有斜線，取第一部分
-    if '/' in word:
-        word = word.split('/')[0]
-    return word.strip().lower()
-
-def generate_cambridge_url(word: str) -> str:
-    """生成劍橋字典連結"""
-    base_word = extract_base_word(word)
-    # 只保留字母、數字和連字符
-    url_word = re.sub(r'[^\w\-]', '', base_word)
-    return f"https://dictionary.cambridge.org/dictionary/english-chinese-traditional/{url_word}"
-
-def parse_level(level_str):
-    """解析級別"""
-    if pd.isna(level_str):
-        return 0
-    
-    level_str = str(level_str).strip()
-    
-    # 數字
-    if level_str.isdigit():
-        level = int(level_str)
-        if 1 <= level <= 6:
-            return level
-    
-    # 中文數字
-    if '一' in level_str or '1' in level_str:
-        return 1
-    elif '二' in level_str or '2' in level_str:
-        return 2
-    elif '三' in level_str or '3' in level_str:
-        return 3
-    elif '四' in level_str or '4' in level_str:
-        return 4
-    elif '五' in level_str or '5' in level_str:
-        return 5
-    elif '六' in level_str or '6' in level_str:
-        return 6
-    
-    return 0
+    pd = None
 
-def main():
-    script_dir = Path(__file__).parent
-    # Find Excel file in Downloads
-    downloads_path = Path(r"C:\Users\zheng\Downloads")
-    excel_files = list(downloads_path.glob("*6000*.xlsx")) + list(downloads_path.glob("*學測*.xlsx"))
-    
-    if not excel_files:
-        print(f"錯誤: 在 {downloads_path} 找不到 Excel 文件")
-        print("請確認文件名包含 '6000' 或 '學測'")
-        sys.exit(1)
-    
-    excel_file = excel_files[0]
-    print(f"找到 Excel 文件: {excel_file.name}")
-    output_file = script_dir.parent / "assets" / "data" / "words.json"
-    
-    if not excel_file.exists():
-        print(f"錯誤: 找不到 Excel 文件: {excel_file}")
-        print("請確認文件路徑是否正確")
-        sys.exit(1)
-    
-    print("正在讀取 Excel 文件...")
-    try:
-        # 讀取 Excel，嘗試不同的工作表
-        df = pd.read_excel(excel_file, sheet_name=0)
-        print(f"成功讀取，共 {len(df)} 行")
-        print(f"欄位: {list(df.columns)}")
-        print("\n前 5 行數據:")
-        print(df.head())
-        print()
-    except Exception as e:
-        print(f"讀取 Excel 文件時發生錯誤: {e}")
-        sys.exit(1)
-    
-    # 嘗試識別欄位
+# 用於推測欄位角色的樣本行數
+SAMPLE_ROWS = 50
+
+_POS_RE = re.compile(r'^\(?[a-z]+\.\)?(?:\s*/\s*\(?[a-z]+\.\)?)*$')
+_ENGLISH_RE = re.compile(r"^[A-Za-z][A-Za-z\-'/ (),.]*$")
+_CJK_RE = re.compile(r'[\u4e00-\u9fff]')
+
+def detect_columns(df_columns):
+    """識別級別、單字、詞性、翻譯欄位，回傳 (級別, 單字, 詞性, 翻譯) 欄位名稱"""
     # 可能的欄位名稱: 級別、單字、屬性/詞性、輸出、中文/翻譯
-    columns = [col.strip() for col in df.columns]
+    columns = [col.strip() for col in df_columns]
     
     # 尋找級別欄位
     level_col = None
@@ -141,21 +77,15 @@ def main():
     elif not trans_col and len(columns) >= 4:
         trans_col = columns[3]
     
-    print(f"識別的欄位:")
-    print(f"  級別: {level_col}")
-    print(f"  單字: {word_col}")
-    print(f"  詞性: {pos_col}")
-    print(f"  翻譯: {trans_col}")
-    print()
-    
-    if not word_col:
-        print("錯誤: 無法識別單字欄位")
-        sys.exit(1)
-    
+    return level_col, word_col, pos_col, trans_col
+
+def process_rows(df, level_col, word_col, pos_col, trans_col, headwords=None):
+    """逐行處理 DataFrame，回傳 (單字列表, 跳過行數)
+    headwords 不為 None 時依序加入每個單字的原始單字欄位（與單字列表一一對應）
+    """
     words = []
     skipped = 0
     
-    print("正在處理數據...")
     for idx, row in df.iterrows():
         try:
             # 獲取級別
@@ -174,7 +104,7 @@ def main():
                 word = str(row[word_col]).strip() if pd.notna(row[word_col]) else ""
             
             # 跳過空行或標題行
-            if not word or word.lower() in ['單字', 'word', '級別', 'level']:
+            if not word or word.lower() in HEADER_WORDS:
                 continue
             
             # 如果單字包含級別信息，提取單字部分
@@ -210,7 +140,7 @@ def main():
             #     continue
             
             # 提取基本單字
-            base_word = extract_base_word(word)
+            base_word, _, slug = normalize_headword(word)
             if not base_word or len(base_word) < 1:
                 skipped += 1
                 continue
@@ -219,21 +149,9 @@ def main():
             if level == 0:
                 level = 1
             
-            # 生成 Cambridge URL
-            cambridge_url = generate_cambridge_url(base_word)
-            
-            word_obj = {
-                'word': base_word,
-                'translation': translation,
-                'partOfSpeech': pos,
-                'exampleEn': '',
-                'exampleZh': '',
-                'cambridgeUrl': cambridge_url,
-                'level': level,
-                'audioUrl': ''
-            }
-            
-            words.append(word_obj)
+            words.append(make_entry(base_word, translation, pos, level, slug))
+            if headwords is not None:
+                headwords.append(word)
             
         except Exception as e:
             skipped += 1
@@ -241,21 +159,501 @@ def main():
                 print(f"  跳過第 {idx+1} 行: {e}")
             continue
     
+    return words, skipped
+
+def _text_column(df, col):
+    """整欄轉為去除前後空白的字串，缺值為空字串（等同逐行的 str(x).strip()）"""
+    if not col:
+        return pd.Series('', index=df.index, dtype=object)
+    values = df[col]
+    return values.map(str).str.strip().where(values.notna(), '')
+
+
+def _level_column(text):
+    """以查表方式整欄解析級別（每個不同的值只呼叫一次 parse_level）"""
+    table = {value: parse_level(value) for value in text.unique()}
+    return text.map(table).astype('int64')
+
+
+def process_columns(df, level_col, word_col, pos_col, trans_col, headwords=None):
+    """以整欄運算處理 DataFrame，結果與 process_rows 完全相同，回傳 (單字列表, 跳過行數)"""
+    selected = [c for c in (level_col, word_col, pos_col, trans_col) if c]
+    if not df.columns.is_unique or any(c not in df.columns for c in selected):
+        # 欄位名稱重複或含前後空白時逐行處理才能保留原本的錯誤處理
+        return process_rows(df, level_col, word_col, pos_col, trans_col, headwords)
+    
+    word = _text_column(df, word_col)
+    
+    # 級別：先看級別欄位，為 0 時再從單字欄位推測
+    if level_col:
+        level = _level_column(_text_column(df, level_col))
+    else:
+        level = pd.Series(0, index=df.index, dtype='int64')
+    level = level.where(level != 0, _level_column(word))
+    
+    # 跳過空行、標題行及 "第X級" 標題
+    keep = (word != '') & ~word.str.lower().isin(HEADER_WORDS)
+    has_level_text = word.str.contains('級', regex=False) & (word.str.len() > 5)
+    keep &= ~(has_level_text & word.str.contains('第', regex=False))
+    word, level = word[keep], level[keep]
+    
+    # 單字欄位含級別信息時，去掉第一段
+    has_level_text = has_level_text[keep]
+    if has_level_text.any():
+        parts = word[has_level_text].str.split()
+        multi = parts.str.len() > 1
+        word = word.copy()
+        word.loc[multi[multi].index] = parts[multi].str[1:].str.join(' ')
+    
+    pos = _text_column(df, pos_col)[keep]
+    
+    # 詞性在單字欄位中（如 "a/an art."）時分離
+    split_mask = (pos == '') & word.str.contains(' ', regex=False)
+    if split_mask.any():
+        parts = word[split_mask].str.rsplit(' ', n=1)
+        valid = (parts.str.len() == 2) & (parts.str[1].str.len() < 10)
+        idx = valid[valid].index
+        word = word.copy()
+        pos = pos.copy()
+        word.loc[idx] = parts[valid].str[0]
+        pos.loc[idx] = parts[valid].str[1]
+    
+    translation = _text_column(df, trans_col)[keep]
+    
+    # 提取基本單字
+    base_word = (
+        word.str.replace(r'\([^)]+\)', '', regex=True)
+        .str.split('/', n=1, regex=False).str[0]
+        .str.strip()
+        .str.lower()
+    )
+    valid = base_word != ''
+    skipped = int((~valid).sum())
+    
+    level = level[valid].where(level[valid] != 0, 1)
+    base_word = base_word[valid]
+    url = CAMBRIDGE_URL_PREFIX + base_word.str.replace(r'[^\w\-]', '', regex=True)
+    
+    words = [
+        {
+            'word': w,
+            'translation': t,
+            'partOfSpeech': p,
+            'exampleEn': '',
+            'exampleZh': '',
+            'cambridgeUrl': u,
+            'level': lv,
+            'audioUrl': '',
+        }
+        for w, t, p, u, lv in zip(
+            base_word.tolist(),
+            translation[valid].tolist(),
+            pos[valid].tolist(),
+            url.tolist(),
+            level.tolist(),
+        )
+    ]
+    if headwords is not None:
+        headwords.extend(word[valid].tolist())
+    return words, skipped
+
+def iter_sheet_rows(excel_file, sheet_index=0):
+    """以唯讀模式逐行讀取工作表，每行為儲存格值的 tuple"""
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[sheet_index]
+        for row in sheet.iter_rows(values_only=True):
+            yield row
+    finally:
+        workbook.close()
+
+
+def _cell(row, index):
+    if index is None or index >= len(row):
+        return None
+    return row[index]
+
+
+def _cell_text(value):
+    """儲存格內容轉為去除前後空白的字串，空儲存格為空字串"""
+    return '' if value is None else str(value).strip()
+
+
+def _is_level_cell(value):
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return value in (1, 2, 3, 4, 5, 6)
+    text = _cell_text(value)
+    return 0 < len(text) <= 4 and parse_level(text) != 0
+
+
+def _is_pos_cell(value):
+    return isinstance(value, str) and _POS_RE.match(value.strip()) is not None
+
+
+def _is_word_cell(value):
+    return (isinstance(value, str) and _ENGLISH_RE.match(value.strip()) is not None
+            and not _is_pos_cell(value))
+
+
+def _is_translation_cell(value):
+    return isinstance(value, str) and _CJK_RE.search(value) is not None
+
+
+def infer_column_roles(sample):
+    """依樣本儲存格內容推測欄位角色，回傳 (級別, 單字, 詞性, 翻譯) 的欄位索引
+    例如 1-6 的數值為級別，n./adj. 這類內容為詞性，含中文者為翻譯
+    """
+    width = max((len(row) for row in sample), default=0)
+    
+    def scores(test):
+        result = []
+        for index in range(width):
+            values = [v for v in (_cell(row, index) for row in sample) if v not in (None, '')]
+            result.append(sum(1 for v in values if test(v)) / len(values) if values else 0.0)
+        return result
+    
+    taken = set()
+    
+    def pick(test, threshold=0.5):
+        # 同分時取最左邊的欄位（單字欄位在 "a/an (art.)" 輸出欄位之前）
+        best = None
+        for index, score in enumerate(scores(test)):
+            if index in taken or score < threshold:
+                continue
+            if best is None or score > best[1]:
+                best = (index, score)
+        if best is None:
+            return None
+        taken.add(best[0])
+        return best[0]
+    
+    level_idx = pick(_is_level_cell, threshold=0.8)
+    pos_idx = pick(_is_pos_cell)
+    trans_idx = pick(_is_translation_cell)
+    word_idx = pick(_is_word_cell)
+    return level_idx, word_idx, pos_idx, trans_idx
+
+
+def _is_header_row(row, roles):
+    """第一行不符合推測的欄位內容時視為標題行"""
+    level_idx, word_idx, _, _ = roles
+    if level_idx is not None:
+        return not _is_level_cell(_cell(row, level_idx))
+    return not _is_word_cell(_cell(row, word_idx))
+
+
+def stream_entries(rows, roles, stats, headwords=None):
+    """逐行將工作表資料轉為單字資料（規則與 process_rows 相同）
+    stats 會累計 'rows' 與 'skipped'；headwords 見 process_rows
+    """
+    level_idx, word_idx, pos_idx, trans_idx = roles
+    for row in rows:
+        stats['rows'] += 1
+        
+        level = parse_level(_cell(row, level_idx)) if level_idx is not None else 0
+        word = _cell_text(_cell(row, word_idx))
+        if level == 0:
+            level = parse_level(word)
+        
+        # 跳過空行或標題行
+        if not word or word.lower() in HEADER_WORDS:
+            continue
+        
+        # 如果單字包含級別信息，提取單字部分
+        if '級' in word and len(word) > 5:
+            if '第' in word:
+                continue
+            parts = word.split()
+            if len(parts) > 1:
+                word = ' '.join(parts[1:])
+        
+        pos = _cell_text(_cell(row, pos_idx))
+        
+        # 如果詞性在單字欄位中（如 "a/an art."），需要分離
+        if not pos and ' ' in word:
+            parts = word.rsplit(' ', 1)
+            if len(parts) == 2 and len(parts[1]) < 10:
+                word, pos = parts
+        
+        translation = _cell_text(_cell(row, trans_idx))
+        
+        base_word, _, slug = normalize_headword(word)
+        if not base_word:
+            stats['skipped'] += 1
+            continue
+        
+        if headwords is not None:
+            headwords.append(word)
+        yield make_entry(base_word, translation, pos, level or 1, slug)
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def load_streaming(excel_file, sheet_index=0, verbose=True, headwords=None):
+    """以唯讀串流讀取一個工作表，回傳 (單字列表, 跳過行數, 讀取行數)；headwords 見 process_rows"""
+    log = print if verbose else _quiet
+    rows = iter_sheet_rows(excel_file, sheet_index)
+    try:
+        first = next(rows)
+    except StopIteration:
+        return [], 0, 0
+    sample = list(itertools.islice(rows, SAMPLE_ROWS))
+    
+    roles = infer_column_roles(sample)
+    has_header = _is_header_row(first, roles)
+    header = first if has_header else tuple(f"第{i + 1}欄" for i in range(len(first)))
+    
+    def role_name(index):
+        return None if index is None else _cell(header, index)
+    
+    level_idx, word_idx, pos_idx, trans_idx = roles
+    log(f"欄位: {list(header)}")
+    log("\n前 5 行數據:")
+    for row in sample[:5]:
+        log(f"  {row}")
+    log()
+    log(f"依內容推測的欄位:")
+    log(f"  級別: {role_name(level_idx)}")
+    log(f"  單字: {role_name(word_idx)}")
+    log(f"  詞性: {role_name(pos_idx)}")
+    log(f"  翻譯: {role_name(trans_idx)}")
+    log()
+    
+    if word_idx is None:
+        raise ValueError("無法識別單字欄位")
+    
+    log("正在處理數據...")
+    stats = {'rows': 0, 'skipped': 0}
+    data_rows = itertools.chain(() if has_header else (first,), sample, rows)
+    words = list(stream_entries(data_rows, roles, stats, headwords))
+    return words, stats['skipped'], stats['rows']
+
+
+def load_with_pandas(excel_file, mode, sheet_index=0, verbose=True, headwords=None):
+    """以 pandas 讀取一個工作表，回傳 (單字列表, 跳過行數, 讀取行數)；headwords 見 process_rows"""
+    log = print if verbose else _quiet
+    df = pd.read_excel(excel_file, sheet_name=sheet_index)
+    log(f"成功讀取，共 {len(df)} 行")
+    log(f"欄位: {list(df.columns)}")
+    log("\n前 5 行數據:")
+    log(df.head())
+    log()
+    
+    level_col, word_col, pos_col, trans_col = detect_columns(df.columns)
+    
+    log(f"識別的欄位:")
+    log(f"  級別: {level_col}")
+    log(f"  單字: {word_col}")
+    log(f"  詞性: {pos_col}")
+    log(f"  翻譯: {trans_col}")
+    log()
+    
+    if not word_col:
+        raise ValueError("無法識別單字欄位")
+    
+    log("正在處理數據...")
+    if mode == 'rows':
+        words, skipped = process_rows(df, level_col, word_col, pos_col, trans_col, headwords)
+    else:
+        words, skipped = process_columns(df, level_col, word_col, pos_col, trans_col, headwords)
+    return words, skipped, len(df)
+
+
+def list_sheets(excel_file):
+    """列出工作簿中所有工作表名稱"""
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(excel_file, read_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def load_sheet(job):
+    """工作池執行的單一工作：讀取一個工作表
+    job 為 (文件, 工作表索引, 工作表名稱, 模式, 是否輸出詳細資訊)
+    回傳 dict，失敗時 'error' 為錯誤訊息
+    """
+    excel_file, sheet_index, sheet_name, mode, verbose = job
+    result = {
+        'file': Path(excel_file).name,
+        'sheet': sheet_name,
+        'words': [],
+        'headwords': [],
+        'skipped': 0,
+        'rows': 0,
+        'seconds': 0.0,
+        'error': None,
+    }
+    start = time.perf_counter()
+    try:
+        if mode == 'stream':
+            words, skipped, rows = load_streaming(excel_file, sheet_index, verbose, result['headwords'])
+        else:
+            words, skipped, rows = load_with_pandas(excel_file, mode, sheet_index, verbose, result['headwords'])
+        result.update(words=words, skipped=skipped, rows=rows)
+    except Exception as e:
+        result['error'] = str(e)
+        # 讀取到一半失敗時單字不會保留，原始單字欄位也一併清除
+        result['headwords'].clear()
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+def load_workbooks(excel_files, mode, workers=None, use_cache=True):
+    """以工作池並行讀取所有文件的所有工作表
+    內容未變更的文件直接從快取載入，不重新解析
+    回傳 (每個工作表的結果, 每個文件的快取狀態)，順序固定為 文件順序 -> 工作表順序
+    """
+    lookups = {}
+    cache_status = []
+    jobs = []
+    for excel_file in excel_files:
+        if use_cache:
+            lookup = vocab_cache.load(excel_file, mode, parsers=[__file__])
+            lookups[excel_file] = lookup
+            if lookup['sheets'] is not None:
+                continue
+        for sheet_index, sheet_name in enumerate(list_sheets(excel_file)):
+            jobs.append((str(excel_file), sheet_index, sheet_name, mode, False))
+    
+    if len(jobs) == 1:
+        # 只有一個工作表時不必啟動工作池，並輸出欄位識別資訊
+        parsed = [load_sheet(jobs[0][:-1] + (True,))]
+    elif jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map 依提交順序回傳結果，合併順序與完成先後無關
+            parsed = list(executor.map(load_sheet, jobs))
+    else:
+        parsed = []
+    
+    results = []
+    for excel_file in excel_files:
+        lookup = lookups.get(excel_file)
+        if lookup is not None and lookup['sheets'] is not None:
+            for sheet in lookup['sheets']:
+                results.append(dict(sheet, seconds=0.0, error=None))
+            cache_status.append((excel_file, vocab_cache.describe(lookup, hit=True)))
+            continue
+        
+        sheets = [r for r, job in zip(parsed, jobs) if job[0] == str(excel_file)]
+        results.extend(sheets)
+        if lookup is not None:
+            if any(r['error'] for r in sheets):
+                cache_status.append((excel_file, "快取未寫入（有工作表讀取失敗）"))
+            else:
+                vocab_cache.store(lookup, sheets)
+                cache_status.append((excel_file, vocab_cache.describe(lookup, hit=False)))
+    return results, cache_status
+
+
+def print_sheet_summary(results):
+    """列印每個工作表的行數與耗時"""
+    print("\n工作表統計:")
+    print(f"  {'文件':<24} {'工作表':<12} {'行數':>8} {'單字':>8} {'跳過':>6} {'秒':>8}")
+    for r in results:
+        if r['error']:
+            print(f"  {r['file']:<24} {r['sheet']:<12} 略過: {r['error']}")
+            continue
+        print(f"  {r['file']:<24} {r['sheet']:<12} {r['rows']:>8} {len(r['words']):>8} "
+              f"{r['skipped']:>6} {r['seconds']:>8.2f}")
+
+
+def find_excel_files(downloads_path):
+    """尋找檔名包含 6000 或 學測 的 Excel 文件（去除重複並排序）"""
+    matched = set(downloads_path.glob("*6000*.xlsx")) | set(downloads_path.glob("*學測*.xlsx"))
+    # 略過 Excel 開啟中產生的暫存檔
+    return sorted(f for f in matched if not f.name.startswith('~$'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='從 Excel 文件生成 words.json')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='要處理的 Excel 文件（預設在下載資料夾中尋找）')
+    parser.add_argument('--mode', choices=['columns', 'rows', 'stream'],
+                        default='columns' if pd is not None else 'stream',
+                        help='columns: 整欄運算（預設）；rows: 逐行處理；'
+                             'stream: 唯讀串流，依內容推測欄位（未安裝 pandas 時的預設）')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='並行處理工作表的進程數（預設為 CPU 核心數）')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='不使用已解析的快取，強制重新解析')
+    args = parser.parse_args()
+    
+    if args.mode != 'stream' and pd is None:
+        print("錯誤: 需要安裝 pandas 和 openpyxl")
+        print("請運行: pip install pandas openpyxl")
+        print("或使用 --mode stream（只需要 openpyxl）")
+        sys.exit(1)
+    
+    script_dir = Path(__file__).parent
+    output_file = script_dir.parent / "assets" / "data" / "words.json"
+    
+    if args.files:
+        excel_files = args.files
+        missing = [f for f in excel_files if not f.exists()]
+        if missing:
+            for f in missing:
+                print(f"錯誤: 找不到 Excel 文件: {f}")
+            print("請確認文件路徑是否正確")
+            sys.exit(1)
+    else:
+        # Find Excel file in Downloads
+        downloads_path = Path(r"C:\Users\zheng\Downloads")
+        excel_files = find_excel_files(downloads_path)
+        if not excel_files:
+            print(f"錯誤: 在 {downloads_path} 找不到 Excel 文件")
+            print("請確認文件名包含 '6000' 或 '學測'")
+            sys.exit(1)
+    
+    for excel_file in excel_files:
+        print(f"找到 Excel 文件: {excel_file.name}")
+    
+    print("正在讀取 Excel 文件...")
+    start = time.perf_counter()
+    try:
+        results, cache_status = load_workbooks(excel_files, args.mode, args.workers,
+                                               use_cache=not args.no_cache)
+    except ImportError:
+        print("錯誤: 需要安裝 openpyxl")
+        print("請運行: pip install openpyxl")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+    
+    words = []
+    headwords = []
+    skipped = 0
+    for r in results:
+        words.extend(r['words'])
+        headwords.extend(r['headwords'])
+        skipped += r['skipped']
+    
+    print_sheet_summary(results)
+    print(f"  共 {len(results)} 個工作表，總耗時 {elapsed:.2f} 秒")
+    for excel_file, status in cache_status:
+        print(f"  {excel_file.name}: {status}")
+    
+    if not words:
+        print("\n錯誤: 沒有解析到任何單字")
+        sys.exit(1)
+    
     # 統計
-    level_counts = {}
-    for w in words:
-        level = w['level']
-        level_counts[level] = level_counts.get(level, 0) + 1
+    words = dedupe_words(words)
+    level_counts = count_levels(words)
     
     print(f"\n共解析 {len(words)} 個單字")
     print(f"跳過 {skipped} 行")
-    for level in sorted(level_counts.keys()):
-        print(f"第{level}級: {level_counts[level]} 個")
+    print_level_counts(level_counts)
     
     # 保存 JSON
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+    save_words_json(words, output_file, headwords=headwords)
     
     print(f"\n已保存到: {output_file}")
     file_size = output_file.stat().st_size / 1024
@@ -263,4 +661,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+單字資料的二進位欄式格式（.vocab）
+words.json 每筆都重複 8 個欄位名稱；此格式改為欄式儲存：
+
+  檔頭        magic "VOCB"、版本、筆數、詞性字典大小、各區段位置
+  級別欄      每筆 1 byte
+  詞性欄      每筆 2 bytes，為詞性字典的編號
+  單字位置    筆數 + 1 個 uint32，指向字串表
+  翻譯位置    筆數 + 1 個 uint32，指向字串表
+  詞性字典    詞性數 + 1 個 uint32，指向字串表
+  字串表      UTF-8 字串依序相接
+
+所有整數為 little-endian，各區段對齊 4 bytes。
+cambridgeUrl 由 word 推導，exampleEn / exampleZh / audioUrl 目前一律為空，因此不儲存；
+遇到無法以此格式表示的資料時寫入會失敗，不會默默丟掉內容。
+
+讀取時以 mmap 開啟，只在存取某一筆時才解碼該筆的字串。
+
+用法:
+  python vocab_binary.py [words.json] [輸出.vocab]   由 words.json 產生二進位檔
+  python vocab_binary.py --verify [words.json]      產生後逐筆與 words.json 比對
+"""
+
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+from vocab_core import BUILD_DIR, CAMBRIDGE_URL_PREFIX, cambridge_slug, make_entry
+
+MAGIC = b'VOCB'
+FORMAT_VERSION = 1
+
+# magic, 版本, 保留, 筆數, 詞性數, 級別欄, 詞性欄, 單字位置, 翻譯位置, 詞性字典, 字串表, 字串表大小
+_HEADER = struct.Struct('<4sHHIIIIIIIII')
+
+
+def _align(offset: int) -> int:
+    return (offset + 3) & ~3
+
+
+def _check_entry(entry: Dict) -> None:
+    for key in ('exampleEn', 'exampleZh', 'audioUrl'):
+        if entry.get(key):
+            raise ValueError(f"{entry['word']}: 二進位格式不支援非空的 {key}")
+    if entry['cambridgeUrl'] != CAMBRIDGE_URL_PREFIX + cambridge_slug(entry['word']):
+        raise ValueError(f"{entry['word']}: cambridgeUrl 不是由 word 推導的連結")
+    if not 0 <= entry['level'] <= 255:
+        raise ValueError(f"{entry['word']}: 級別超出範圍")
+
+
+def encode(words: List[Dict]) -> bytes:
+    """將單字列表編碼為二進位格式"""
+    pos_codes: Dict[str, int] = {}
+    strings = bytearray()
+
+    def add_strings(values):
+        offsets = [len(strings)]
+        for value in values:
+            strings.extend(value.encode('utf-8'))
+            offsets.append(len(strings))
+        return offsets
+
+    for w in words:
+        _check_entry(w)
+        pos_codes.setdefault(w['partOfSpeech'], len(pos_codes))
+    if len(pos_codes) > 0xFFFF:
+        raise ValueError("詞性種類超過 65535 個")
+
+    word_offsets = add_strings(w['word'] for w in words)
+    trans_offsets = add_strings(w['translation'] for w in words)
+    pos_offsets = add_strings(pos_codes)
+
+    count = len(words)
+    level_off = _align(_HEADER.size)
+    pos_off = _align(level_off + count)
+    word_idx_off = _align(pos_off + 2 * count)
+    trans_idx_off = word_idx_off + 4 * (count + 1)
+    pos_dict_off = trans_idx_off + 4 * (count + 1)
+    strings_off = pos_dict_off + 4 * (len(pos_codes) + 1)
+
+    out = bytearray(strings_off + len(strings))
+    _HEADER.pack_into(out, 0, MAGIC, FORMAT_VERSION, 0, count, len(pos_codes),
+                      level_off, pos_off, word_idx_off, trans_idx_off, pos_dict_off,
+                      strings_off, len(strings))
+    out[level_off:level_off + count] = bytes(w['level'] for w in words)
+    struct.pack_into(f'<{count}H', out, pos_off, *(pos_codes[w['partOfSpeech']] for w in words))
+    struct.pack_into(f'<{count + 1}I', out, word_idx_off, *word_offsets)
+    struct.pack_into(f'<{count + 1}I', out, trans_idx_off, *trans_offsets)
+    struct.pack_into(f'<{len(pos_codes) + 1}I', out, pos_dict_off, *pos_offsets)
+    out[strings_off:] = strings
+    return bytes(out)
+
+
+def write(words: List[Dict], output_file) -> Path:
+    """寫出二進位檔"""
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(encode(words))
+    return output_file
+
+
+class VocabReader:
+    """以 mmap 讀取 .vocab 檔，逐筆延遲解碼
+
+    with VocabReader(path) as vocab:
+        vocab[0]['word'], len(vocab), vocab.level(10)
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise RuntimeError("VocabReader 目前只支援 little-endian 平台")
+        self._file = open(path, 'rb')
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._mm)
+        (magic, version, _, count, pos_count, level_off, pos_off, word_idx_off,
+         trans_idx_off, pos_dict_off, strings_off, strings_len) = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是 .vocab 檔")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+
+        self._count = count
+        self._levels = view[level_off:level_off + count]
+        self._pos = view[pos_off:pos_off + 2 * count].cast('H')
+        self._word_idx = view[word_idx_off:word_idx_off + 4 * (count + 1)].cast('I')
+        self._trans_idx = view[trans_idx_off:trans_idx_off + 4 * (count + 1)].cast('I')
+        pos_idx = view[pos_dict_off:pos_dict_off + 4 * (pos_count + 1)].cast('I')
+        self._strings = view[strings_off:strings_off + strings_len]
+        # 詞性字典很小，開檔時解碼一次
+        self.pos_values = [str(self._strings[pos_idx[i]:pos_idx[i + 1]], 'utf-8')
+                           for i in range(pos_count)]
+        pos_idx.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _string(self, index, i) -> str:
+        return str(self._strings[index[i]:index[i + 1]], 'utf-8')
+
+    def word(self, i: int) -> str:
+        return self._string(self._word_idx, i)
+
+    def translation(self, i: int) -> str:
+        return self._string(self._trans_idx, i)
+
+    def level(self, i: int) -> int:
+        return self._levels[i]
+
+    def part_of_speech(self, i: int) -> str:
+        return self.pos_values[self._pos[i]]
+
+    def pos_code(self, i: int) -> int:
+        return self._pos[i]
+
+    def __getitem__(self, i: int) -> Dict:
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return make_entry(self.word(i), self.translation(i), self.part_of_speech(i), self.level(i))
+
+    def __iter__(self) -> Iterator[Dict]:
+        for i in range(self._count):
+            yield self[i]
+
+    def close(self) -> None:
+        for view in (self._levels, self._pos, self._word_idx, self._trans_idx, self._strings):
+            view.release()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def verify_roundtrip(words: List[Dict], path) -> List[str]:
+    """逐筆比對二進位檔與原始資料，回傳不一致的說明（空列表表示一致）"""
+    problems = []
+    with VocabReader(path) as vocab:
+        if len(vocab) != len(words):
+            problems.append(f"筆數不同: {len(vocab)} != {len(words)}")
+        for i, (expected, actual) in enumerate(zip(words, vocab)):
+            if expected != actual:
+                problems.append(f"第 {i} 筆不同: {expected['word']!r} -> {actual['word']!r}")
+    return problems
+
+
+def main():
+    args = sys.argv[1:]
+    verify = '--verify' in args
+    args = [a for a in args if a != '--verify']
+
+    script_dir = Path(__file__).parent
+    words_file = Path(args[0]) if args else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(args[1]) if len(args) > 1 else BUILD_DIR / 'words.vocab'
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+
+    try:
+        write(words, output_file)
+    except ValueError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+
+    json_size = words_file.stat().st_size
+    bin_size = output_file.stat().st_size
+    print(f"共 {len(words)} 個單字")
+    print(f"已保存到 {output_file}")
+    print(f"文件大小: {bin_size / 1024:.2f} KB（words.json {json_size / 1024:.2f} KB，"
+          f"{bin_size / json_size:.1%}）")
+
+    if verify:
+        problems = verify_roundtrip(words, output_file)
+        if problems:
+            print(f"\n比對失敗，共 {len(problems)} 處不同:")
+            for problem in problems[:10]:
+                print(f"  {problem}")
+            sys.exit(1)
+        print("\n比對成功: 二進位檔與 words.json 逐筆相同")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+已解析來源文件的快取
+以來源文件內容的 SHA-256 與解析程式（vocab_core、本模組與呼叫端腳本）原始碼的雜湊為鍵，
+保存正規化後的單字欄位（欄式儲存）。來源與解析規則都未變更時直接載入，不必重新解析 Excel / CSV。
+
+有安裝 pyarrow 時使用 Parquet，否則使用欄式 JSON（只用標準函式庫）。
+cambridgeUrl 與空白欄位可由 word 重建，因此不儲存；
+另存原始單字欄位（headword，供詞族找出括號中的寫法），命中時與單字一起還原。
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+import vocab_core
+from vocab_core import make_entry
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+CACHE_DIR = Path(__file__).parent / '.cache'
+
+_COLUMNS = ('sheet', 'word', 'translation', 'partOfSpeech', 'level', 'headword')
+
+
+def file_digest(path, chunk_size=1 << 20) -> str:
+    """計算文件內容的 SHA-256"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def rules_digest(parsers: Iterable = ()) -> str:
+    """解析規則與快取格式的雜湊：vocab_core、本模組與 parsers（呼叫端腳本的路徑）的原始碼
+    任何一個改變時舊快取自動失效，不必手動遞增版本號
+    """
+    digest = hashlib.sha256()
+    for path in (vocab_core.__file__, __file__, *parsers):
+        digest.update(file_digest(path).encode('ascii'))
+    return digest.hexdigest()
+
+
+def _cache_path(digest: str, variant: str, rules: str, cache_dir: Path) -> Path:
+    suffix = '.parquet' if pa is not None else '.json'
+    return cache_dir / f"{digest[:32]}-{variant}-{rules[:12]}{suffix}"
+
+
+def _to_columns(sheets: List[Dict]) -> Dict[str, list]:
+    columns = {name: [] for name in _COLUMNS}
+    for sheet_index, sheet in enumerate(sheets):
+        for w, headword in zip(sheet['words'], sheet['headwords']):
+            columns['sheet'].append(sheet_index)
+            columns['word'].append(w['word'])
+            columns['translation'].append(w['translation'])
+            columns['partOfSpeech'].append(w['partOfSpeech'])
+            columns['level'].append(w['level'])
+            columns['headword'].append(headword)
+    return columns
+
+
+def _from_columns(columns: Dict[str, list], sheet_meta: List[Dict]) -> List[Dict]:
+    sheets = [dict(meta, words=[], headwords=[]) for meta in sheet_meta]
+    for sheet_index, word, translation, pos, level, headword in zip(*(columns[name] for name in _COLUMNS)):
+        sheets[sheet_index]['words'].append(make_entry(word, translation, pos, level))
+        sheets[sheet_index]['headwords'].append(headword)
+    return sheets
+
+
+def load(source, variant: str, cache_dir: Path = CACHE_DIR, parsers: Iterable = ()) -> Dict:
+    """查詢快取，回傳 {'digest', 'rules', 'path', 'sheets'}
+    parsers 為解析來源的腳本路徑（通常傳入呼叫端的 __file__），其原始碼也納入快取鍵；
+    命中時 sheets 為 [{'sheet', 'rows', 'skipped', 'words', 'headwords'}, ...]，未命中時為 None；
+    未命中時可將同一個 dict 傳給 store() 寫入
+    """
+    digest = file_digest(source)
+    rules = rules_digest(parsers)
+    path = _cache_path(digest, variant, rules, cache_dir)
+    result = {'digest': digest, 'rules': rules, 'path': path, 'sheets': None}
+    if not path.exists():
+        return result
+    try:
+        if pa is not None:
+            # ParquetFile 不會載入 dataset 模組，首次讀取比 read_table 快得多
+            table = pq.ParquetFile(path).read()
+            meta = json.loads(table.schema.metadata[b'vocab_cache'])
+            columns = {name: table.column(name).to_pylist() for name in _COLUMNS}
+        else:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            meta = data['meta']
+            columns = data['columns']
+        result['sheets'] = _from_columns(columns, meta['sheets'])
+    except Exception:
+        # 快取損壞時視為未命中，重新解析後會覆寫
+        result['sheets'] = None
+    return result
+
+
+def store(lookup: Dict, sheets: List[Dict]) -> Path:
+    """將解析結果寫入 load() 回傳的快取位置（先寫暫存檔再改名）
+    每個工作表的 'headwords' 為與 'words' 一一對應的原始單字欄位
+    """
+    path = lookup['path']
+    path.parent.mkdir(parents=True, exist_ok=True)
+    meta = {
+        'digest': lookup['digest'],
+        'rules': lookup['rules'],
+        'sheets': [{k: v for k, v in sheet.items() if k not in ('words', 'headwords', 'seconds', 'error')}
+                   for sheet in sheets],
+    }
+    columns = _to_columns(sheets)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if pa is not None:
+        table = pa.table(columns).replace_schema_metadata(
+            {'vocab_cache': json.dumps(meta, ensure_ascii=False)})
+        pq.write_table(table, tmp_path)
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'meta': meta, 'columns': columns}, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    # 同一來源以舊解析規則寫出的快取已不會再命中
+    for stale in path.parent.glob(path.name.rsplit('-', 1)[0] + '-*'):
+        if stale != path and not stale.name.endswith('.tmp'):
+            stale.unlink()
+    return path
+
+
+def describe(lookup: Dict, hit: bool) -> str:
+    """快取狀態的摘要文字"""
+    fmt = 'Parquet' if pa is not None else 'JSON'
+    state = '命中' if hit else '未命中，已重新解析'
+    return f"快取{state} ({fmt}, {lookup['digest'][:12]})"
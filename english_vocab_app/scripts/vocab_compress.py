@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+輸出文件的壓縮版本
+將 JSON 輸出（assets/data/ 下的 words.json、級別分片等，或指定的文件）分別壓縮成
+gzip / bz2 / xz，可指定各自的壓縮等級，並列出壓縮後大小、壓縮時間與解壓時間，
+方便選擇網頁版要提供的版本。
+
+各版本以多執行緒並行壓縮與寫出（zlib / bz2 / lzma 壓縮時會釋放 GIL），建置不會因版本變多而依序變慢。
+壓縮與解壓時間在各執行緒內量測，與其他版本同時執行，可能比單獨執行時偏高；
+需要不受干擾的時間時可用 --workers 1。
+輸出到 build/vocab/compressed/，檔名為 <原檔名>.<等級>.<副檔名>，不會打包進應用程式。
+
+用法:
+  python vocab_compress.py                       壓縮 assets/data/ 下所有 words*.json
+  python vocab_compress.py words.json --codecs gzip,xz --gzip 1,9 --xz 6
+"""
+
+import argparse
+import bz2
+import gzip
+import lzma
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from vocab_core import BUILD_DIR
+
+COMPRESSED_DIR = BUILD_DIR / 'compressed'
+
+# 名稱 -> (副檔名, 壓縮, 解壓, 可用等級)
+CODECS = {
+    'gzip': ('gz', lambda data, level: gzip.compress(data, compresslevel=level, mtime=0),
+             gzip.decompress, range(1, 10)),
+    'bz2': ('bz2', lambda data, level: bz2.compress(data, compresslevel=level),
+            bz2.decompress, range(1, 10)),
+    'xz': ('xz', lambda data, level: lzma.compress(data, preset=level),
+           lzma.decompress, range(0, 10)),
+}
+
+DEFAULT_LEVELS = {'gzip': [6, 9], 'bz2': [9], 'xz': [6]}
+
+
+def variant_name(source: Path, codec: str, level: int) -> str:
+    return f"{source.name}.{level}.{CODECS[codec][0]}"
+
+
+def compress_variant(source: Path, data: bytes, codec: str, level: int) -> Dict:
+    """壓縮一個版本並確認可還原，回傳壓縮結果（'packed'）、大小與時間（在執行緒內量測）"""
+    _, compress, decompress, _ = CODECS[codec]
+    start = time.perf_counter()
+    packed = compress(data, level)
+    compress_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unpacked = decompress(packed)
+    decompress_seconds = time.perf_counter() - start
+    if unpacked != data:
+        raise RuntimeError(f"{source.name} 的 {codec} 版本解壓後內容不同")
+    return {
+        'file': source.name,
+        'codec': codec,
+        'level': level,
+        'path': None,
+        'packed': packed,
+        'bytes': len(packed),
+        'original': len(data),
+        'compress_seconds': compress_seconds,
+        'decompress_seconds': decompress_seconds,
+    }
+
+
+def _write_variant(result: Dict, output_dir: Path) -> None:
+    path = output_dir / variant_name(Path(result['file']), result['codec'], result['level'])
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(result.pop('packed'))
+    os.replace(tmp_path, path)
+    result['path'] = path
+
+
+def compress_files(files: Sequence[Path], levels: Dict[str, List[int]],
+                   output_dir: Path = COMPRESSED_DIR, workers: int = None) -> List[Dict]:
+    """產生所有文件的所有壓縮版本，依 (文件, 格式, 等級) 順序回傳結果
+    各版本在 workers 個執行緒中並行壓縮、驗證與寫出；workers=1 時依序執行，時間不受其他版本影響
+    """
+    for codec, codec_levels in levels.items():
+        allowed = CODECS[codec][3]
+        for level in codec_levels:
+            if level not in allowed:
+                raise ValueError(f"{codec} 的壓縮等級必須在 {allowed.start}-{allowed.stop - 1} 之間: {level}")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    contents = {Path(f): Path(f).read_bytes() for f in files}
+    jobs = [
+        (source, data, codec, level)
+        for source, data in contents.items()
+        for codec in CODECS if codec in levels
+        for level in levels[codec]
+    ]
+
+    def run(job):
+        result = compress_variant(*job)
+        _write_variant(result, output_dir)
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        # map 依提交順序回傳結果，順序與完成先後無關
+        return list(executor.map(run, jobs))
+
+
+def print_compress_table(results: List[Dict], parallel: bool = True) -> None:
+    """列印壓縮結果表；parallel 時註明時間為並行執行時量測"""
+    print(f"{'文件':<24} {'格式':<10} {'大小':>12} {'比例':>7} {'壓縮':>11} {'解壓':>11}")
+    for r in results:
+        label = f"{r['codec']} -{r['level']}"
+        # 空文件壓縮後仍有檔頭，比例沒有意義
+        ratio = f"{r['bytes'] / r['original']:7.1%}" if r['original'] else f"{'-':>7}"
+        print(f"{r['file']:<24} {label:<10} {r['bytes'] / 1024:9.1f} KB {ratio}"
+              f" {r['compress_seconds'] * 1000:8.1f} ms {r['decompress_seconds'] * 1000:8.1f} ms")
+    if parallel and len(results) > 1:
+        print("（壓縮 / 解壓時間為各版本並行執行時量測，可能偏高；--workers 1 可取得單獨執行的時間）")
+
+
+def parse_levels(text: str) -> List[int]:
+    return [int(part) for part in text.split(',') if part.strip()]
+
+
+def main():
+    script_dir = Path(__file__).parent
+    data_dir = script_dir.parent / 'assets' / 'data'
+
+    parser = argparse.ArgumentParser(description='產生輸出文件的 gzip / bz2 / xz 版本並比較')
+    parser.add_argument('files', nargs='*', type=Path,
+                        help='要壓縮的文件（預設為 assets/data/ 下所有 words*.json）')
+    parser.add_argument('--codecs', default=','.join(CODECS),
+                        help=f"要產生的格式，以逗號分隔（預設 {','.join(CODECS)}）")
+    for codec in CODECS:
+        parser.add_argument(f'--{codec}', type=parse_levels, metavar='等級',
+                            help=f"{codec} 壓縮等級，以逗號分隔（預設 {','.join(map(str, DEFAULT_LEVELS[codec]))}）")
+    parser.add_argument('--output-dir', type=Path, default=COMPRESSED_DIR, help='輸出資料夾')
+    parser.add_argument('--workers', type=int, default=None, help='並行壓縮的執行緒數（1 為依序執行，時間較準確）')
+    args = parser.parse_args()
+
+    files = args.files or sorted(data_dir.glob('words*.json'))
+    if not files:
+        print(f"錯誤: {data_dir} 下沒有 words*.json")
+        sys.exit(1)
+
+    codecs = [c.strip() for c in args.codecs.split(',') if c.strip()]
+    unknown = [c for c in codecs if c not in CODECS]
+    if unknown:
+        print(f"錯誤: 未知的格式 {', '.join(unknown)}（可用: {', '.join(CODECS)}）")
+        sys.exit(1)
+    levels = {c: getattr(args, c) or DEFAULT_LEVELS[c] for c in codecs}
+
+    start = time.perf_counter()
+    try:
+        results = compress_files(files, levels, args.output_dir, args.workers)
+    except ValueError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+    elapsed = time.perf_counter() - start
+
+    print_compress_table(results, parallel=args.workers != 1)
+    print(f"\n共 {len(results)} 個版本，耗時 {elapsed * 1000:.1f} ms，已保存到 {args.output_dir}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+拼字相近、容易混淆的單字（例如 affect / effect、adapt / adopt）
+對約 6 千個單字兩兩計算編輯距離（Levenshtein）要比對 3600 萬次，純 Python 太慢。
+
+  1. 候選配對：距離在 k 以內的兩個單字，各刪除最多 k 個字元後一定有相同的字串，
+     以刪除變體為鍵分組，只有同組的單字才需要比較，不做兩兩比對
+  2. 長度差超過上限的配對直接排除
+  3. 以字母直方圖排除：每次編輯最多讓直方圖的 L1 差增加 2，
+     差距超過 2 * k 的配對不可能在距離內
+  4. 剩下的配對依 (長度, 長度) 分組，以 numpy 同時計算整組的編輯距離：
+     逐列更新整批配對的動態規劃，數值上限為 k + 1（只有對角線附近的帶狀區域有意義），
+     某一列已全部超出距離的配對立即移除
+
+每個單字保留距離最近的 top_k 個（依距離、長度差、字母順序排序）。
+短單字容易互相接近（cat / cut / hat ...），長度不到 SHORT_WORD 的單字距離上限為 1。
+沒有安裝 numpy 時改用純 Python 的帶狀動態規劃（結果相同，較慢）。
+
+輸出 build/vocab/words_confusables.json（parse_complete_vocab.py --index 也會產生）:
+  {"version": 1, "maxDistance": 2, "confusables": {"affect": [["effect", 1]], ...}}
+
+用法: python vocab_confusables.py [words.json] [--max-distance 2] [--top-k 5]
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from vocab_core import BUILD_DIR
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+CONFUSABLES_NAME = 'words_confusables.json'
+CONFUSABLES_VERSION = 1
+MAX_DISTANCE = 2
+TOP_K = 5
+# 比這個長度短的單字只找距離 1 的
+SHORT_WORD = 5
+# 少於三個字母的單字不比較
+MIN_LENGTH = 3
+
+_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
+_BINS = len(_ALPHABET) + 1
+
+
+def _histogram(word: str) -> List[int]:
+    counts = [0] * _BINS
+    for c in word:
+        i = _ALPHABET.find(c)
+        counts[i if i >= 0 else len(_ALPHABET)] += 1
+    return counts
+
+
+def _limit(shorter: int, max_distance: int) -> int:
+    """兩個單字允許的距離上限（依較短單字的長度）"""
+    if shorter < SHORT_WORD:
+        return min(1, max_distance)
+    return max_distance
+
+
+def edit_distance(a: str, b: str, limit: int, transpositions: bool = False) -> int:
+    """帶狀編輯距離；超過 limit 時回傳 limit + 1
+    transpositions 為 True 時相鄰兩字母對調也算一次編輯（optimal string alignment，recieve -> receive 為 1）
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    # 相同的開頭與結尾不影響距離
+    start = 0
+    shorter = min(len(a), len(b))
+    while start < shorter and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shorter - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a = a[start:len(a) - end]
+    b = b[start:len(b) - end]
+    if not a or not b:
+        return min(max(len(a), len(b)), limit + 1)
+    cap = limit + 1
+    before = None
+    prev = [min(j, cap) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        cur = [cap] * (len(b) + 1)
+        cur[0] = min(i, cap)
+        ca = a[i - 1]
+        for j in range(lo, hi + 1):
+            cost = prev[j - 1] + (ca != b[j - 1])
+            if transpositions and i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == b[j - 1]:
+                cost = min(cost, before[j - 2] + 1)
+            cur[j] = min(cost, prev[j] + 1, cur[j - 1] + 1, cap)
+        # D[i][j - 1] <= D[i - 1][j - 2] + 1，整列都超過 limit 時之後的對調也無法回到 limit 以內
+        if min(cur[max(0, lo - 1):hi + 1]) > limit:
+            return cap
+        before, prev = prev, cur
+    return prev[len(b)]
+
+
+def deletions(word: str, k: int) -> Set[str]:
+    """刪除最多 k 個字元後的所有字串（含原字串）"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(k):
+        frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))}
+        variants |= frontier
+    return variants
+
+
+def _blocks(words: List[str], max_distance: int) -> Dict[str, List[int]]:
+    """刪除變體 -> 單字位置（遞增）"""
+    blocks: Dict[str, List[int]] = {}
+    for i, word in enumerate(words):
+        if len(word) >= MIN_LENGTH:
+            for variant in deletions(word, _limit(len(word), max_distance)):
+                blocks.setdefault(variant, []).append(i)
+    return blocks
+
+
+def _code_matrix(words: List[str]):
+    """每個單字一列的字元碼（UTF-32），不足的長度補 0"""
+    width = max((len(w) for w in words), default=0) or 1
+    data = ''.join(w.ljust(width, '\0') for w in words).encode('utf-32-le')
+    return np.frombuffer(data, dtype=np.uint32).reshape(len(words), width).astype(np.int32)
+
+
+def _pairs_numpy(words: List[str], max_distance: int) -> List[Tuple[int, int, int]]:
+    count = len(words)
+    # 依組的大小堆疊成矩陣，以上三角索引一次取出所有配對，再以 i * count + j 去除重複
+    by_size: Dict[int, List[List[int]]] = {}
+    for members in _blocks(words, max_distance).values():
+        if len(members) > 1:
+            by_size.setdefault(len(members), []).append(members)
+    keys = [np.empty(0, dtype=np.int64)]
+    for size, groups in by_size.items():
+        matrix = np.array(groups, dtype=np.int64)
+        first, second = np.triu_indices(size, 1)
+        keys.append((matrix[:, first] * count + matrix[:, second]).ravel())
+    unique = np.unique(np.concatenate(keys))
+    ia, ib = unique // count, unique % count
+
+    # 較短的單字放在前面，排除長度差超過上限的配對
+    lengths = np.array([len(w) for w in words], dtype=np.int64)
+    swap = lengths[ia] > lengths[ib]
+    ia, ib = np.where(swap, ib, ia), np.where(swap, ia, ib)
+    la, lb = lengths[ia], lengths[ib]
+    limits = np.where(la < SHORT_WORD, min(1, max_distance), max_distance)
+    keep = lb - la <= limits
+    # 直方圖下界
+    codes = _code_matrix(words)
+    bins = np.where((codes >= ord('a')) & (codes <= ord('z')), codes - ord('a'), len(_ALPHABET))
+    bins[codes == 0] = _BINS
+    rows = np.repeat(np.arange(count, dtype=np.int64), codes.shape[1])
+    hist = np.bincount(rows * (_BINS + 1) + bins.ravel(), minlength=count * (_BINS + 1))
+    hist = hist.reshape(count, _BINS + 1)[:, :_BINS].astype(np.int16)
+    keep[keep] = np.abs(hist[ia[keep]] - hist[ib[keep]]).sum(axis=1) <= 2 * limits[keep]
+    ia, ib, la, lb = ia[keep], ib[keep], la[keep], lb[keep]
+
+    # 依 (長度, 長度) 分組，整組一起計算編輯距離
+    order = np.lexsort((ib, ia, lb, la))
+    ia, ib, la, lb = ia[order], ib[order], la[order], lb[order]
+    bounds = np.flatnonzero((np.diff(la) != 0) | (np.diff(lb) != 0)) + 1
+    found = []
+    for group_a, group_b in zip(np.split(ia, bounds), np.split(ib, bounds)):
+        if not len(group_a):
+            continue
+        length_a, length_b = len(words[group_a[0]]), len(words[group_b[0]])
+        limit = _limit(length_a, max_distance)
+        dist = _banded_numpy(codes[group_a, :length_a], codes[group_b, :length_b], limit)
+        ok = dist <= limit
+        found.extend(zip(group_a[ok].tolist(), group_b[ok].tolist(), dist[ok].tolist()))
+    return found
+
+
+def _banded_numpy(a, b, limit: int):
+    """整批配對的編輯距離（a: P x La、b: P x Lb，La <= Lb）；超過 limit 時為 limit + 1"""
+    count, lb = len(a), b.shape[1]
+    cap = limit + 1
+    columns = np.arange(lb + 1, dtype=np.int32)
+    prev = np.broadcast_to(np.minimum(columns, cap), (count, lb + 1)).copy()
+    alive = np.arange(count)
+    result = np.full(count, cap, dtype=np.int32)
+    for i in range(1, a.shape[1] + 1):
+        substitute = prev[:, :-1] + (a[alive, i - 1:i] != b[alive])
+        cur = np.empty_like(prev)
+        cur[:, 0] = i
+        cur[:, 1:] = np.minimum(substitute, prev[:, 1:] + 1)
+        # cur[j] = min(cur[j], cur[j - 1] + 1) 的前綴最小值形式
+        cur = np.minimum.accumulate(cur - columns, axis=1) + columns
+        np.minimum(cur, cap, out=cur)
+        keep = cur.min(axis=1) <= limit
+        if not keep.all():
+            alive, cur = alive[keep], cur[keep]
+            if not len(alive):
+                return result
+        prev = cur
+    result[alive] = prev[:, lb]
+    return result
+
+
+def _pairs_python(words: List[str], max_distance: int) -> List[Tuple[int, int, int]]:
+    pairs = set()
+    for members in _blocks(words, max_distance).values():
+        if len(members) > 1:
+            pairs.update(itertools.combinations(members, 2))
+    hist = [_histogram(w) for w in words]
+    found = []
+    for i, j in sorted(pairs, key=lambda p: (len(words[p[0]]), len(words[p[1]])) + p):
+        if len(words[i]) > len(words[j]):
+            i, j = j, i
+        limit = _limit(len(words[i]), max_distance)
+        if len(words[j]) - len(words[i]) > limit:
+            continue
+        if sum(abs(x - y) for x, y in zip(hist[i], hist[j])) > 2 * limit:
+            continue
+        dist = edit_distance(words[i], words[j], limit)
+        if dist <= limit:
+            found.append((i, j, dist))
+    return found
+
+
+def find_pairs(words: List[str], max_distance: int = MAX_DISTANCE) -> List[Tuple[int, int, int]]:
+    """距離在上限內的所有配對 (i, j, 距離)，i、j 為 words 中的位置（words[i] 較短）"""
+    if np is not None:
+        return _pairs_numpy(words, max_distance)
+    return _pairs_python(words, max_distance)
+
+
+def confusables(words: List[str], max_distance: int = MAX_DISTANCE,
+                top_k: int = TOP_K) -> Dict[str, List[Tuple[str, int]]]:
+    """每個單字最容易混淆的 top_k 個單字（沒有的單字不列出）"""
+    unique = sorted(set(w.lower() for w in words))
+    neighbours: Dict[int, List[Tuple[int, int, str]]] = {}
+    for i, j, dist in find_pairs(unique, max_distance):
+        a, b = unique[i], unique[j]
+        gap = abs(len(a) - len(b))
+        neighbours.setdefault(i, []).append((dist, gap, b))
+        neighbours.setdefault(j, []).append((dist, gap, a))
+    return {unique[i]: [(w, d) for d, _, w in sorted(items)[:top_k]]
+            for i, items in sorted(neighbours.items())}
+
+
+def write_confusables(entries: List[Dict], output_file=None, max_distance: int = MAX_DISTANCE,
+                      top_k: int = TOP_K) -> Dict:
+    """輸出 words_confusables.json，回傳 {'path', 'words', 'pairs', 'seconds'}"""
+    start = time.perf_counter()
+    table = confusables([e['word'] for e in entries], max_distance, top_k)
+    seconds = time.perf_counter() - start
+    path = Path(output_file) if output_file else BUILD_DIR / CONFUSABLES_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CONFUSABLES_VERSION, 'maxDistance': max_distance, 'confusables': table},
+                  f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return {'path': path, 'words': len(table), 'pairs': sum(len(v) for v in table.values()),
+            'seconds': seconds}
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description='找出拼字相近、容易混淆的單字')
+    parser.add_argument('words_file', nargs='?', type=Path,
+                        default=script_dir.parent / 'assets' / 'data' / 'words.json')
+    parser.add_argument('--output', type=Path, default=BUILD_DIR / CONFUSABLES_NAME)
+    parser.add_argument('--max-distance', type=int, default=MAX_DISTANCE)
+    parser.add_argument('--top-k', type=int, default=TOP_K)
+    args = parser.parse_args()
+
+    with open(args.words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    result = write_confusables(entries, args.output, args.max_distance, args.top_k)
+    print(f"{result['words']} 個單字有容易混淆的單字（共 {result['pairs']} 筆），"
+          f"耗時 {result['seconds'] * 1000:.0f} ms")
+    print(f"已保存到 {result['path']}")
+    with open(result['path'], 'r', encoding='utf-8') as f:
+        table = json.load(f)['confusables']
+    for word in ('affect', 'adapt', 'quiet', 'desert'):
+        if word in table:
+            print(f"  {word}: {table[word]}")
+
+
+if __name__ == '__main__':
+    main()
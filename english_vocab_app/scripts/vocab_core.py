@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+單字資料處理的共用核心
+所有生成 words.json 的腳本都從這裡匯入解析、級別判斷與輸出函數，
+避免每個腳本各自複製一份（且各有不同錯誤）的解析邏輯。
+
+資料列格式: 級別\t單字\t屬性\t輸出\t中文
+"""
+
+import re
+import zlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import vocab_dedupe
+import vocab_encode
+import vocab_shards
+
+CAMBRIDGE_URL_PREFIX = "https://dictionary.cambridge.org/dictionary/english-chinese-traditional/"
+
+# 不打包進應用程式的衍生輸出（二進位檔、索引等）
+BUILD_DIR = Path(__file__).parent.parent / 'build' / 'vocab'
+
+# 單字欄位的輸出順序（與 WordEntry.fromJson 對應）
+ENTRY_KEYS = (
+    'word', 'translation', 'partOfSpeech', 'exampleEn',
+    'exampleZh', 'cambridgeUrl', 'level', 'audioUrl',
+)
+
+_PAREN_RE = re.compile(r'\([^)]+\)')
+_SLUG_STRIP_RE = re.compile(r'[^\w\-]')
+_LISTED_SPLIT_RE = re.compile(r'[,/;]')
+# 括號內的詞性註記（例如 "medium (n.)"），不是其他寫法
+_POS_NOTE_RE = re.compile(r'[a-z]{1,4}\.')
+
+# normalize_headword 的快取大小（一份單字列表約 6 千個單字）
+NORMALIZE_CACHE_SIZE = 8192
+
+# 一行資料的文法，依序嘗試三種分隔方式（只比對一次）：
+#   1. tab 分隔        級別\t單字\t屬性\t輸出\t中文
+#   2. 兩個以上空白分隔 級別  單字  屬性  輸出  中文
+#   3. 單一空格分隔    等同 line.split(' ', 4)
+# 每個分支各有 4 個群組（級別、單字、屬性、中文），輸出欄位不擷取
+_ROW_RE = re.compile(
+    r'([^\t]*)\t([^\t]*)\t([^\t]*)\t[^\t]*\t([^\t]*)'
+    r'|(.+?)\s{2,}(.+?)\s{2,}(.+?)\s{2,}.+?\s{2,}(.+?)(?:\s{2,}|$)'
+    r'|([^ ]*) ([^ ]*) ([^ ]*) [^ ]* (.*)'
+)
+
+# 級別字元對照表；同一字串出現多個級別字元時取最小級別
+LEVEL_TABLE = {
+    '1': 1, '一': 1,
+    '2': 2, '二': 2,
+    '3': 3, '三': 3,
+    '4': 4, '四': 4,
+    '5': 5, '五': 5,
+    '6': 6, '六': 6,
+}
+_LEVEL_CHAR_RE = re.compile('[' + ''.join(LEVEL_TABLE) + ']')
+_LEVEL_NUMBER_RE = re.compile(r'\d+(\.0*)?')
+
+# 表示標題行的單字欄位內容
+HEADER_WORDS = frozenset(['單字', 'word', '級別', 'level'])
+
+
+def extract_base_word(word: str) -> str:
+    """提取單字的基本形式（去除括號、斜線等）
+    例如: "he (him, his, himself)" -> "he"、"a/an" -> "a"
+    """
+    if not word:
+        return ""
+    word = _PAREN_RE.sub('', word)
+    if '/' in word:
+        word = word.split('/', 1)[0]
+    return word.strip().lower()
+
+
+def cambridge_slug(base_word: str) -> str:
+    """將基本單字轉為劍橋字典網址使用的字串（只保留字母、數字和連字符）"""
+    return _SLUG_STRIP_RE.sub('', base_word)
+
+
+def generate_cambridge_url(word: str) -> str:
+    """生成劍橋字典連結"""
+    return CAMBRIDGE_URL_PREFIX + normalize_headword(word)[2]
+
+
+def _expand(text: List[str], inserts: List[Tuple[int, str]]) -> str:
+    """把接在字母後的括號內容放回原位置"""
+    out = []
+    start = 0
+    for position, content in inserts:
+        out.append(''.join(text[start:position]))
+        out.append(content)
+        start = position
+    out.append(''.join(text[start:]))
+    return ''.join(out).strip().lower()
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def normalize_headword(word: str) -> Tuple[str, Tuple[str, ...], str]:
+    """掃描一次原始單字欄位，回傳 (基本形式, 其他寫法, 網址字串)
+    基本形式與 extract_base_word 相同，網址字串與 cambridge_slug 相同；其他寫法包含:
+      括號接在字母後（省略的部分）  agree(ment) -> agreement、colo(u)r -> colour
+      括號前有空白（列出的形式）    he (him, his, himself) -> him, his, himself
+      斜線後的其他寫法              a/an -> an
+    結果有快取（見 normalize_cache_stats）；回傳值不可修改
+    """
+    if not word:
+        return '', (), ''
+    if '(' not in word and '/' not in word:
+        base = word.strip().lower()
+        return base, (), cambridge_slug(base)
+
+    # 每個斜線分隔的部分: (字元, [(插入位置, 括號內容)])
+    parts = []
+    text: List[str] = []
+    inserts: List[Tuple[int, str]] = []
+    listed: List[str] = []
+    i = 0
+    n = len(word)
+    while i < n:
+        c = word[i]
+        if c == '(':
+            # 與 _PAREN_RE 相同：找到下一個 ")" 且中間不是空的才算括號
+            close = word.find(')', i + 1)
+            if close > i + 1:
+                content = word[i + 1:close]
+                if text and text[-1].isalpha() and content.isalpha():
+                    inserts.append((len(text), content))
+                else:
+                    listed.extend(_LISTED_SPLIT_RE.split(content))
+                i = close + 1
+                continue
+        elif c == '/':
+            parts.append((text, inserts))
+            text, inserts = [], []
+            i += 1
+            continue
+        text.append(c)
+        i += 1
+    parts.append((text, inserts))
+
+    base = ''.join(parts[0][0]).strip().lower()
+    variants = []
+    for k, (text, inserts) in enumerate(parts):
+        if k:
+            variants.append(''.join(text).strip().lower())
+        if inserts:
+            variants.append(_expand(text, inserts))
+    for form in listed:
+        form = form.strip().lower()
+        if not _POS_NOTE_RE.fullmatch(form):
+            variants.append(form)
+    seen = {base, ''}
+    unique = []
+    for form in variants:
+        if form not in seen:
+            seen.add(form)
+            unique.append(form)
+    return base, tuple(unique), cambridge_slug(base)
+
+
+def normalize_cache_stats() -> Dict:
+    """normalize_headword 的快取統計"""
+    info = normalize_headword.cache_info()
+    calls = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'maxsize': info.maxsize,
+        'hit_rate': info.hits / calls if calls else 0.0,
+    }
+
+
+@lru_cache(maxsize=1024)
+def _level_from_text(text: str) -> int:
+    # 純數字（含 Excel 的 "1.0"）只看數值，"10"、"16" 不在範圍內，不再逐字查表
+    if _LEVEL_NUMBER_RE.fullmatch(text):
+        level = int(float(text))
+        return level if 1 <= level <= 6 else 0
+    found = _LEVEL_CHAR_RE.findall(text)
+    if not found:
+        return 0
+    return min(LEVEL_TABLE[c] for c in found)
+
+
+def parse_level(value) -> int:
+    """解析級別（可能是 "1"、1.0 或 "第一級" 等），無法辨識時回傳 0"""
+    if value is None:
+        return 0
+    return _level_from_text(str(value).strip())
+
+
+def make_entry(base_word: str, translation: str, part_of_speech: str, level: int, slug: str = None) -> Dict:
+    """建立一筆 words.json 單字資料；base_word 必須已經過 extract_base_word
+    slug 為 normalize_headword 算好的網址字串，省略時由 base_word 計算
+    """
+    return {
+        'word': base_word,
+        'translation': translation,
+        'partOfSpeech': part_of_speech,
+        'exampleEn': '',
+        'exampleZh': '',
+        'cambridgeUrl': CAMBRIDGE_URL_PREFIX + (cambridge_slug(base_word) if slug is None else slug),
+        'level': level,
+        'audioUrl': '',
+    }
+
+
+def split_row(line: str) -> Optional[Tuple[str, str, str, str]]:
+    """把一行資料拆成 (級別, 單字, 屬性, 中文) 原始欄位，無法比對時回傳 None"""
+    line = line.strip()
+    if not line:
+        return None
+
+    match = _ROW_RE.match(line)
+    if match is None:
+        return None
+
+    # lastindex 指向所用分支的最後一個群組
+    first = match.lastindex - 3
+    return match.group(first, first + 1, first + 2, first + 3)
+
+
+def parse_line(line: str) -> Optional[Dict]:
+    """解析單行數據，無法解析時回傳 None
+    格式: 級別\t單字\t屬性\t輸出\t中文
+    例如: 1\ta/an\tart.\ta/an (art.)\t一個/一個
+    """
+    row = split_row(line)
+    if row is None:
+        return None
+    level_str, word, pos, translation = row
+
+    level = _level_from_text(level_str.strip())
+    if not level:
+        return None
+
+    word = word.strip()
+    translation = translation.strip()
+    if not word or not translation:
+        return None
+
+    base_word, _, slug = normalize_headword(word)
+    if not base_word:
+        return None
+
+    return make_entry(base_word, translation, pos.strip(), level, slug)
+
+
+def parse_lines(lines: Iterable[str]) -> Iterable[Optional[Dict]]:
+    """逐行解析，每一行產生一個結果（無法解析時為 None）"""
+    for line in lines:
+        yield parse_line(line)
+
+
+def count_levels(words: Iterable[Dict]) -> Dict[int, int]:
+    """統計每個級別的單字數"""
+    level_counts: Dict[int, int] = {}
+    for w in words:
+        level_counts[w['level']] = level_counts.get(w['level'], 0) + 1
+    return level_counts
+
+
+def words_crc32(words: Iterable[Dict]) -> int:
+    """單字列表的 CRC-32，衍生文件用來確認與 words.json 一致（順序、單字、級別、詞性、翻譯）
+    每筆為 "word\tlevel\tpartOfSpeech\ttranslation"，以換行連接後以 UTF-8 編碼；
+    只看這幾個欄位，應用程式讀 words.json 或 words_v2.json 都能算出相同的值
+    （與補丁用的 vocab_patch.words_checksum 不同，那是整份資料的 SHA-256）
+    """
+    text = '\n'.join(f"{w['word']}\t{w['level']}\t{w['partOfSpeech']}\t{w['translation']}" for w in words)
+    return zlib.crc32(text.encode('utf-8'))
+
+
+def print_level_counts(level_counts: Dict[int, int]) -> None:
+    """列印級別統計"""
+    for level in sorted(level_counts.keys()):
+        print(f"第{level}級: {level_counts[level]} 個")
+
+
+def dedupe_words(words: List[Dict], duplicates: str = vocab_dedupe.DEFAULT_POLICY) -> List[Dict]:
+    """依 duplicates 處理重複的單字並列印碰撞報告（見 vocab_dedupe），回傳可交給 save_words_json 的列表
+    在統計級別之前呼叫，列印的數字才會與寫出的 words.json 一致；policy 為 fail 時拋出 DuplicateWordError
+    """
+    words, collisions = vocab_dedupe.dedupe(words, duplicates)
+    vocab_dedupe.print_collisions(collisions)
+    return words
+
+
+def save_words_json(words: List[Dict], output_file, shards: bool = True, schema_v2: bool = True,
+                    distractors: bool = True, families: bool = True, word_ids: bool = True,
+                    headwords: Iterable[str] = ()) -> Path:
+    """將單字列表保存為 words.json，並在同一資料夾輸出級別分片（分頁分片在 build/vocab/pages/，見 vocab_shards）、
+    精簡格式 build/vocab/words_v2.json（見 vocab_schema，會列印與 v1 的大小比較；應用程式讀 words.json，不打包）、
+    測驗的干擾選項 words_distractors.json（見 vocab_distractors）、
+    詞族 words_families.json（見 vocab_families；headwords 為來源資料的原始單字欄位，用來找出括號中的寫法），
+    並為新單字分配 ID（登錄表 word_ids.json，見 vocab_ids）
+    words 必須已經過 dedupe_words（或 vocab_dedupe.dedupe），有重複的單字時拋出 ValueError
+    """
+    seen = set()
+    repeated = [w['word'] for w in words if w['word'] in seen or seen.add(w['word'])]
+    if repeated:
+        raise ValueError(f"單字列表有重複的單字（請先呼叫 dedupe_words）: {', '.join(repeated[:10])}")
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        # 與 json.dump(words, f, ensure_ascii=False, indent=2) 逐位元組相同，但快得多
+        vocab_encode.dump_words(words, f)
+    if shards:
+        vocab_shards.write_shards(words, output_file.parent)
+    if schema_v2:
+        # vocab_schema 匯入本模組，在此延後匯入以避免循環
+        import vocab_schema
+        report = vocab_schema.write_v2(words, BUILD_DIR)
+        vocab_schema.print_schema_report(report, output_file.stat().st_size)
+        # 舊版寫在 words.json 旁的 words_v2.json 會被打包進應用程式，一併刪除
+        stale = output_file.parent / vocab_schema.V2_NAME
+        if stale.resolve() != report['path'].resolve():
+            stale.unlink(missing_ok=True)
+    if distractors:
+        import vocab_distractors
+        vocab_distractors.print_distractor_report(vocab_distractors.write_distractors(words, output_file.parent))
+    if families:
+        import vocab_families
+        vocab_families.print_family_report(vocab_families.write_families(words, output_file.parent, headwords))
+    if word_ids:
+        import vocab_ids
+        vocab_ids.print_registry_report(
+            vocab_ids.update_registry(words, output_file.parent / vocab_ids.REGISTRY_NAME))
+    return output_file
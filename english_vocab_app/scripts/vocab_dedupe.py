@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+合併重複的單字（含同形異義詞）
+extract_base_word 會把 "a/an"、"medium (n.)" 等寫法折疊成同一個單字，
+來源資料也有同一個單字分成不同詞性出現多次的情況；若直接輸出，應用程式會看到重複的單字。
+
+以單字為鍵建立雜湊索引，單次掃描處理所有碰撞，可選擇的處理方式：
+  merge       合併為一筆：詞性與翻譯的義項取聯集（保留原順序）、級別取最低
+  keep-first  保留第一次出現的資料
+  fail        發現重複就拋出 DuplicateWordError
+每一組碰撞都會記錄下來，供列印報告。
+
+用法: python vocab_dedupe.py [words.json] [--policy merge|keep-first|fail]   只列出報告，不修改文件
+"""
+
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+POLICIES = ('merge', 'keep-first', 'fail')
+DEFAULT_POLICY = 'merge'
+
+# 翻譯的義項分隔符號（合併後一律以 / 分隔）
+_SENSE_SPLIT_RE = re.compile(r'\s*[/；;]\s*')
+
+
+class DuplicateWordError(ValueError):
+    """policy 為 fail 時發現重複單字"""
+
+    def __init__(self, collisions: List[Dict]):
+        self.collisions = collisions
+        words = ', '.join(c['word'] for c in collisions[:10])
+        more = f" 等 {len(collisions)} 組" if len(collisions) > 10 else ''
+        super().__init__(f"發現重複的單字: {words}{more}")
+
+
+def _union(parts: List[str]) -> List[str]:
+    return list(dict.fromkeys(p for p in parts if p))
+
+
+def merge_entries(first: Dict, other: Dict) -> Dict:
+    """合併兩筆同一單字的資料（以第一筆為基礎）"""
+    merged = dict(first)
+    pos = _union(first['partOfSpeech'].split('/') + other['partOfSpeech'].split('/'))
+    # "(n.)" 表示可作名詞；已有 "n." 時不重複列出
+    merged['partOfSpeech'] = '/'.join(p for p in pos if not (p.startswith('(') and p[1:-1] in pos))
+    merged['translation'] = '/'.join(_union(
+        _SENSE_SPLIT_RE.split(first['translation']) + _SENSE_SPLIT_RE.split(other['translation'])))
+    merged['level'] = min(first['level'], other['level'])
+    for key in ('exampleEn', 'exampleZh', 'audioUrl'):
+        if not merged.get(key) and other.get(key):
+            merged[key] = other[key]
+    return merged
+
+
+def dedupe(words: List[Dict], policy: str = DEFAULT_POLICY) -> Tuple[List[Dict], List[Dict]]:
+    """處理重複單字，回傳 (結果, 碰撞報告)
+    合併後的資料放在該單字第一次出現的位置；報告每組為
+    {'word', 'indices', 'partsOfSpeech', 'levels', 'action'}
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"未知的重複處理方式: {policy}（可用: {', '.join(POLICIES)}）")
+
+    result: List[Dict] = []
+    # 單字 -> (在結果中的位置, 第一次出現的索引)
+    position: Dict[str, Tuple[int, int]] = {}
+    collisions: Dict[str, Dict] = {}
+    for index, entry in enumerate(words):
+        word = entry['word']
+        seen = position.get(word)
+        if seen is None:
+            position[word] = (len(result), index)
+            result.append(entry)
+            continue
+        pos, first_index = seen
+
+        collision = collisions.get(word)
+        if collision is None:
+            first = result[pos]
+            collision = collisions[word] = {
+                'word': word,
+                'indices': [first_index],
+                'partsOfSpeech': [first['partOfSpeech']],
+                'levels': [first['level']],
+                'action': policy,
+            }
+        collision['indices'].append(index)
+        collision['partsOfSpeech'].append(entry['partOfSpeech'])
+        collision['levels'].append(entry['level'])
+        if policy == 'merge':
+            result[pos] = merge_entries(result[pos], entry)
+
+    report = sorted(collisions.values(), key=lambda c: c['indices'][0])
+    if report and policy == 'fail':
+        raise DuplicateWordError(report)
+    return result, report
+
+
+def print_collisions(collisions: List[Dict], limit: int = 20) -> None:
+    """列印碰撞報告"""
+    if not collisions:
+        return
+    removed = sum(len(c['indices']) - 1 for c in collisions)
+    action = '合併' if collisions[0]['action'] == 'merge' else '保留第一筆'
+    print(f"重複的單字: {len(collisions)} 組，{action}後移除 {removed} 筆")
+    for c in collisions[:limit]:
+        detail = '、'.join(f"{pos} (第{level}級)" for pos, level in zip(c['partsOfSpeech'], c['levels']))
+        print(f"  {c['word']}: {detail}")
+    if len(collisions) > limit:
+        print(f"  ... 還有 {len(collisions) - limit} 組")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description='列出 words.json 中重複的單字')
+    parser.add_argument('words_file', nargs='?', type=Path,
+                        default=script_dir.parent / 'assets' / 'data' / 'words.json')
+    parser.add_argument('--policy', choices=POLICIES, default=DEFAULT_POLICY)
+    args = parser.parse_args()
+
+    with open(args.words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    try:
+        result, collisions = dedupe(words, args.policy)
+    except DuplicateWordError as e:
+        print(f"錯誤: {e}")
+        sys.exit(1)
+    if not collisions:
+        print(f"沒有重複的單字（共 {len(words)} 個）")
+        return
+    print_collisions(collisions, limit=len(collisions))
+    print(f"\n處理後共 {len(result)} 個單字（原本 {len(words)} 個）")
+
+
+if __name__ == '__main__':
+    main()
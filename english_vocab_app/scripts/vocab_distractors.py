@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+預先計算選擇題的干擾選項
+測驗原本隨機抽單字的翻譯當選項，不考慮級別與詞性，常常太容易分辨。
+建置時為每個單字準備一組干擾選項（words.json 中的索引），條件為:
+
+  - 詞性相同（以第一個詞性分組）
+  - 級別相同或相鄰（相同級別優先）
+  - 翻譯與該單字沒有相同的義項或相鄰兩字（見 vocab_zh_index.split_senses）
+  - 同一組內翻譯不重複
+
+單字依 (詞性, 級別) 放進雜湊桶，每個單字只在自己與相鄰級別的桶中挑選，
+不做兩兩比對。桶內依 (翻譯長度, 單字雜湊) 排序，從與該單字相同的位置往兩側、
+依翻譯長度差由小到大最多看 WINDOW 個候選，因此看到的就是分數最好的一段；
+相同長度時依雜湊的順序，各單字拿到的選項不會都一樣。
+先取同級別、不足時再取相鄰兩級別（合併後依分數挑選），保留 (級別差, 翻譯長度差) 最好的 POOL_SIZE 個。
+詞性分組太小時改用同級別的其他詞性補足。
+
+輸出 assets/data/words_distractors.json（與 words.json 的順序對應）:
+  {"version": 2, "count": 單字數, "checksum": 單字列表的 CRC-32（見 vocab_core.words_crc32）,
+   "pools": [[索引, ...], ...]}
+應用程式比對 checksum，單字數相同但內容已變更的舊文件也不會被採用。
+
+用法: python vocab_distractors.py [words.json]
+"""
+
+import json
+import os
+import sys
+import zlib
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+from vocab_core import words_crc32
+from vocab_facets import normalize_pos
+from vocab_zh_index import split_senses
+
+DISTRACTORS_NAME = 'words_distractors.json'
+DISTRACTORS_VERSION = 2
+POOL_SIZE = 8
+# 每個桶中最多檢查的候選數
+WINDOW = 64
+# 測驗需要的干擾選項數
+MIN_POOL = 3
+
+
+def translation_keys(translation: str) -> Set[str]:
+    """判斷翻譯是否重疊用的義項與相鄰兩字"""
+    keys = set()
+    for sense in split_senses(translation):
+        keys.add(sense)
+        keys.update(sense[i:i + 2] for i in range(len(sense) - 1))
+    return keys
+
+
+def _primary_pos(entry: Dict) -> str:
+    values = normalize_pos(entry['partOfSpeech'])
+    return values[0] if values else ''
+
+
+def _sort_key(entry: Dict) -> Tuple[int, int]:
+    return len(entry['translation']), zlib.crc32(entry['word'].encode('utf-8'))
+
+
+def _candidates(index: int, bucket: List[Tuple[int, int, int]], keys: List[Set[str]],
+                entries: List[Dict], seen: Set[str], need: int,
+                window: int = WINDOW) -> List[Tuple[int, int]]:
+    """從桶中與該單字相同的位置往兩側，依翻譯長度差由小到大最多檢查 window 個候選，
+    回傳前 need 個翻譯不重疊、不重複的單字 [(翻譯長度差, 索引), ...]
+    """
+    own = keys[index]
+    key = _sort_key(entries[index])
+    length = key[0]
+    hi = bisect_left(bucket, key)
+    lo = hi - 1
+    found = []
+    translations = set()
+    for _ in range(window):
+        if lo < 0 and hi >= len(bucket):
+            break
+        if lo < 0 or (hi < len(bucket) and bucket[hi][0] - length <= length - bucket[lo][0]):
+            other, _, j = bucket[hi]
+            hi += 1
+        else:
+            other, _, j = bucket[lo]
+            lo -= 1
+        translation = entries[j]['translation']
+        if j == index or translation in seen or translation in translations or not own.isdisjoint(keys[j]):
+            continue
+        translations.add(translation)
+        found.append((abs(other - length), j))
+        if len(found) >= need:
+            break
+    return found
+
+
+def _fill(index: int, buckets: List[List[Tuple[int, int, int]]], keys: List[Set[str]],
+          entries: List[Dict], pool: List[int], seen: Set[str], limit: int, window: int) -> None:
+    """buckets 為 [同級別, 低一級, 高一級] 的桶；先從同級別、再從相鄰兩級別合併後
+    挑選分數最好且翻譯不重複的候選加入 pool，直到 pool 有 limit 個
+    """
+    for group in (buckets[:1], buckets[1:]):
+        need = limit - len(pool)
+        if need <= 0:
+            return
+        candidates = []
+        for bucket in group:
+            if bucket:
+                candidates += _candidates(index, bucket, keys, entries, seen, need, window)
+        candidates.sort()
+        for _, j in candidates:
+            if len(pool) >= limit:
+                return
+            translation = entries[j]['translation']
+            if translation in seen or j in pool:
+                continue
+            seen.add(translation)
+            pool.append(j)
+
+
+def build_pools(entries: List[Dict], pool_size: int = POOL_SIZE, window: int = WINDOW) -> List[List[int]]:
+    """每個單字的干擾選項（words.json 中的索引），依 (級別差, 翻譯長度差) 排序"""
+    keys = [translation_keys(e['translation']) for e in entries]
+    by_pos: Dict[Tuple[str, int], List[Tuple[int, int, int]]] = {}
+    by_level: Dict[int, List[Tuple[int, int, int]]] = {}
+    for i, entry in enumerate(entries):
+        item = _sort_key(entry) + (i,)
+        by_pos.setdefault((_primary_pos(entry), entry['level']), []).append(item)
+        by_level.setdefault(entry['level'], []).append(item)
+    for bucket in list(by_pos.values()) + list(by_level.values()):
+        bucket.sort()
+
+    pools = []
+    for i, entry in enumerate(entries):
+        pos, level = _primary_pos(entry), entry['level']
+        levels = [level, level - 1, level + 1]
+        pool: List[int] = []
+        seen = {entry['translation']}
+        _fill(i, [by_pos.get((pos, l)) for l in levels], keys, entries, pool, seen, pool_size, window)
+        if len(pool) < MIN_POOL:
+            _fill(i, [by_level.get(l) for l in levels], keys, entries, pool, seen, MIN_POOL, window)
+        length = len(entry['translation'])
+        pool.sort(key=lambda j: (abs(entries[j]['level'] - level), abs(len(entries[j]['translation']) - length), j))
+        pools.append(pool)
+    return pools
+
+
+def write_distractors(entries: List[Dict], output_dir) -> Dict:
+    """輸出 words_distractors.json，回傳 {'path', 'pools', 'short'}"""
+    pools = build_pools(entries)
+    path = Path(output_dir) / DISTRACTORS_NAME
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': DISTRACTORS_VERSION, 'count': len(entries),
+                   'checksum': words_crc32(entries), 'pools': pools},
+                  f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    return {'path': path, 'pools': pools, 'short': sum(len(p) < MIN_POOL for p in pools)}
+
+
+def print_distractor_report(result: Dict) -> None:
+    """列印干擾選項的摘要"""
+    pools = result['pools']
+    total = sum(len(p) for p in pools)
+    print(f"干擾選項: {len(pools)} 組，平均 {total / max(len(pools), 1):.1f} 個，"
+          f"不足 {MIN_POOL} 個的有 {result['short']} 組（{result['path'].name}）")
+
+
+def check_pools(entries: List[Dict], pools: List[List[int]]) -> List[str]:
+    """檢查干擾選項是否符合條件，回傳錯誤訊息"""
+    errors = []
+    for i, (entry, pool) in enumerate(zip(entries, pools)):
+        own = translation_keys(entry['translation'])
+        translations = [entries[j]['translation'] for j in pool]
+        if len(set(translations)) != len(translations) or entry['translation'] in translations:
+            errors.append(f"{entry['word']}: 選項翻譯重複")
+        for j in pool:
+            other = entries[j]
+            if not own.isdisjoint(translation_keys(other['translation'])):
+                errors.append(f"{entry['word']}: {other['word']} 的翻譯重疊")
+            if abs(other['level'] - entry['level']) > 1:
+                errors.append(f"{entry['word']}: {other['word']} 的級別不相鄰")
+    return errors
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    result = write_distractors(entries, words_file.parent)
+    pools = result['pools']
+    errors = check_pools(entries, pools)
+    for error in errors[:20]:
+        print(f"  {error}")
+    same_pos = sum(_primary_pos(entries[j]) == _primary_pos(entries[i]) for i, p in enumerate(pools) for j in p)
+    print_distractor_report(result)
+    print(f"  詞性相同 {same_pos / max(sum(len(p) for p in pools), 1):.1%}")
+    print(f"已保存到 {result['path']}（{result['path'].stat().st_size / 1024:.1f} KB）")
+    if errors:
+        print(f"檢查失敗: {len(errors)} 個錯誤")
+        sys.exit(1)
+    for entry, pool in list(zip(entries, pools))[100:103]:
+        print(f"  {entry['word']}（{entry['translation']}）: {[entries[j]['translation'] for j in pool]}")
+
+
+if __name__ == '__main__':
+    main()
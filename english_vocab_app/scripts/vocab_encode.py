@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+單字資料的專用 JSON 編碼器
+json.dump(words, f, ensure_ascii=False, indent=2) 在指定 indent 時會改用純 Python 的編碼器，
+逐個鍵值判斷型別並產生大量小字串。單字資料的欄位固定，因此改為：
+
+  - 依欄位順序預先組好整筆資料的格式字串（同一組欄位只建立一次）
+  - 每個字串值只跳脫一次（使用 json 模組的 C 實作 encode_basestring）
+  - 分批組合後一次寫出
+
+支援縮排（與 indent=2 相同）與精簡（與 separators=(',', ':') 相同）兩種輸出，
+結果與標準函式庫逐位元組相同；遇到巢狀或浮點數等值時，該筆改用標準函式庫編碼。
+精簡輸出直接分批交給 json 模組的 C 編碼器（實測比格式字串快）。
+
+用法: python vocab_encode.py --verify [words.json]   與標準函式庫的輸出逐位元組比對
+"""
+
+import io
+import json
+import sys
+from json.encoder import encode_basestring
+from pathlib import Path
+from typing import Dict, List, TextIO
+
+# 每次寫出的筆數
+CHUNK_SIZE = 2048
+
+_templates: Dict[tuple, str] = {}
+
+
+class _Unsupported(Exception):
+    """值的型別不在快速路徑內，改用標準函式庫"""
+
+
+def _template(keys: tuple, pretty: bool) -> str:
+    cache_key = (keys, pretty)
+    template = _templates.get(cache_key)
+    if template is None:
+        if any(type(k) is not str for k in keys):
+            raise _Unsupported
+        names = [encode_basestring(k).replace('%', '%%') for k in keys]
+        if not names:
+            template = '  {}' if pretty else '{}'
+        elif pretty:
+            template = '  {\n' + ',\n'.join(f'    {n}: %s' for n in names) + '\n  }'
+        else:
+            template = '{' + ','.join(f'{n}:%s' for n in names) + '}'
+        _templates[cache_key] = template
+    return template
+
+
+def _scalar(value) -> str:
+    cls = type(value)
+    if cls is str:
+        return encode_basestring(value)
+    if cls is int:
+        return int.__repr__(value)
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    raise _Unsupported
+
+
+def _fallback(entry: Dict, pretty: bool) -> str:
+    if not pretty:
+        return json.dumps(entry, ensure_ascii=False, separators=(',', ':'))
+    text = json.dumps(entry, ensure_ascii=False, indent=2)
+    return '  ' + text.replace('\n', '\n  ')
+
+
+def encode_entry(entry: Dict, pretty: bool = True) -> str:
+    """編碼一筆資料；縮排模式包含陣列內的 2 格前置縮排"""
+    return _encode_chunk([entry], pretty)[0]
+
+
+# 精簡輸出沒有縮排，json 模組的 C 編碼器已經比逐筆套用格式字串快，直接使用
+_compact_encode = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+
+
+def _encode_chunk(words: List[Dict], pretty: bool) -> List[str]:
+    """編碼一批資料，每筆一個字串（迴圈內聯，避免逐筆呼叫函數的開銷）"""
+    if not pretty:
+        return [_compact_encode(words)[1:-1]] if words else []
+    parts = []
+    append = parts.append
+    last_keys = None
+    template = None
+    repr_int = int.__repr__
+    for entry in words:
+        keys = tuple(entry)
+        if keys != last_keys:
+            last_keys = keys
+            try:
+                template = _template(keys, pretty)
+            except _Unsupported:
+                template = None
+        try:
+            if template is None:
+                raise _Unsupported
+            append(template % tuple([
+                encode_basestring(v) if type(v) is str else
+                repr_int(v) if type(v) is int else _scalar(v)
+                for v in entry.values()
+            ]))
+        except _Unsupported:
+            append(_fallback(entry, pretty))
+    return parts
+
+
+def _separators(pretty: bool):
+    return ('[\n', ',\n', '\n]') if pretty else ('[', ',', ']')
+
+
+def encode_words(words: List[Dict], pretty: bool = True) -> str:
+    """編碼整個單字列表，與 json.dumps(words, ensure_ascii=False, indent=2) 或
+    json.dumps(words, ensure_ascii=False, separators=(',', ':')) 相同
+    """
+    if not words:
+        return '[]'
+    head, sep, tail = _separators(pretty)
+    return head + sep.join(_encode_chunk(words, pretty)) + tail
+
+
+def dump_words(words: List[Dict], out: TextIO, pretty: bool = True, chunk_size: int = CHUNK_SIZE) -> None:
+    """將單字列表寫入已開啟的文字檔，每 chunk_size 筆寫出一次"""
+    if not words:
+        out.write('[]')
+        return
+    head, sep, tail = _separators(pretty)
+    out.write(head)
+    for start in range(0, len(words), chunk_size):
+        if start:
+            out.write(sep)
+        out.write(sep.join(_encode_chunk(words[start:start + chunk_size], pretty)))
+    out.write(tail)
+
+
+def _edge_cases() -> List[List[Dict]]:
+    """比對時額外使用的邊界資料"""
+    entry = {
+        'word': 'a', 'translation': '一個', 'partOfSpeech': 'art.', 'exampleEn': '',
+        'exampleZh': '', 'cambridgeUrl': 'https://example.org/a', 'level': 1, 'audioUrl': '',
+    }
+    return [
+        [],
+        [entry],
+        [dict(entry, word='quote " back \\ slash', translation='tab\tnew\nline \x00   😀 100%')],
+        [dict(entry, audioUrl=None), dict(entry, level=True), {}],
+        [{'level': 1.5, 'word': 'float'}, {'nested': [1, {'a': 'b'}]}, {1: 'int key'}],
+        [{'%s': '%d', 'word': '%%'}],
+    ]
+
+
+def verify(words: List[Dict]) -> List[str]:
+    """與標準函式庫的輸出逐位元組比對，回傳不一致的說明"""
+    problems = []
+    for index, sample in enumerate([words] + _edge_cases()):
+        expected = {
+            True: json.dumps(sample, ensure_ascii=False, indent=2),
+            False: json.dumps(sample, ensure_ascii=False, separators=(',', ':')),
+        }
+        for pretty, text in expected.items():
+            mode = '縮排' if pretty else '精簡'
+            if encode_words(sample, pretty) != text:
+                problems.append(f"資料組 {index} 的{mode}輸出 (encode_words) 不同")
+            out = io.StringIO()
+            dump_words(sample, out, pretty, chunk_size=3)
+            if out.getvalue() != text:
+                problems.append(f"資料組 {index} 的{mode}輸出 (dump_words) 不同")
+    return problems
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != '--verify']
+    script_dir = Path(__file__).parent
+    words_file = Path(args[0]) if args else script_dir.parent / 'assets' / 'data' / 'words.json'
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    problems = verify(words)
+    if problems:
+        print(f"比對失敗，共 {len(problems)} 處不同:")
+        for problem in problems:
+            print(f"  {problem}")
+        sys.exit(1)
+    print(f"比對成功: {len(words)} 個單字與邊界資料的縮排、精簡輸出都與標準函式庫相同")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+級別與詞性的位元圖索引（facets）
+依級別或詞性篩選單字時，原本每次都要掃描整個列表並解析 partOfSpeech。
+建置時為每個級別與每個詞性各建立一個位元圖（第 i 個位元代表 words.json 中第 i 筆），
+查詢時只對位元圖做 AND / OR，不必讀取單字資料，例如「第 3 級的形容詞」:
+
+    index.query(levels=[3], pos=['adj.'])
+
+詞性依 "/" 切開並去除括號："v./(n.)" 同時屬於 v. 與 n.；缺少句點的 "n" 視為 n.，
+不在 POS_VALUES 中的值（來源資料的錯位欄位）不建立位元圖。
+位元圖在 Python 中以整數表示，AND / OR 由整數運算完成。
+
+索引文件格式（little-endian）:
+  檔頭    magic "VFCT"、版本、單字數、位元圖數、名稱表長度（bytes）
+  名稱表  "level:3"、"pos:adj." 等名稱，以 "\\n" 相接（UTF-8）
+  位元圖  每個 (單字數 + 7) // 8 bytes，依名稱表順序排列
+
+用法: python vocab_facets.py [words.json] [輸出.idx]   預設輸出 build/vocab/words_facets.idx
+"""
+
+import json
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from vocab_core import BUILD_DIR
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b'VFCT'
+INDEX_VERSION = 1
+INDEX_NAME = 'words_facets.idx'
+
+_HEADER = struct.Struct('<4sHHIII')
+
+# 建立位元圖的詞性
+POS_VALUES = ('n.', 'v.', 'adj.', 'adv.', 'prep.', 'conj.', 'pron.', 'art.', 'aux.', 'int.', 'num.')
+
+
+def normalize_pos(part_of_speech: str) -> List[str]:
+    """詞性字串切成個別詞性，例如 "v./(n.)" -> ['v.', 'n.']"""
+    values = []
+    for part in part_of_speech.split('/'):
+        value = part.strip().strip('()').strip().lower()
+        if value and not value.endswith('.'):
+            value += '.'
+        if value in POS_VALUES and value not in values:
+            values.append(value)
+    return values
+
+
+def bits_to_ids(bits: int, count: int) -> List[int]:
+    """位元圖中設定為 1 的位置（遞增）"""
+    data = bits.to_bytes((count + 7) // 8, 'little')
+    if np is not None:
+        flags = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')
+        return np.flatnonzero(flags).tolist()
+    ids = []
+    for byte_index, byte in enumerate(data):
+        base = byte_index * 8
+        while byte:
+            low = byte & -byte
+            ids.append(base + low.bit_length() - 1)
+            byte ^= low
+    return ids
+
+
+class FacetIndex:
+    """級別與詞性的位元圖；查詢結果為位元圖（int），再以 ids() 取得 words.json 中的索引"""
+
+    def __init__(self, count: int, levels: Dict[int, int], pos: Dict[str, int]):
+        self.count = count
+        self.level_bits = levels
+        self.pos_bits = pos
+
+    @classmethod
+    def build(cls, entries: List[Dict]) -> 'FacetIndex':
+        level_ids: Dict[int, List[int]] = {}
+        pos_ids: Dict[str, List[int]] = {}
+        for i, entry in enumerate(entries):
+            level_ids.setdefault(entry['level'], []).append(i)
+            for value in normalize_pos(entry['partOfSpeech']):
+                pos_ids.setdefault(value, []).append(i)
+        size = (len(entries) + 7) // 8
+
+        def to_bits(ids):
+            data = bytearray(size)
+            for i in ids:
+                data[i >> 3] |= 1 << (i & 7)
+            return int.from_bytes(data, 'little')
+
+        return cls(len(entries),
+                   {level: to_bits(ids) for level, ids in sorted(level_ids.items())},
+                   {value: to_bits(ids) for value, ids in sorted(pos_ids.items())})
+
+    def available_levels(self) -> List[int]:
+        return [level for level, bits in self.level_bits.items() if bits]
+
+    def available_pos(self) -> List[str]:
+        return [value for value, bits in self.pos_bits.items() if bits]
+
+    def level(self, *values: int) -> int:
+        """任一級別（OR）"""
+        bits = 0
+        for value in values:
+            bits |= self.level_bits.get(value, 0)
+        return bits
+
+    def pos(self, *values: str) -> int:
+        """任一詞性（OR）"""
+        bits = 0
+        for value in values:
+            for normalized in normalize_pos(value):
+                bits |= self.pos_bits.get(normalized, 0)
+        return bits
+
+    def query(self, levels: Iterable[int] = (), pos: Iterable[str] = ()) -> int:
+        """同一類條件取 OR、不同類條件取 AND；沒有指定的類別不限制"""
+        bits = (1 << self.count) - 1
+        levels = list(levels)
+        pos = list(pos)
+        if levels:
+            bits &= self.level(*levels)
+        if pos:
+            bits &= self.pos(*pos)
+        return bits
+
+    def ids(self, bits: int) -> List[int]:
+        return bits_to_ids(bits, self.count)
+
+    @staticmethod
+    def size(bits: int) -> int:
+        """位元圖中的單字數"""
+        return bits.bit_count()
+
+    def encode(self) -> bytes:
+        names = [f'level:{level}' for level in self.level_bits] + [f'pos:{value}' for value in self.pos_bits]
+        table = '\n'.join(names).encode('utf-8')
+        size = (self.count + 7) // 8
+        header = _HEADER.pack(MAGIC, INDEX_VERSION, 0, self.count, len(names), len(table))
+        bitmaps = b''.join(bits.to_bytes(size, 'little')
+                           for bits in list(self.level_bits.values()) + list(self.pos_bits.values()))
+        return header + table + bitmaps
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'FacetIndex':
+        data = Path(path).read_bytes()
+        magic, version, _, count, facet_count, table_size = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是位元圖索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+        offset = _HEADER.size
+        names = data[offset:offset + table_size].decode('utf-8').split('\n') if facet_count else []
+        offset += table_size
+        size = (count + 7) // 8
+        levels: Dict[int, int] = {}
+        pos: Dict[str, int] = {}
+        for name in names:
+            bits = int.from_bytes(data[offset:offset + size], 'little')
+            offset += size
+            kind, _, value = name.partition(':')
+            if kind == 'level':
+                levels[int(value)] = bits
+            else:
+                pos[value] = bits
+        return cls(count, levels, pos)
+
+
+def filter_words(entries: List[Dict], levels: Iterable[int] = (), pos: Iterable[str] = ()) -> List[int]:
+    """對照組：逐筆篩選（與 FacetIndex.query 結果相同）"""
+    levels = set(levels)
+    wanted = {v for value in pos for v in normalize_pos(value)}
+    return [i for i, e in enumerate(entries)
+            if (not levels or e['level'] in levels)
+            and (not wanted or not wanted.isdisjoint(normalize_pos(e['partOfSpeech'])))]
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else BUILD_DIR / INDEX_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    index = FacetIndex.build(entries)
+    index.save(output_file)
+    print(f"共 {index.count} 個單字、{len(index.level_bits)} 個級別、{len(index.pos_bits)} 種詞性")
+    print(f"已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB）")
+
+    loaded = FacetIndex.load(output_file)
+    for value in loaded.available_pos():
+        print(f"  {value:<6} {FacetIndex.size(loaded.pos(value)):>5} 個")
+    bits = loaded.query(levels=[3], pos=['adj.'])
+    print(f"第 3 級的形容詞: {FacetIndex.size(bits)} 個，例如 "
+          f"{[entries[i]['word'] for i in loaded.ids(bits)[:5]]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+詞族（word family）分群
+act / action / active / activity 等相關單字在 words.json 中各自獨立，
+建置時依構詞規則找出相關單字，合併成詞族，應用程式可以直接整族學習或複習。
+
+候選連結有三種來源，兩端都必須是 words.json 中的單字:
+  後綴    去掉後綴並還原拼字後的字根（protection -> protect、activity -> active、happily -> happy、
+          runner -> run），部分後綴要求字根的詞性（-ion / -er / -or / -ing / -ed 接動詞、-ic 接名詞、
+          -ly / -ness 接形容詞）與最短長度（-al / -ic / -ion / -or 至少 5 個字母）；
+          後綴依長度、還原方式依規則中的順序嘗試，每個單字只取第一個存在的字根，
+          避免 tension 同時連到 tend、tent、tense 而把不相關的詞族接在一起
+  前綴    un- / dis- / mis- / non-（dis- 接動詞或形容詞），
+          以及接在形容詞前的 in- / im- / il- / ir-（impossible -> possible）
+  括號    來源資料括號中的寫法（agree(ment) -> agreement、he (him, his, himself)）；
+          斜線分隔的寫法（movie/film）多半是同義詞，不算
+STOP_ROOTS 中的字根不參與構詞規則（state -> station 這類拼字巧合）；
+KNOWN_BAD_PAIRS 列出不應在同一詞族的單字，--verify 會檢查。
+每個單字只查表數次（O(1) 的 dict），再以 union-find（路徑減半 + 依大小合併）合併，
+整體接近線性時間。
+
+輸出 assets/data/words_families.json（與 words.json 的順序對應，由 save_words_json 一併產生）:
+  {"version": 2, "count": 單字數, "checksum": 單字列表的 CRC-32（見 vocab_core.words_crc32）,
+   "familyIds": [詞族編號或 -1, ...],
+   "families": [[字根索引, 其他成員索引, ...], ...]}
+只有一個單字的不算詞族（編號為 -1）；字根為詞族中最短的單字，其餘成員依 words.json 順序。
+讀取端應比對 count 與 checksum，與目前的單字列表不符時不採用。
+
+用法: python vocab_families.py [words.json] [vocab_data.txt] [--verify]
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from vocab_core import normalize_headword, words_crc32
+from vocab_facets import normalize_pos
+from vocab_variants import source_headwords
+
+FAMILIES_NAME = 'words_families.json'
+FAMILIES_VERSION = 2
+# 去掉後綴後（還原拼字前）至少要剩下的長度
+MIN_STEM = 3
+
+_VERB = ('v.',)
+_NOUN = ('n.',)
+_ADJ = ('adj.',)
+
+# (後綴, 字根結尾的還原方式, 字根需要的詞性（其中之一，空白為不限）, 字根至少要有的長度)
+# 容易碰巧拼出的後綴（-al、-ic、-ion、-ition、-or）要求較長的字根，
+# 避免 leg -> legal、top -> topic、mill -> million、mine -> minor 這類拼字相同但無關的連結
+SUFFIX_RULES: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...], int], ...] = (
+    ('ation', ('', 'e', 'ate'), _VERB, 4),
+    ('ition', ('', 'e'), _VERB, 6),
+    ('sion', ('se', 'de', 'd'), _VERB, 3),
+    ('ion', ('', 'e'), _VERB, 5),
+    ('ment', ('',), (), 3),
+    ('ness', ('',), _ADJ, 3),
+    ('ility', ('le',), (), 3),
+    ('ity', ('', 'e'), (), 3),
+    ('ive', ('', 'e'), (), 3),
+    ('er', ('', 'e'), _VERB, 3),
+    ('or', ('', 'e'), _VERB, 5),
+    ('ist', ('', 'e', 'y'), (), 3),
+    ('ism', ('', 'e'), (), 3),
+    ('ly', ('', 'le'), _ADJ, 3),
+    ('ful', ('',), (), 3),
+    ('less', ('',), (), 3),
+    ('ical', ('ic', 'y'), (), 3),
+    ('al', ('', 'e'), ('n.', 'v.'), 5),
+    ('ic', ('y', 'e', ''), _NOUN, 5),
+    ('ance', ('', 'e'), (), 3),
+    ('ence', ('', 'e'), (), 3),
+    ('ant', ('', 'e'), (), 3),
+    ('ent', ('', 'e'), (), 3),
+    ('able', ('', 'e'), (), 3),
+    ('ible', ('', 'e'), (), 3),
+    ('ous', ('', 'e', 'y'), (), 3),
+    ('ize', ('', 'e'), (), 3),
+    ('ise', ('', 'e'), (), 3),
+    ('ship', ('',), (), 3),
+    ('hood', ('',), (), 3),
+    ('ing', ('', 'e'), _VERB, 3),
+    # scared -> scare 而不是 scar
+    ('ed', ('e', ''), _VERB, 4),
+)
+
+# (前綴, 剩餘部分至少要有的長度, 剩餘部分需要的詞性)
+PREFIX_RULES: Tuple[Tuple[str, int, Tuple[str, ...]], ...] = (
+    ('un', 4, ()),
+    ('dis', 5, ('v.', 'adj.')),
+    ('mis', 4, ()),
+    ('non', 4, ()),
+    ('in', 6, _ADJ),
+    ('im', 6, _ADJ),
+    ('il', 6, _ADJ),
+    ('ir', 6, _ADJ),
+)
+
+# 拼字剛好是其他單字去掉後綴 / 前綴的結果、但意思無關的字根，不參與構詞規則的連結
+# （括號寫法的連結不受影響）
+STOP_ROOTS = frozenset([
+    'compass', 'content', 'converse', 'course', 'cover', 'liter', 'miner',
+    'party', 'plant', 'process', 'state', 'virtue',
+])
+
+# 不應在同一詞族的單字（python vocab_families.py --verify 檢查）
+KNOWN_BAD_PAIRS: Tuple[Tuple[str, str], ...] = (
+    ('coal', 'coalition'), ('sand', 'sandal'), ('come', 'comic'), ('card', 'discard'),
+    ('success', 'succession'), ('scar', 'scared'), ('mine', 'minor'), ('mine', 'mineral'),
+    ('minor', 'miner'), ('miner', 'mineral'), ('mill', 'million'), ('state', 'station'),
+    ('top', 'topic'), ('leg', 'legal'), ('can', 'canal'), ('core', 'coral'), ('more', 'moral'),
+    ('ease', 'disease'), ('miss', 'mission'), ('miss', 'dismiss'), ('pose', 'position'),
+    ('trade', 'tradition'), ('party', 'partial'), ('virtue', 'virtual'), ('liter', 'literal'),
+    ('process', 'procession'), ('compass', 'compassion'), ('cover', 'discover'),
+    ('converse', 'conversation'), ('plant', 'plantation'), ('rot', 'rotation'),
+)
+
+# 較長的後綴先試（-ation 優先於 -ion）
+_SUFFIXES_BY_LENGTH = sorted(SUFFIX_RULES, key=lambda rule: -len(rule[0]))
+
+_PAREN_RE = re.compile(r'\([^)]+\)')
+_DOUBLED_RE = re.compile(r'([^aeiou])\1$')
+
+
+class UnionFind:
+    """不相交集合（路徑減半 + 依大小合併）"""
+
+    def __init__(self, count: int):
+        self.parent = list(range(count))
+        self.size = [1] * count
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        """合併 a、b 所在的集合，原本就在同一集合時回傳 False"""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        return True
+
+
+def _restored(stem: str) -> Iterable[str]:
+    """字根與拼字還原後的寫法（happi -> happy、runn -> run）"""
+    yield stem
+    if stem.endswith('i'):
+        yield stem[:-1] + 'y'
+    if _DOUBLED_RE.search(stem):
+        yield stem[:-1]
+
+
+def suffix_stems(word: str) -> Iterable[Tuple[str, str, Tuple[str, ...]]]:
+    """(字根, 後綴, 字根需要的詞性) 的候選，依嘗試順序"""
+    for suffix, endings, pos, min_root in _SUFFIXES_BY_LENGTH:
+        if not word.endswith(suffix) or len(word) - len(suffix) < MIN_STEM:
+            continue
+        base = word[:-len(suffix)]
+        for ending in endings:
+            for stem in _restored(base + ending):
+                if len(stem) >= min_root:
+                    yield stem, suffix, pos
+
+
+def prefix_stems(word: str) -> Iterable[Tuple[str, str, Tuple[str, ...]]]:
+    """(剩餘部分, 前綴, 剩餘部分需要的詞性) 的候選"""
+    for prefix, min_rest, pos in PREFIX_RULES:
+        # miss- 開頭的單字（missing、mission）是 miss 衍生的，不是 mis-
+        if word.startswith(prefix) and len(word) - len(prefix) >= min_rest and not word.startswith('miss'):
+            yield word[len(prefix):], prefix, pos
+
+
+def _accepts(required: Tuple[str, ...], pos: List[str]) -> bool:
+    return not required or any(p in pos for p in required)
+
+
+def parenthetical_forms(raw: str) -> List[str]:
+    """原始單字欄位中括號產生的寫法（不含斜線分隔的其他寫法）"""
+    if '(' not in raw:
+        return []
+    slash_forms = set(normalize_headword(_PAREN_RE.sub('', raw))[1])
+    return [form for form in normalize_headword(raw)[1] if form not in slash_forms]
+
+
+def family_links(entries: List[Dict], headwords: Iterable[str] = ()) -> List[Tuple[int, int, str]]:
+    """候選連結 [(索引, 索引, 規則), ...]"""
+    index: Dict[str, int] = {}
+    for i, entry in enumerate(entries):
+        index.setdefault(entry['word'], i)
+    pos = [normalize_pos(entry['partOfSpeech']) for entry in entries]
+
+    links = []
+    for i, entry in enumerate(entries):
+        word = entry['word']
+        if not word.isalpha():
+            continue
+        for stem, rule, required in suffix_stems(word):
+            j = index.get(stem) if stem not in STOP_ROOTS else None
+            if j is not None and j != i and _accepts(required, pos[j]):
+                links.append((j, i, '-' + rule))
+                break
+        for rest, rule, required in prefix_stems(word):
+            j = index.get(rest) if rest not in STOP_ROOTS else None
+            if j is not None and j != i and _accepts(required, pos[j]):
+                links.append((j, i, rule + '-'))
+    for raw in headwords:
+        i = index.get(normalize_headword(raw)[0])
+        if i is None:
+            continue
+        for form in parenthetical_forms(raw):
+            j = index.get(form)
+            if j is not None and j != i:
+                links.append((i, j, '()'))
+    return links
+
+
+def build_families(entries: List[Dict], headwords: Iterable[str] = ()) -> Dict:
+    """合併候選連結，回傳 {'familyIds', 'families', 'links'}"""
+    links = family_links(entries, headwords)
+    sets = UnionFind(len(entries))
+    for a, b, _ in links:
+        sets.union(a, b)
+
+    members: Dict[int, List[int]] = {}
+    for i in range(len(entries)):
+        members.setdefault(sets.find(i), []).append(i)
+    family_ids = [-1] * len(entries)
+    families = []
+    # 依第一個成員在 words.json 中的順序編號
+    for group in members.values():
+        if len(group) < 2:
+            continue
+        head = min(group, key=lambda i: (len(entries[i]['word']), i))
+        for i in group:
+            family_ids[i] = len(families)
+        families.append([head] + [i for i in group if i != head])
+    return {'familyIds': family_ids, 'families': families, 'links': links}
+
+
+def write_families(entries: List[Dict], output_dir, headwords: Iterable[str] = ()) -> Dict:
+    """輸出 words_families.json，回傳 build_families 的結果加上 'path'"""
+    result = build_families(entries, headwords)
+    path = Path(output_dir) / FAMILIES_NAME
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': FAMILIES_VERSION, 'count': len(entries), 'checksum': words_crc32(entries),
+                   'familyIds': result['familyIds'], 'families': result['families']},
+                  f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    result['path'] = path
+    return result
+
+
+def verify(entries: List[Dict], result: Dict) -> List[str]:
+    """檢查 KNOWN_BAD_PAIRS 沒有被分到同一詞族（單字列表中沒有的略過），回傳錯誤訊息"""
+    index = {entry['word']: i for i, entry in enumerate(entries)}
+    family_ids = result['familyIds']
+    errors = []
+    for a, b in KNOWN_BAD_PAIRS:
+        if a in index and b in index and family_ids[index[a]] != -1 \
+                and family_ids[index[a]] == family_ids[index[b]]:
+            errors.append(f"{a} / {b} 在同一詞族")
+    return errors
+
+
+def print_family_report(result: Dict) -> None:
+    """列印詞族的摘要"""
+    families = result['families']
+    covered = sum(len(f) for f in families)
+    print(f"詞族: {len(families)} 個，涵蓋 {covered} 個單字（{len(result['links'])} 個候選連結，"
+          f"{result['path'].name}）")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    args = [arg for arg in sys.argv[1:] if arg != '--verify']
+    words_file = Path(args[0]) if args else script_dir.parent / 'assets' / 'data' / 'words.json'
+    source_file = Path(args[1]) if len(args) > 1 else script_dir / 'vocab_data.txt'
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    lines = []
+    if source_file.exists():
+        with open(source_file, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    else:
+        print(f"找不到 {source_file}，只使用構詞規則")
+    result = write_families(entries, words_file.parent, source_headwords(lines))
+    print_family_report(result)
+
+    rules: Dict[str, int] = {}
+    for _, _, rule in result['links']:
+        rules[rule] = rules.get(rule, 0) + 1
+    print("  連結: " + "、".join(f"{rule} {n}" for rule, n in sorted(rules.items(), key=lambda x: -x[1])))
+    largest = sorted(result['families'], key=len, reverse=True)[:5]
+    for family in largest:
+        print(f"  {len(family)} 個: {' / '.join(entries[i]['word'] for i in family[:12])}")
+    print(f"已保存到 {result['path']}（{result['path'].stat().st_size / 1024:.1f} KB）")
+
+    if '--verify' in sys.argv[1:]:
+        errors = verify(entries, result)
+        for error in errors:
+            print(f"  {error}")
+        if errors:
+            print(f"驗證失敗: {len(errors)} 個錯誤")
+            sys.exit(1)
+        print(f"驗證通過: {len(KNOWN_BAD_PAIRS)} 組不應相連的單字")
+
+
+if __name__ == '__main__':
+    main()
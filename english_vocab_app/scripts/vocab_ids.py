@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+單字的固定整數 ID 與最小完美雜湊（minimal perfect hash）
+學習進度原本以完整的單字字串保存；改用整數 ID 後可以存成位元圖或整數陣列。
+
+ID 登錄表 assets/data/word_ids.json 記錄每個 ID 對應的單字（列表中的位置即為 ID）:
+  {"version": 1, "words": ["a", "abandon", ...]}
+重新建置時沿用既有的 ID，新的單字依 words.json 順序接在後面；
+已移除的單字仍保留在登錄表中，它的 ID 不會分配給其他單字。
+
+最小完美雜湊以 CHD（hash, displace）建立：n 個單字分成約 n / 4 個桶，
+從最大的桶開始，為每個桶找出位移值，使桶內單字都落在尚未使用的槽位，
+最後 n 個單字恰好佔滿 n 個槽位。查詢時計算三個雜湊值即可在 O(1) 找到槽位，
+槽位中存放 ID 與驗證用的指紋（不在列表中的單字回傳 None）。
+
+雜湊函數為 32-bit FNV-1a（以 seed 作為初始值的一部分）加上 murmur3 的 fmix32，
+其他語言可以照同樣的算法實作。
+
+索引文件格式（little-endian）:
+  檔頭    magic "VMPH"、版本、單字數、桶數、seed
+  位移    每個桶一個 uint32
+  ID      每個槽位一個 uint32
+  指紋    每個槽位一個 uint32
+
+用法:
+  python vocab_ids.py [words.json] [輸出.mph]   更新登錄表並輸出 build/vocab/words_ids.mph
+  python vocab_ids.py --verify                   檢查查詢結果與 ID 的穩定性
+"""
+
+import json
+import os
+import random
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from vocab_core import BUILD_DIR
+
+MAGIC = b'VMPH'
+INDEX_VERSION = 1
+INDEX_NAME = 'words_ids.mph'
+REGISTRY_NAME = 'word_ids.json'
+REGISTRY_VERSION = 1
+
+# 平均每個桶的單字數
+BUCKET_SIZE = 4
+MAX_SEEDS = 16
+
+_HEADER = struct.Struct('<4sHHIII')
+_MASK = 0xFFFFFFFF
+
+
+def _fmix32(h: int) -> int:
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK
+    return h ^ (h >> 16)
+
+
+def key_hash(word: str, seed: int) -> int:
+    """32-bit FNV-1a（初始值與 seed 做 XOR）+ fmix32"""
+    h = 0x811C9DC5 ^ (seed & _MASK)
+    for byte in word.encode('utf-8'):
+        h = ((h ^ byte) * 0x01000193) & _MASK
+    return _fmix32(h)
+
+
+def _hashes(word: str, seed: int, count: int, buckets: int) -> Tuple[int, int, int]:
+    """(桶, 起點, 步長)"""
+    base = seed * 4
+    step = key_hash(word, base + 2) % (count - 1) + 1 if count > 1 else 1
+    return key_hash(word, base) % buckets, key_hash(word, base + 1) % count, step
+
+
+def _fingerprint(word: str, seed: int) -> int:
+    return key_hash(word, seed * 4 + 3)
+
+
+def _slot(start: int, step: int, displacement: int, count: int) -> int:
+    d0, d1 = divmod(displacement, count)
+    return (start + d0 * step + d1) % count
+
+
+# ---------------------------------------------------------------------------
+# ID 登錄表
+
+def load_registry(path) -> List[str]:
+    """登錄表中的單字（位置即為 ID）；文件不存在時為空列表"""
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != REGISTRY_VERSION:
+        raise ValueError(f"{path}: 不支援的登錄表版本 {data.get('version')}")
+    return data['words']
+
+
+def save_registry(registry: List[str], path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': REGISTRY_VERSION, 'words': registry}, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+
+def assign_ids(words: List[Dict], registry: List[str]) -> Tuple[List[int], List[str]]:
+    """每筆資料的 ID 與更新後的登錄表（既有的 ID 不變，新單字接在後面）"""
+    registry = list(registry)
+    known = {word: i for i, word in enumerate(registry)}
+    ids = []
+    for entry in words:
+        word = entry['word']
+        word_id = known.get(word)
+        if word_id is None:
+            word_id = known[word] = len(registry)
+            registry.append(word)
+        ids.append(word_id)
+    return ids, registry
+
+
+def update_registry(words: List[Dict], path) -> Dict:
+    """更新登錄表（有新單字時才寫入），回傳 {'ids', 'added', 'retired', 'total'}"""
+    registry = load_registry(path)
+    ids, updated = assign_ids(words, registry)
+    if len(updated) != len(registry) or not Path(path).exists():
+        save_registry(updated, path)
+    return {
+        'ids': ids,
+        'added': len(updated) - len(registry),
+        'retired': len(updated) - len(set(ids)),
+        'total': len(updated),
+    }
+
+
+def print_registry_report(stats: Dict) -> None:
+    """有新單字時列印登錄表的變化"""
+    if stats['added']:
+        print(f"單字 ID: 新增 {stats['added']} 個，共 {stats['total']} 個")
+
+
+# ---------------------------------------------------------------------------
+# 最小完美雜湊
+
+class IdMap:
+    """單字 -> ID 的最小完美雜湊"""
+
+    def __init__(self, seed: int, displacements, ids, fingerprints):
+        self.seed = seed
+        self.displacements = displacements
+        self.ids = ids
+        self.fingerprints = fingerprints
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, words: List[str], ids: List[int]) -> 'IdMap':
+        """words 中的單字必須互不相同；ids[i] 為 words[i] 的 ID"""
+        if len(set(words)) != len(words):
+            raise ValueError("單字重複，無法建立完美雜湊")
+        count = len(words)
+        if count == 0:
+            return cls(0, array('I'), array('I'), array('I'))
+        buckets = max(1, (count + BUCKET_SIZE - 1) // BUCKET_SIZE)
+        for seed in range(MAX_SEEDS):
+            displacements = cls._place(words, seed, count, buckets)
+            if displacements is None:
+                continue
+            slot_ids = array('I', [0]) * count
+            fingerprints = array('I', [0]) * count
+            for word, word_id in zip(words, ids):
+                bucket, start, step = _hashes(word, seed, count, buckets)
+                slot = _slot(start, step, displacements[bucket], count)
+                slot_ids[slot] = word_id
+                fingerprints[slot] = _fingerprint(word, seed)
+            return cls(seed, displacements, slot_ids, fingerprints)
+        raise ValueError(f"嘗試 {MAX_SEEDS} 個 seed 仍無法建立完美雜湊")
+
+    @staticmethod
+    def _place(words: List[str], seed: int, count: int, buckets: int) -> Optional[array]:
+        members: List[List[Tuple[int, int]]] = [[] for _ in range(buckets)]
+        for word in words:
+            bucket, start, step = _hashes(word, seed, count, buckets)
+            members[bucket].append((start, step))
+
+        taken = bytearray(count)
+        displacements = array('I', [0]) * buckets
+        limit = min(count * count, 1 << 32)
+        for bucket in sorted(range(buckets), key=lambda b: -len(members[b])):
+            items = members[bucket]
+            if not items:
+                break
+            for displacement in range(limit):
+                slots = {_slot(start, step, displacement, count) for start, step in items}
+                if len(slots) == len(items) and not any(taken[s] for s in slots):
+                    break
+            else:
+                return None
+            for s in slots:
+                taken[s] = 1
+            displacements[bucket] = displacement
+        return displacements
+
+    def slot(self, word: str) -> int:
+        count = len(self.ids)
+        bucket, start, step = _hashes(word, self.seed, count, len(self.displacements))
+        return _slot(start, step, self.displacements[bucket], count)
+
+    def lookup(self, word: str) -> Optional[int]:
+        """單字的 ID；不在列表中時為 None"""
+        if not self.ids:
+            return None
+        slot = self.slot(word)
+        if self.fingerprints[slot] != _fingerprint(word, self.seed):
+            return None
+        return self.ids[slot]
+
+    def encode(self) -> bytes:
+        header = _HEADER.pack(MAGIC, INDEX_VERSION, 0, len(self.ids), len(self.displacements), self.seed)
+        return (header + array('I', self.displacements).tobytes()
+                + array('I', self.ids).tobytes() + array('I', self.fingerprints).tobytes())
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'IdMap':
+        data = Path(path).read_bytes()
+        magic, version, _, count, buckets, seed = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是 ID 索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+        offset = _HEADER.size
+        columns = []
+        for size in (buckets, count, count):
+            column = array('I')
+            column.frombytes(data[offset:offset + 4 * size])
+            if sys.byteorder != 'little':
+                column.byteswap()
+            columns.append(column)
+            offset += 4 * size
+        return cls(seed, *columns)
+
+
+def build_id_map(words: List[Dict], registry_path) -> Tuple[IdMap, Dict]:
+    """更新登錄表並建立完美雜湊"""
+    stats = update_registry(words, registry_path)
+    return IdMap.build([e['word'] for e in words], stats['ids']), stats
+
+
+def verify(entries: List[Dict]) -> List[str]:
+    """檢查查詢結果、文件往返與重新建置後 ID 是否不變，回傳錯誤訊息"""
+    errors = []
+    ids, registry = assign_ids(entries, [])
+    id_map = IdMap.build([e['word'] for e in entries], ids)
+    with tempfile.TemporaryDirectory() as tmp:
+        loaded = IdMap.load(id_map.save(Path(tmp) / INDEX_NAME))
+    for entry, word_id in zip(entries, ids):
+        if loaded.lookup(entry['word']) != word_id:
+            errors.append(f"{entry['word']}: 查詢結果不符")
+    misses = sum(id_map.lookup(e['word'] + '#') is not None for e in entries)
+    if misses:
+        errors.append(f"{misses} 個不存在的單字查到了 ID")
+
+    # 打亂順序、移除與新增後，既有單字的 ID 不變
+    rng = random.Random(0)
+    changed = [e for e in entries if rng.random() > 0.05]
+    rng.shuffle(changed)
+    changed += [{'word': f"new-word-{i}"} for i in range(50)]
+    new_ids, new_registry = assign_ids(changed, registry)
+    new_map = IdMap.build([e['word'] for e in changed], new_ids)
+    for entry in changed:
+        word_id = new_map.lookup(entry['word'])
+        if word_id is None or new_registry[word_id] != entry['word']:
+            errors.append(f"{entry['word']}: 重新建置後查詢結果不符")
+        elif word_id < len(registry) and registry[word_id] != entry['word']:
+            errors.append(f"{entry['word']}: 重新建置後 ID 改變")
+    if len(new_registry) != len(registry) + 50:
+        errors.append("移除的單字 ID 被重新分配")
+    return errors
+
+
+def main():
+    script_dir = Path(__file__).parent
+    args = sys.argv[1:]
+    verify_mode = '--verify' in args
+    args = [a for a in args if a != '--verify']
+    words_file = Path(args[0]) if args else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(args[1]) if len(args) > 1 else BUILD_DIR / INDEX_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+
+    if verify_mode:
+        errors = verify(entries)
+        for error in errors[:20]:
+            print(f"  {error}")
+        if errors:
+            print(f"驗證失敗: {len(errors)} 個錯誤")
+            sys.exit(1)
+        print(f"驗證通過: {len(entries)} 個單字")
+        return
+
+    registry_path = words_file.parent / REGISTRY_NAME
+    id_map, stats = build_id_map(entries, registry_path)
+    id_map.save(output_file)
+    print(f"登錄表 {registry_path}: 共 {stats['total']} 個 ID，新增 {stats['added']} 個，"
+          f"不再使用 {stats['retired']} 個")
+    print(f"完美雜湊已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB，"
+          f"{len(id_map.displacements)} 個桶，seed {id_map.seed}）")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+words.json 的增量重建
+清單（manifest）記錄每一行輸入的雜湊，以及它在輸出文件中對應的 JSON 片段位置與雜湊。
+重建時只解析新增或修改過的行，其餘片段直接從現有的 words.json 複製，
+輸出與完整重建（save_words_json，含合併重複單字）逐位元組相同。
+單字有重複的行每次都重新解析並合併（通常只有少數幾行）。
+
+衍生文件（分片、v2、干擾選項、詞族等）以 run_stage 更新：記錄每個項目的鍵
+（words.json、產生它的模組與其他輸入的雜湊）與輸出文件的雜湊，
+鍵相同且輸出未被其他腳本改寫時直接沿用，不重新產生。
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional
+
+import vocab_core
+import vocab_dedupe
+import vocab_encode
+from vocab_cache import CACHE_DIR, file_digest
+
+MANIFEST_VERSION = 2
+
+
+def row_hash(line: str) -> str:
+    """輸入行的雜湊（忽略前後空白，與 parse_line 的行為一致）"""
+    return hashlib.blake2b(line.strip().encode('utf-8'), digest_size=8).hexdigest()
+
+
+def segment_hash(segment: bytes) -> str:
+    """輸出片段的雜湊"""
+    return hashlib.blake2b(segment, digest_size=8).hexdigest()
+
+
+def entry_segment(entry: Dict) -> bytes:
+    """單筆資料在 indent=2 的 JSON 陣列中的文字（含前置縮排）"""
+    return vocab_encode.encode_entry(entry).encode('utf-8')
+
+
+def manifest_path(output_file: Path) -> Path:
+    """清單位置（不放在 assets 下，以免被打包進應用程式）"""
+    return CACHE_DIR / f"{Path(output_file).name}.manifest.json"
+
+
+def stages_path(output_file: Path) -> Path:
+    """衍生文件記錄的位置（與清單相同，不放在 assets 下）"""
+    return CACHE_DIR / f"{Path(output_file).name}.stages.json"
+
+
+def load_stages(output_file) -> Dict[str, Dict]:
+    """讀取衍生文件記錄 {項目: {'key', 'outputs': {路徑: 雜湊}}}，沒有或損壞時回傳空的記錄"""
+    try:
+        with open(stages_path(output_file), 'r', encoding='utf-8') as f:
+            stages = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stages if stages.get('version') == MANIFEST_VERSION else {}
+
+
+def save_stages(output_file, stages: Dict[str, Dict]) -> None:
+    path = stages_path(output_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(dict(stages, version=MANIFEST_VERSION), f, ensure_ascii=False)
+
+
+def stage_key(output_file, modules: Iterable, extra: Iterable[str] = ()) -> str:
+    """衍生項目的鍵：output_file 的內容、產生它的模組原始碼與其他輸入（extra）的雜湊"""
+    digest = hashlib.sha256(file_digest(output_file).encode('ascii'))
+    for module in modules:
+        digest.update(file_digest(module.__file__).encode('ascii'))
+    for text in extra:
+        digest.update(text.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+def run_stage(stages: Dict[str, Dict], name: str, key: str, outputs: Iterable[Path], func: Callable):
+    """key 與上次相同、且輸出文件都還是上次寫出的內容時不執行 func，回傳 None；
+    否則執行 func，記錄 key 與輸出文件的雜湊，回傳 func 的結果
+    """
+    outputs = [Path(p) for p in outputs]
+    record = stages.get(name)
+    if (record is not None and record['key'] == key
+            and all(p.exists() and record['outputs'].get(str(p)) == file_digest(p) for p in outputs)):
+        return None
+    result = func()
+    stages[name] = {'key': key, 'outputs': {str(p): file_digest(p) for p in outputs}}
+    return result
+
+
+def rules_digest(duplicates: str) -> str:
+    """解析、合併重複與編碼規則的雜湊；任何一個改變時清單失效"""
+    digest = hashlib.sha256(duplicates.encode('utf-8'))
+    for module in (vocab_core, vocab_dedupe, vocab_encode):
+        digest.update(file_digest(module.__file__).encode('ascii'))
+    return digest.hexdigest()
+
+
+def _load_manifest(output_file: Path, parser_digest: str) -> Optional[Dict]:
+    path = manifest_path(output_file)
+    if not path.exists() or not output_file.exists():
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # 解析規則改變或輸出被其他腳本覆寫時，清單失效
+    if (manifest.get('version') != MANIFEST_VERSION
+            or manifest.get('parser') != parser_digest
+            or manifest.get('output') != file_digest(output_file)):
+        return None
+    return manifest
+
+
+def build(lines: Iterable[str], output_file, duplicates: str = vocab_dedupe.DEFAULT_POLICY) -> Dict:
+    """增量重建 output_file，回傳統計
+    {'rows', 'reused', 'parsed', 'skipped', 'full', 'level_counts', 'collisions'}
+    重複的單字依 duplicates 處理，結果與 save_words_json 相同
+    """
+    output_file = Path(output_file)
+    parser_digest = rules_digest(duplicates)
+    manifest = _load_manifest(output_file, parser_digest)
+
+    # 舊清單的每一列:
+    #   [行雜湊]                                       該行無法解析
+    #   [行雜湊, 0]                                    該行的單字有重複，下次必須重新解析
+    #   [行雜湊, 片段位置, 長度, 片段雜湊, 級別, 單字]  可直接沿用的片段
+    known = {}
+    old_output = b''
+    if manifest is not None:
+        old_output = output_file.read_bytes()
+        for row in manifest['rows']:
+            known[row[0]] = row[1:]
+
+    # 每一行可解析的資料: [列, 片段, 片段雜湊, 級別, 單字, 原始行, 解析結果]
+    items = []
+    rows = []
+    stats = {'rows': 0, 'reused': 0, 'parsed': 0, 'skipped': 0, 'full': manifest is None}
+
+    for line in lines:
+        if not line.strip():
+            continue
+        stats['rows'] += 1
+        key = row_hash(line)
+        row = [key]
+        rows.append(row)
+
+        old = known.get(key)
+        if old == []:
+            # 內容未變且之前就無法解析
+            stats['reused'] += 1
+            stats['skipped'] += 1
+            continue
+        if old is not None and len(old) == 5:
+            offset, length, digest, level, word = old
+            segment = old_output[offset:offset + length]
+            if segment_hash(segment) == digest:
+                stats['reused'] += 1
+                items.append([row, segment, digest, level, word, line, None])
+                continue
+
+        entry = vocab_core.parse_line(line)
+        stats['parsed'] += 1
+        if entry is None:
+            stats['skipped'] += 1
+            continue
+        segment = entry_segment(entry)
+        items.append([row, segment, segment_hash(segment), entry['level'], entry['word'], line, entry])
+
+    # 重複的單字：解析同一組的所有行並依規則合併，結果放在第一次出現的位置
+    groups: Dict[str, list] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(item[4], []).append((index, item))
+    collisions = []
+    for indexed in groups.values():
+        if len(indexed) < 2:
+            continue
+        group = [item for _, item in indexed]
+        entries = []
+        for item in group:
+            if item[6] is None:
+                item[6] = vocab_core.parse_line(item[5])
+                stats['reused'] -= 1
+                stats['parsed'] += 1
+            entries.append(item[6])
+        merged, report = vocab_dedupe.dedupe(entries, duplicates)
+        for collision in report:
+            collision['indices'] = [index for index, _ in indexed]
+        collisions.extend(report)
+        first = group[0]
+        first[1] = entry_segment(merged[0])
+        first[3] = merged[0]['level']
+        for item in group[1:]:
+            item[1] = None
+        for item in group:
+            item[0].append(0)
+    collisions.sort(key=lambda c: c['indices'][0])
+
+    # 組合輸出並記錄每個片段的位置
+    head, sep, tail = b'[\n', b',\n', b'\n]'
+    segments = []
+    level_counts: Dict[int, int] = {}
+    offset = len(head)
+    for row, segment, digest, level, word, _, _ in items:
+        if segment is None:
+            continue
+        segments.append(segment)
+        level_counts[level] = level_counts.get(level, 0) + 1
+        if len(row) == 1:
+            row.extend([offset, len(segment), digest, level, word])
+        offset += len(segment) + len(sep)
+    data = head + sep.join(segments) + tail if segments else b'[]'
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_output = output_file.with_name(output_file.name + '.tmp')
+    tmp_output.write_bytes(data)
+    os.replace(tmp_output, output_file)
+
+    path = manifest_path(output_file)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        # json.dumps 使用 C 編碼器，比直接 json.dump 到文件快得多
+        f.write(json.dumps({
+            'version': MANIFEST_VERSION,
+            'parser': parser_digest,
+            'output': hashlib.sha256(data).hexdigest(),
+            'rows': rows,
+        }, ensure_ascii=False, separators=(',', ':')))
+
+    stats['level_counts'] = level_counts
+    stats['collisions'] = collisions
+    return stats
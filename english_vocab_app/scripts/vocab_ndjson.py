@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+串流輸出 JSON Lines（NDJSON）
+一般模式會先把所有單字收集成列表、再統計級別、最後才 json.dump，記憶體用量隨輸入增加。
+串流模式逐行讀取輸入、解析後立即寫出一行 JSON，並同時累計級別統計，
+記憶體用量與輸入大小無關。
+
+輸出每行一筆單字資料（欄位與 words.json 相同）：
+  {"word":"a","translation":"一個","partOfSpeech":"art.",...}
+
+重複的單字依 vocab_dedupe 的方式處理（merge / keep-first / fail，結果與 words.json 相同）：
+第一遍只記下出現過的單字與重複的資料，第二遍串流寫出時在第一次出現的位置寫出處理後的資料，
+記憶體用量只隨不同單字的數量與重複資料增加。
+
+iter_ndjson() 以產生器逐筆讀回，下游工具也不必一次載入整個文件。
+
+用法:
+  python vocab_ndjson.py [vocab_data.txt] [輸出.ndjson]   串流解析並輸出
+  python vocab_ndjson.py --read [輸入.ndjson]             逐筆讀取並列出級別統計
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
+
+import vocab_dedupe
+from vocab_core import BUILD_DIR, parse_line, print_level_counts
+
+NDJSON_NAME = 'words.ndjson'
+
+# 寫入緩衝區大小；每行都很短，較大的緩衝區可以減少系統呼叫
+WRITE_BUFFER = 1 << 20
+
+
+def iter_entries(lines: Iterable[str], stats: Dict) -> Iterator[Dict]:
+    """逐行解析，只產生可解析的單字資料；stats 累計 rows / skipped"""
+    for line in lines:
+        if not line.strip():
+            continue
+        stats['rows'] += 1
+        entry = parse_line(line)
+        if entry is None:
+            stats['skipped'] += 1
+            continue
+        yield entry
+
+
+def find_repeats(input_file) -> Dict[str, List[Tuple[int, Dict]]]:
+    """第一遍：回傳 {單字: [(序號, 資料), ...]}，只含第二次以後出現的資料（序號為第幾筆可解析的資料）"""
+    seen = set()
+    repeats: Dict[str, List[Tuple[int, Dict]]] = {}
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for index, entry in enumerate(iter_entries(f, {'rows': 0, 'skipped': 0})):
+            word = entry['word']
+            if word in seen:
+                repeats.setdefault(word, []).append((index, entry))
+            else:
+                seen.add(word)
+    return repeats
+
+
+def dedupe_entries(entries: Iterable[Dict], repeats: Dict[str, List[Tuple[int, Dict]]], policy: str,
+                   collisions: List[Dict]) -> Iterator[Dict]:
+    """第二遍：依 policy 處理 repeats 中的單字，結果與 vocab_dedupe.dedupe 相同；碰撞報告依序加入 collisions"""
+    later = {index for group in repeats.values() for index, _ in group}
+    for index, entry in enumerate(entries):
+        if index in later:
+            continue
+        group = repeats.get(entry['word'])
+        if group is not None:
+            others = [other for _, other in group]
+            collisions.append({
+                'word': entry['word'],
+                'indices': [index] + [i for i, _ in group],
+                'partsOfSpeech': [entry['partOfSpeech']] + [other['partOfSpeech'] for other in others],
+                'levels': [entry['level']] + [other['level'] for other in others],
+                'action': policy,
+            })
+            if policy == 'merge':
+                for other in others:
+                    entry = vocab_dedupe.merge_entries(entry, other)
+        yield entry
+
+
+def write_entries(entries: Iterable[Dict], out: TextIO) -> Dict[int, int]:
+    """逐筆寫出 JSON Lines，回傳級別統計（寫出時同步累計）"""
+    level_counts: Dict[int, int] = {}
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    write = out.write
+    for entry in entries:
+        write(dumps(entry))
+        write('\n')
+        level = entry['level']
+        level_counts[level] = level_counts.get(level, 0) + 1
+    return level_counts
+
+
+def write_ndjson(entries: Iterable[Dict], output_file) -> Dict[int, int]:
+    """將單字串流寫入 output_file（先寫暫存檔再改名），回傳級別統計"""
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER) as f:
+        level_counts = write_entries(entries, f)
+    os.replace(tmp_file, output_file)
+    return level_counts
+
+
+def convert_file(input_file, output_file, duplicates: str = vocab_dedupe.DEFAULT_POLICY) -> Dict:
+    """串流解析 input_file 並輸出 NDJSON，回傳 {'rows', 'skipped', 'collisions', 'level_counts'}
+    duplicates 為重複單字的處理方式（見 vocab_dedupe）；fail 時不寫出文件，拋出 DuplicateWordError
+    """
+    if duplicates not in vocab_dedupe.POLICIES:
+        raise ValueError(f"未知的重複處理方式: {duplicates}（可用: {', '.join(vocab_dedupe.POLICIES)}）")
+    repeats = find_repeats(input_file)
+    stats = {'rows': 0, 'skipped': 0, 'collisions': []}
+    with open(input_file, 'r', encoding='utf-8') as f:
+        entries = dedupe_entries(iter_entries(f, stats), repeats, duplicates, stats['collisions'])
+        if repeats and duplicates == 'fail':
+            # 走完第二遍只為了收集完整的碰撞報告
+            for _ in entries:
+                pass
+            raise vocab_dedupe.DuplicateWordError(stats['collisions'])
+        stats['level_counts'] = write_ndjson(entries, output_file)
+    return stats
+
+
+def iter_ndjson(path) -> Iterator[Dict]:
+    """逐筆讀取 NDJSON 文件（略過空行）"""
+    decode = json.JSONDecoder().decode
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield decode(line)
+
+
+def main():
+    args = sys.argv[1:]
+    script_dir = Path(__file__).parent
+
+    if args and args[0] == '--read':
+        input_file = Path(args[1]) if len(args) > 1 else BUILD_DIR / NDJSON_NAME
+        if not input_file.exists():
+            print(f"錯誤: 找不到文件 {input_file}")
+            sys.exit(1)
+        level_counts: Dict[int, int] = {}
+        for entry in iter_ndjson(input_file):
+            level_counts[entry['level']] = level_counts.get(entry['level'], 0) + 1
+        print(f"共 {sum(level_counts.values())} 個單字")
+        print_level_counts(level_counts)
+        return
+
+    input_file = Path(args[0]) if args else script_dir / 'vocab_data.txt'
+    output_file = Path(args[1]) if len(args) > 1 else BUILD_DIR / NDJSON_NAME
+    if not input_file.exists():
+        print(f"錯誤: 找不到文件 {input_file}")
+        print("格式: 級別\\t單字\\t屬性\\t輸出\\t中文")
+        sys.exit(1)
+
+    stats = convert_file(input_file, output_file)
+    print(f"共 {stats['rows']} 行，跳過 {stats['skipped']} 行")
+    vocab_dedupe.print_collisions(stats['collisions'])
+    print(f"\n共解析 {sum(stats['level_counts'].values())} 個單字")
+    print_level_counts(stats['level_counts'])
+    print(f"\n已保存到 {output_file}")
+
+
+if __name__ == '__main__':
+    main()
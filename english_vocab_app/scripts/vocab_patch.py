@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+words.json 兩個版本之間的差異檔（patch）
+以 (word, partOfSpeech) 為鍵做雜湊比對，只記錄新增、修改與刪除的單字，
+更新內容時只需要下載差異檔，不必重新下載整個 words.json。
+
+差異檔格式（JSON）:
+  {
+    "version": 1,
+    "base":   舊版本的 SHA-256,
+    "target": 新版本的 SHA-256,
+    "count":  新版本的筆數,
+    "remove": [鍵, ...],
+    "update": [[鍵, {變更的欄位}, [刪除的欄位]], ...],
+    "add":    [[新版本中的位置, 單字資料], ...],
+    "order":  [[舊位置, 長度], ...]        只有保留的單字順序改變時才有
+  }
+
+鍵為 [word, partOfSpeech]；同一個鍵重複出現時，第 n 次（n >= 1）為 [word, partOfSpeech, n]。
+雜湊值由精簡 JSON 編碼計算（見 words_checksum），套用前後都會驗證。
+比對與套用都只掃描兩個列表各一次，時間與筆數成線性。
+
+用法:
+  python vocab_patch.py diff 舊.json 新.json 差異檔.json
+  python vocab_patch.py apply 舊.json 差異檔.json 輸出.json
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import vocab_encode
+
+PATCH_VERSION = 1
+
+
+def words_checksum(words: List[Dict]) -> str:
+    """單字列表內容的 SHA-256（與縮排、文件格式無關）"""
+    return hashlib.sha256(vocab_encode.encode_words(words, pretty=False).encode('utf-8')).hexdigest()
+
+
+def _keys(words: List[Dict]) -> List[tuple]:
+    """每筆資料的鍵；重複的鍵加上出現次序"""
+    seen: Dict[tuple, int] = {}
+    keys = []
+    for w in words:
+        base = (w['word'], w['partOfSpeech'])
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        keys.append(base if n == 0 else base + (n,))
+    return keys
+
+
+def _runs(indices: List[int]) -> List[List[int]]:
+    """將索引序列壓縮為 [起點, 長度] 的連續區段"""
+    runs: List[List[int]] = []
+    for i in indices:
+        if runs and runs[-1][0] + runs[-1][1] == i:
+            runs[-1][1] += 1
+        else:
+            runs.append([i, 1])
+    return runs
+
+
+def make_patch(old: List[Dict], new: List[Dict]) -> Dict:
+    """比對兩個版本，回傳差異檔內容"""
+    old_keys = _keys(old)
+    new_keys = _keys(new)
+    old_index = {key: i for i, key in enumerate(old_keys)}
+    new_key_set = set(new_keys)
+
+    remove = [list(key) for key in old_keys if key not in new_key_set]
+    update = []
+    add = []
+    kept = []
+    for position, (key, entry) in enumerate(zip(new_keys, new)):
+        i = old_index.get(key)
+        if i is None:
+            add.append([position, entry])
+            continue
+        kept.append(i)
+        before = old[i]
+        if before == entry and list(before) == list(entry):
+            continue
+        if [k for k in before if k in entry] + [k for k in entry if k not in before] != list(entry):
+            # 欄位順序改變，dict 更新無法重現，改為整筆取代
+            add.append([position, entry])
+            remove.append(list(key))
+            kept.pop()
+            continue
+        changed = {k: v for k, v in entry.items() if k not in before or before[k] != v}
+        dropped = [k for k in before if k not in entry]
+        update.append([list(key), changed, dropped] if dropped else [list(key), changed])
+
+    patch = {
+        'version': PATCH_VERSION,
+        'base': words_checksum(old),
+        'target': words_checksum(new),
+        'count': len(new),
+        'remove': remove,
+        'update': update,
+        'add': add,
+    }
+    if any(a > b for a, b in zip(kept, kept[1:])):
+        patch['order'] = _runs(kept)
+    return patch
+
+
+def apply_patch(old: List[Dict], patch: Dict, verify: bool = True) -> List[Dict]:
+    """套用差異檔；verify 為 True 時檢查套用前後的雜湊，不符時拋出 ValueError"""
+    if patch.get('version') != PATCH_VERSION:
+        raise ValueError(f"不支援的差異檔版本: {patch.get('version')}")
+    if verify and words_checksum(old) != patch['base']:
+        raise ValueError("舊版本的雜湊與差異檔不符，無法套用")
+
+    old_keys = _keys(old)
+    old_index = {key: i for i, key in enumerate(old_keys)}
+    entries = [dict(w) for w in old]
+
+    removed = set()
+    for key in patch['remove']:
+        removed.add(old_index[tuple(key)])
+    for item in patch['update']:
+        entry = entries[old_index[tuple(item[0])]]
+        entry.update(item[1])
+        for field in item[2] if len(item) > 2 else ():
+            del entry[field]
+
+    if 'order' in patch:
+        kept = [entries[i] for start, length in patch['order'] for i in range(start, start + length)]
+    else:
+        kept = [entry for i, entry in enumerate(entries) if i not in removed]
+
+    result: List[Dict] = []
+    kept_iter = iter(kept)
+    for position, entry in patch['add']:
+        while len(result) < position:
+            result.append(next(kept_iter))
+        result.append(entry)
+    result.extend(kept_iter)
+
+    if len(result) != patch['count']:
+        raise ValueError(f"套用後筆數不符: {len(result)} != {patch['count']}")
+    if verify and words_checksum(result) != patch['target']:
+        raise ValueError("套用後的雜湊與差異檔不符")
+    return result
+
+
+def patch_summary(patch: Dict) -> Tuple[int, int, int]:
+    """(新增, 修改, 刪除) 的筆數"""
+    return len(patch['add']), len(patch['update']), len(patch['remove'])
+
+
+def _load(path) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_text(path: Path, write) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) != 4 or args[0] not in ('diff', 'apply'):
+        print("用法:")
+        print("  python vocab_patch.py diff 舊.json 新.json 差異檔.json")
+        print("  python vocab_patch.py apply 舊.json 差異檔.json 輸出.json")
+        sys.exit(1)
+
+    command, first, second, output = args[0], Path(args[1]), Path(args[2]), Path(args[3])
+    for path in (first, second):
+        if not path.exists():
+            print(f"錯誤: 找不到文件 {path}")
+            sys.exit(1)
+
+    if command == 'diff':
+        new_words = _load(second)
+        patch = make_patch(_load(first), new_words)
+        data = json.dumps(patch, ensure_ascii=False, separators=(',', ':'))
+        _write_text(output, lambda f: f.write(data))
+        added, updated, removed = patch_summary(patch)
+        print(f"新增 {added} 筆，修改 {updated} 筆，刪除 {removed} 筆")
+        print(f"差異檔已保存到 {output}（{len(data.encode('utf-8')) / 1024:.1f} KB，"
+              f"新版本 {second.stat().st_size / 1024:.1f} KB）")
+        return
+
+    with open(second, 'r', encoding='utf-8') as f:
+        patch = json.load(f)
+    try:
+        words = apply_patch(_load(first), patch)
+    except (ValueError, KeyError) as e:
+        print(f"錯誤: 無法套用差異檔: {e}")
+        sys.exit(1)
+    _write_text(output, lambda f: vocab_encode.dump_words(words, f))
+    print(f"已套用差異檔並通過雜湊檢查，共 {len(words)} 個單字")
+    print(f"已保存到 {output}")
+
+
+if __name__ == '__main__':
+    main()
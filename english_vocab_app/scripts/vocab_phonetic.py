@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+發音相近的單字（phonetic key 倒排索引）
+聽力練習需要「聽起來很像」的選項，也需要把同音詞放在一起。
+
+每個單字以 Double Metaphone 風格的規則轉成兩個發音鍵（主要、替代，最多 4 個字元），
+例如 knight -> NT、laugh -> LF、school -> SKL、church -> XRX / XRK、thumb -> 0M / TM。
+規則在本模組中實作（不依賴外部套件），涵蓋英文常見的不發音字母、
+CH / GH / PH / TH / SH 等組合與 C、G 的軟硬音；少見的外語拼法只處理最常見的幾種。
+
+建置時輸出「發音鍵 -> 單字」的倒排索引；查詢時計算單字的兩個鍵後查表，
+與單字列表大小無關。
+
+輸出 build/vocab/words_phonetic.json:
+  {"version": 1, "keys": {"NT": ["knight", "night", ...], ...}}
+
+用法:
+  python vocab_phonetic.py [words.json] [輸出.json]
+  python vocab_phonetic.py --verify       檢查已知單字的發音鍵
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from vocab_confusables import edit_distance
+from vocab_core import BUILD_DIR, extract_base_word
+
+PHONETIC_NAME = 'words_phonetic.json'
+PHONETIC_VERSION = 1
+KEY_LENGTH = 4
+
+_VOWELS = frozenset('AEIOUY')
+
+
+def double_metaphone(word: str) -> Tuple[str, str]:
+    """(主要發音鍵, 替代發音鍵)；只有英文字母參與計算"""
+    w = ''.join(c for c in word.upper() if 'A' <= c <= 'Z')
+    if not w:
+        return '', ''
+    n = len(w)
+    last = n - 1
+    primary: List[str] = []
+    alternate: List[str] = []
+
+    def add(main: str, alt: str = None) -> None:
+        primary.append(main)
+        alternate.append(main if alt is None else alt)
+
+    def at(pos: int, *parts: str) -> bool:
+        return pos >= 0 and any(w.startswith(p, pos) for p in parts)
+
+    def vowel(pos: int) -> bool:
+        return 0 <= pos < n and w[pos] in _VOWELS
+
+    slavo_germanic = 'W' in w or 'K' in w or 'CZ' in w or 'WITZ' in w
+
+    i = 0
+    if at(0, 'GN', 'KN', 'PN', 'WR', 'PS'):
+        i = 1
+    elif w[0] == 'X':
+        add('S')
+        i = 1
+
+    while i < n and (len(''.join(primary)) < KEY_LENGTH or len(''.join(alternate)) < KEY_LENGTH):
+        c = w[i]
+        if c in _VOWELS:
+            if i == 0:
+                add('A')
+            i += 1
+        elif c == 'B':
+            add('P')
+            i += 2 if at(i + 1, 'B') else 1
+        elif c == 'C':
+            if at(i, 'CH'):
+                if at(i, 'CHAE') and i > 0:
+                    add('K', 'X')
+                elif (i == 0 and at(i + 2, 'ARAC', 'ARIS', 'OR', 'YM', 'IA', 'EM', 'AOS', 'EMI')) \
+                        or at(i - 1, 'SCH') or at(i + 2, 'T', 'S'):
+                    # 希臘語源的 CH（character、chorus、chemistry、school）
+                    add('K')
+                elif i > 0 and not at(0, 'MC'):
+                    add('X', 'K')
+                else:
+                    add('X')
+                i += 2
+            elif at(i, 'CZ'):
+                add('S', 'X')
+                i += 2
+            elif at(i, 'CIA'):
+                add('X')
+                i += 3
+            elif at(i, 'CC') and not (i == 1 and w[0] == 'M'):
+                if at(i + 2, 'I', 'E', 'H') and not at(i + 2, 'HU'):
+                    # accident、accept
+                    add('KS')
+                    i += 3
+                else:
+                    add('K')
+                    i += 2
+            elif at(i, 'CK', 'CG', 'CQ'):
+                add('K')
+                i += 2
+            elif at(i, 'CI', 'CE', 'CY'):
+                if at(i, 'CIO', 'CIE'):
+                    add('S', 'X')
+                else:
+                    add('S')
+                i += 2
+            else:
+                add('K')
+                i += 2 if at(i + 1, 'C', 'K', 'Q') and not at(i + 1, 'CE', 'CI') else 1
+        elif c == 'D':
+            if at(i, 'DG'):
+                if at(i + 2, 'I', 'E', 'Y'):
+                    # edge、judge
+                    add('J')
+                    i += 3
+                else:
+                    add('TK')
+                    i += 2
+            elif at(i, 'DT', 'DD'):
+                add('T')
+                i += 2
+            else:
+                add('T')
+                i += 1
+        elif c == 'F':
+            add('F')
+            i += 2 if at(i + 1, 'F') else 1
+        elif c == 'G':
+            if at(i + 1, 'H'):
+                if i > 0 and not vowel(i - 1):
+                    add('K')
+                elif i == 0:
+                    add('J' if at(i + 2, 'I') else 'K')
+                elif at(i - 2, 'B', 'H', 'D') or at(i - 3, 'B', 'H', 'D') or at(i - 4, 'B', 'H'):
+                    # bough、though 的 GH 不發音
+                    pass
+                elif i > 2 and w[i - 1] == 'U' and at(i - 3, 'C', 'G', 'L', 'R', 'T'):
+                    # laugh、cough、tough
+                    add('F')
+                elif i > 0 and w[i - 1] != 'I':
+                    add('K')
+                i += 2
+            elif at(i + 1, 'N'):
+                if i == 1 and vowel(0) and not slavo_germanic:
+                    add('KN', 'N')
+                elif not at(i + 2, 'EY') and not at(i + 1, 'Y') and not slavo_germanic:
+                    # sign、foreign 的 G 不發音
+                    add('N', 'KN')
+                else:
+                    add('KN')
+                i += 2
+            elif at(i + 1, 'LI') and not slavo_germanic:
+                add('KL', 'L')
+                i += 2
+            elif i == 0 and (at(i + 1, 'Y') or at(i + 1, 'ES', 'EP', 'EB', 'EL', 'EY', 'IB', 'IL', 'IN', 'IE', 'EI', 'ER')):
+                add('K', 'J')
+                i += 2
+            elif at(i + 1, 'E', 'I', 'Y') or at(i - 1, 'AGGI', 'OGGI'):
+                if at(i + 1, 'ET') or at(0, 'SCH'):
+                    add('K')
+                elif at(i + 1, 'IER'):
+                    add('J')
+                else:
+                    add('J', 'K')
+                i += 2
+            else:
+                add('K')
+                i += 2 if at(i + 1, 'G') else 1
+        elif c == 'H':
+            # 只有在母音前（字首或母音之後）才發音
+            if (i == 0 or vowel(i - 1)) and vowel(i + 1):
+                add('H')
+                i += 2
+            else:
+                i += 1
+        elif c == 'J':
+            if at(i, 'JOSE'):
+                add('H')
+            elif i == 0:
+                add('J', 'A')
+            else:
+                add('J')
+            i += 2 if at(i + 1, 'J') else 1
+        elif c == 'K':
+            add('K')
+            i += 2 if at(i + 1, 'K') else 1
+        elif c == 'L':
+            add('L')
+            i += 2 if at(i + 1, 'L') else 1
+        elif c == 'M':
+            add('M')
+            # thumb、climber 的 B 不發音
+            i += 2 if at(i + 1, 'M') or (at(i - 1, 'UMB') and (i + 1 == last or at(i + 2, 'ER'))) else 1
+        elif c == 'N':
+            add('N')
+            i += 2 if at(i + 1, 'N') else 1
+        elif c == 'P':
+            if at(i + 1, 'H'):
+                add('F')
+                i += 2
+            else:
+                add('P')
+                i += 2 if at(i + 1, 'P', 'B') else 1
+        elif c == 'Q':
+            add('K')
+            i += 2 if at(i + 1, 'Q') else 1
+        elif c == 'R':
+            add('R')
+            i += 2 if at(i + 1, 'R') else 1
+        elif c == 'S':
+            if at(i - 1, 'ISL', 'YSL'):
+                # island 的 S 不發音
+                i += 1
+            elif i == 0 and at(i, 'SUGAR'):
+                add('X', 'S')
+                i += 1
+            elif at(i, 'SH'):
+                add('X')
+                i += 2
+            elif at(i, 'SIO', 'SIA'):
+                add('S', 'X')
+                i += 3
+            elif (i == 0 and at(i + 1, 'M', 'N', 'L', 'W')) or at(i + 1, 'Z'):
+                add('S', 'X')
+                i += 2 if at(i + 1, 'Z') else 1
+            elif at(i, 'SC'):
+                if at(i + 2, 'H'):
+                    add('SK')
+                elif at(i + 2, 'I', 'E', 'Y'):
+                    add('S')
+                else:
+                    add('SK')
+                i += 3
+            else:
+                add('S')
+                i += 2 if at(i + 1, 'S', 'Z') else 1
+        elif c == 'T':
+            if at(i, 'TION', 'TIA', 'TCH'):
+                add('X')
+                i += 3
+            elif at(i, 'TH', 'TTH'):
+                if at(i + 2, 'OM', 'AM') or at(0, 'SCH'):
+                    add('T')
+                else:
+                    add('0', 'T')
+                i += 3 if at(i, 'TTH') else 2
+            else:
+                add('T')
+                i += 2 if at(i + 1, 'T', 'D') else 1
+        elif c == 'V':
+            add('F')
+            i += 2 if at(i + 1, 'V') else 1
+        elif c == 'W':
+            if at(i, 'WR'):
+                add('R')
+                i += 2
+            elif i == 0 and (vowel(i + 1) or at(i, 'WH')):
+                if vowel(i + 1):
+                    add('A', 'F')
+                else:
+                    add('A')
+                i += 1
+            elif (i == last and vowel(i - 1)) or at(i - 1, 'EWSKI', 'EWSKY', 'OWSKI', 'OWSKY'):
+                add('', 'F')
+                i += 1
+            elif at(i, 'WICZ', 'WITZ'):
+                add('TS', 'FX')
+                i += 4
+            else:
+                i += 1
+        elif c == 'X':
+            # 法文結尾的 X 不發音（例如 -eaux）
+            if not (i == last and (at(i - 3, 'IAU', 'EAU') or at(i - 2, 'AU', 'OU'))):
+                add('KS')
+            i += 2 if at(i + 1, 'C', 'X') else 1
+        elif c == 'Z':
+            if at(i + 1, 'H'):
+                add('J')
+                i += 2
+            else:
+                if at(i + 1, 'ZO', 'ZI', 'ZA') or (slavo_germanic and i > 0 and w[i - 1] != 'T'):
+                    add('S', 'TS')
+                else:
+                    add('S')
+                i += 2 if at(i + 1, 'Z') else 1
+        else:
+            i += 1
+
+    return ''.join(primary)[:KEY_LENGTH], ''.join(alternate)[:KEY_LENGTH]
+
+
+def phonetic_keys(word: str) -> List[str]:
+    """單字的發音鍵（主要鍵在前，與替代鍵相同時只有一個）"""
+    main, alt = double_metaphone(extract_base_word(word))
+    keys = [main] if main else []
+    if alt and alt != main:
+        keys.append(alt)
+    return keys
+
+
+class PhoneticIndex:
+    """發音鍵 -> 單字"""
+
+    def __init__(self, keys: Dict[str, List[str]]):
+        self.keys = keys
+
+    @classmethod
+    def build(cls, entries: List[Dict]) -> 'PhoneticIndex':
+        table: Dict[str, List[str]] = {}
+        for word in sorted({extract_base_word(e['word']) for e in entries} - {''}):
+            for key in phonetic_keys(word):
+                table.setdefault(key, []).append(word)
+        return cls(dict(sorted(table.items())))
+
+    def sound_alikes(self, word: str, limit: int = None) -> List[str]:
+        """發音鍵相同的單字（不含本身）
+        主要鍵相同的排在前面，其次依拼字的編輯距離排序；只查表與比較同一鍵下的單字，
+        與單字列表大小無關
+        """
+        base = extract_base_word(word)
+        ranked = []
+        seen = {base}
+        for rank, key in enumerate(phonetic_keys(base)):
+            for other in self.keys.get(key, ()):
+                if other not in seen:
+                    seen.add(other)
+                    ranked.append((rank, edit_distance(base, other, len(base) + len(other)), other))
+        ranked.sort()
+        found = [other for _, _, other in ranked]
+        return found[:limit] if limit is not None else found
+
+    def groups(self, min_size: int = 2) -> Dict[str, List[str]]:
+        """單字數至少 min_size 的發音鍵（同音或近音的單字組）"""
+        return {key: words for key, words in self.keys.items() if len(words) >= min_size}
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': PHONETIC_VERSION, 'keys': self.keys}, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'PhoneticIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != PHONETIC_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {data.get('version')}")
+        return cls(data['keys'])
+
+
+# 已知單字的 (主要鍵, 替代鍵)
+KNOWN_KEYS = {
+    'knight': ('NT', 'NT'),
+    'night': ('NT', 'NT'),
+    'laugh': ('LF', 'LF'),
+    'phone': ('FN', 'FN'),
+    'school': ('SKL', 'SKL'),
+    'church': ('XRX', 'XRK'),
+    'character': ('KRKT', 'KRKT'),
+    'thumb': ('0M', 'TM'),
+    'smith': ('SM0', 'XMT'),
+    'write': ('RT', 'RT'),
+    'right': ('RT', 'RT'),
+    'edge': ('AJ', 'AJ'),
+    'sign': ('SN', 'SKN'),
+    'gene': ('JN', 'KN'),
+    'accident': ('AKST', 'AKST'),
+    'island': ('ALNT', 'ALNT'),
+    'nation': ('NXN', 'NXN'),
+    'xylophone': ('SLFN', 'SLFN'),
+    'water': ('ATR', 'FTR'),
+}
+
+
+def verify() -> List[str]:
+    """檢查 KNOWN_KEYS，回傳錯誤訊息"""
+    errors = []
+    for word, expected in KNOWN_KEYS.items():
+        actual = double_metaphone(word)
+        if actual != expected:
+            errors.append(f"{word}: {actual} != {expected}")
+    return errors
+
+
+def main():
+    script_dir = Path(__file__).parent
+    args = sys.argv[1:]
+    if '--verify' in args:
+        errors = verify()
+        for error in errors:
+            print(f"  {error}")
+        if errors:
+            print(f"驗證失敗: {len(errors)} 個錯誤")
+            sys.exit(1)
+        print(f"驗證通過: {len(KNOWN_KEYS)} 個單字")
+        return
+
+    words_file = Path(args[0]) if args else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(args[1]) if len(args) > 1 else BUILD_DIR / PHONETIC_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    index = PhoneticIndex.build(entries)
+    index.save(output_file)
+    groups = index.groups()
+    print(f"共 {len(index.keys)} 個發音鍵，{len(groups)} 組發音相同的單字")
+    print(f"已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB）")
+
+    loaded = PhoneticIndex.load(output_file)
+    for word in ('right', 'there', 'knight', 'flour'):
+        print(f"  {word}: {loaded.sound_alikes(word, limit=8)}")
+
+
+if __name__ == '__main__':
+    main()
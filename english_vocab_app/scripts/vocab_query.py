@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+查詢 vocab_sqlite 產生的 SQLite 資料庫
+提供應用程式會用到的查詢：依級別（與詞性）篩選、查單字、搜尋單字或中文翻譯。
+直接執行時會與「載入 words.json 後逐筆掃描」比較結果與時間。
+
+用法: python vocab_query.py [words.db] [words.json]
+"""
+
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from vocab_core import BUILD_DIR
+from vocab_sqlite import COLUMNS, DB_NAME
+
+# trigram 斷詞只能比對 3 個字元以上的查詢
+FTS_MIN_CHARS = 3
+
+_SELECT = f"SELECT {', '.join(f'e.{column}' for column, _ in COLUMNS)} FROM entries e"
+
+
+def connect(path) -> sqlite3.Connection:
+    """以唯讀模式開啟資料庫"""
+    return sqlite3.connect(f"file:{Path(path).resolve()}?mode=ro", uri=True)
+
+
+def row_to_entry(row) -> Dict:
+    """將一列資料轉回 words.json 的欄位"""
+    return {key: value for (_, key), value in zip(COLUMNS, row)}
+
+
+def words_by_level(conn: sqlite3.Connection, level: int, part_of_speech: Optional[str] = None) -> List[Dict]:
+    """取得某個級別（可再限定詞性）的單字，順序與 words.json 相同"""
+    if part_of_speech is None:
+        rows = conn.execute(f"{_SELECT} WHERE e.level = ? ORDER BY e.id", (level,))
+    else:
+        rows = conn.execute(f"{_SELECT} WHERE e.level = ? AND e.part_of_speech = ? ORDER BY e.id",
+                            (level, part_of_speech))
+    return [row_to_entry(row) for row in rows]
+
+
+def lookup(conn: sqlite3.Connection, word: str) -> List[Dict]:
+    """查詢單字（不分大小寫，可能有多個詞性）"""
+    rows = conn.execute(f"{_SELECT} WHERE e.word = ? ORDER BY e.id", (word.strip().lower(),))
+    return [row_to_entry(row) for row in rows]
+
+
+def search(conn: sqlite3.Connection, text: str, limit: int = 50) -> List[Dict]:
+    """搜尋單字或翻譯中包含 text 的資料，順序與 words.json 相同
+    3 個字元以上使用 FTS5 索引；較短的查詢無法使用 trigram，改為逐列比對
+    """
+    text = text.strip()
+    if not text:
+        return []
+    if len(text) >= FTS_MIN_CHARS:
+        phrase = '"' + text.replace('"', '""') + '"'
+        rows = conn.execute(
+            f"{_SELECT} JOIN entries_fts f ON f.rowid = e.id "
+            f"WHERE entries_fts MATCH ? ORDER BY e.id LIMIT ?", (phrase, limit))
+    else:
+        rows = conn.execute(
+            f"{_SELECT} WHERE instr(e.word, ?) OR instr(e.translation, ?) ORDER BY e.id LIMIT ?",
+            (text.lower(), text, limit))
+    return [row_to_entry(row) for row in rows]
+
+
+# ---------------------------------------------------------------------------
+# 對照組：載入 words.json 後逐筆掃描
+
+def json_words_by_level(words: List[Dict], level: int, part_of_speech: Optional[str] = None) -> List[Dict]:
+    return [w for w in words
+            if w['level'] == level and (part_of_speech is None or w['partOfSpeech'] == part_of_speech)]
+
+
+def json_search(words: List[Dict], text: str, limit: int = 50) -> List[Dict]:
+    text = text.strip()
+    lowered = text.lower()
+    # trigram 斷詞不分大小寫，長查詢的翻譯比對也不分大小寫
+    if len(text) >= FTS_MIN_CHARS:
+        matches = (w for w in words if lowered in w['word'] or lowered in w['translation'].lower())
+    else:
+        matches = (w for w in words if lowered in w['word'] or text in w['translation'])
+    result = []
+    for w in matches:
+        result.append(w)
+        if len(result) >= limit:
+            break
+    return result
+
+
+def _best(func, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    script_dir = Path(__file__).parent
+    db_file = Path(sys.argv[1]) if len(sys.argv) > 1 else BUILD_DIR / DB_NAME
+    words_file = Path(sys.argv[2]) if len(sys.argv) > 2 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    if not db_file.exists():
+        print(f"錯誤: 找不到文件 {db_file}，請先執行 python vocab_sqlite.py")
+        sys.exit(1)
+
+    # 冷啟動: 應用程式啟動時第一次取得某個級別
+    def json_cold():
+        with open(words_file, 'r', encoding='utf-8') as f:
+            return json_words_by_level(json.load(f), 3)
+
+    def db_cold():
+        conn = connect(db_file)
+        try:
+            return words_by_level(conn, 3)
+        finally:
+            conn.close()
+
+    json_time, json_result = _best(json_cold)
+    db_time, db_result = _best(db_cold)
+    print("冷啟動取得第3級:")
+    print(f"  words.json 載入 + 掃描 {json_time * 1000:9.2f} ms")
+    print(f"  SQLite 開啟 + 查詢     {db_time * 1000:9.2f} ms   x{json_time / db_time:.1f}"
+          f"{'' if json_result == db_result else '   結果不一致!'}")
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    conn = connect(db_file)
+    queries = [
+        ('級別 2 + n.', lambda: json_words_by_level(words, 2, 'n.'), lambda: words_by_level(conn, 2, 'n.')),
+        ('查單字 apple', lambda: [w for w in words if w['word'] == 'apple'], lambda: lookup(conn, 'apple')),
+        ('搜尋 tion', lambda: json_search(words, 'tion'), lambda: search(conn, 'tion')),
+        ('搜尋 蘋果', lambda: json_search(words, '蘋果'), lambda: search(conn, '蘋果')),
+        ('搜尋 不喜歡', lambda: json_search(words, '不喜歡'), lambda: search(conn, '不喜歡')),
+        ('搜尋 xyzzy（無結果）', lambda: json_search(words, 'xyzzy'), lambda: search(conn, 'xyzzy')),
+    ]
+    print("\n已載入後的查詢（JSON 為逐筆掃描）:")
+    for label, json_query, db_query in queries:
+        json_time, json_result = _best(json_query)
+        db_time, db_result = _best(db_query)
+        same = '' if json_result == db_result else '   結果不一致!'
+        print(f"  {label:<18} JSON {json_time * 1000:8.3f} ms   SQLite {db_time * 1000:8.3f} ms"
+              f"   {len(db_result):3d} 筆{same}")
+    conn.close()
+
+
+if __name__ == '__main__':
+    main()
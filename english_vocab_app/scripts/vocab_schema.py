@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+words.json 的精簡格式（schema v2）
+v1（words.json）是 indent=2 的單字陣列，每筆都帶有可由 word 推導的 cambridgeUrl
+與一律為空的 exampleEn / exampleZh / audioUrl。v2 改為：
+
+  {"version": 2, "words": [{"w": 單字, "t": 翻譯, "p": 詞性, "l": 級別}, ...]}
+
+不縮排、使用短鍵名，省略空白欄位；只有 cambridgeUrl 不是由 word 推導時才寫出 "u"。
+expand_v2 / load_words 會還原成與 WordEntry.fromJson 相同的完整欄位
+（Dart 端對應 WordEntry.decodeV2）。
+
+應用程式讀取 words.json 與同樣使用這個格式的級別分片（見 vocab_shards），
+完整的 words_v2.json 輸出到 build/vocab/，供其他用途使用，不打包進應用程式。
+
+用法: python vocab_schema.py [words.json]   由現有的 words.json 產生 build/vocab/words_v2.json
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from vocab_core import BUILD_DIR, CAMBRIDGE_URL_PREFIX
+
+SCHEMA_VERSION = 2
+V2_NAME = 'words_v2.json'
+
+# 完整欄位 -> 短鍵名
+SHORT_KEYS = {
+    'word': 'w',
+    'translation': 't',
+    'partOfSpeech': 'p',
+    'exampleEn': 'ee',
+    'exampleZh': 'ez',
+    'cambridgeUrl': 'u',
+    'level': 'l',
+    'audioUrl': 'a',
+}
+
+# Dart 的 \w 只比對 ASCII，推導規則以兩端都能重現的 ASCII 版本為準
+_DERIVED_SLUG_RE = re.compile(r'[^A-Za-z0-9_\-]')
+
+
+def derived_url(word: str) -> str:
+    """由 word 推導的 cambridgeUrl（與 Dart 端 WordEntry.decodeV2 相同）"""
+    return CAMBRIDGE_URL_PREFIX + _DERIVED_SLUG_RE.sub('', word)
+
+
+def compact_entry(entry: Dict) -> Dict:
+    """將一筆完整資料轉為 v2 的短鍵名格式"""
+    compact = {
+        'w': entry['word'],
+        't': entry['translation'],
+        'p': entry['partOfSpeech'],
+        'l': entry['level'],
+    }
+    for key in ('exampleEn', 'exampleZh', 'audioUrl'):
+        if entry.get(key):
+            compact[SHORT_KEYS[key]] = entry[key]
+    if entry['cambridgeUrl'] != derived_url(entry['word']):
+        compact['u'] = entry['cambridgeUrl']
+    return compact
+
+
+def expand_entry(compact: Dict) -> Dict:
+    """將 v2 的一筆資料還原成完整欄位（欄位順序與 v1 相同）"""
+    word = compact['w']
+    url = compact.get('u')
+    return {
+        'word': word,
+        'translation': compact['t'],
+        'partOfSpeech': compact['p'],
+        'exampleEn': compact.get('ee', ''),
+        'exampleZh': compact.get('ez', ''),
+        'cambridgeUrl': derived_url(word) if url is None else url,
+        'level': compact['l'],
+        'audioUrl': compact.get('a', ''),
+    }
+
+
+def encode_v2(words: List[Dict]) -> bytes:
+    """編碼為 v2 文件內容"""
+    doc = {'version': SCHEMA_VERSION, 'words': [compact_entry(w) for w in words]}
+    return json.dumps(doc, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def expand_v2(doc: Dict) -> List[Dict]:
+    """將已解碼的 v2 文件還原成 v1 的單字列表"""
+    if doc.get('version') != SCHEMA_VERSION:
+        raise ValueError(f"不支援的 schema 版本: {doc.get('version')}")
+    return [expand_entry(c) for c in doc['words']]
+
+
+def load_words(path) -> List[Dict]:
+    """讀取 v1 或 v2 文件，一律回傳完整欄位的單字列表"""
+    with open(path, 'r', encoding='utf-8') as f:
+        doc = json.load(f)
+    if isinstance(doc, list):
+        return doc
+    return expand_v2(doc)
+
+
+def write_v2(words: List[Dict], output_dir) -> Dict:
+    """在 output_dir 寫出 words_v2.json，回傳 {'path', 'v2_bytes'}
+    解碼時間的比較見 bench_vocab.py schema
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    v2_data = encode_v2(words)
+    path = output_dir / V2_NAME
+    path.write_bytes(v2_data)
+    return {'path': path, 'v2_bytes': len(v2_data)}
+
+
+def print_schema_report(report: Dict, v1_bytes: int) -> None:
+    """列印 v2 與 v1（words.json 的位元組數）的大小比較"""
+    saved = 1 - report['v2_bytes'] / v1_bytes if v1_bytes else 0
+    print(f"schema v2: {report['v2_bytes'] / 1024:.1f} KB（v1 {v1_bytes / 1024:.1f} KB，減少 {saved:.1%}）")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    report = write_v2(words, BUILD_DIR)
+    print_schema_report(report, words_file.stat().st_size)
+
+    restored = load_words(report['path'])
+    if restored != words:
+        print("錯誤: words_v2.json 還原後與 words.json 不同")
+        sys.exit(1)
+    print(f"\n已保存到 {report['path']}（已確認可還原成與 words.json 相同的內容）")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+英文單字的前綴索引與後綴陣列
+應用程式的搜尋框每輸入一個字就要查一次，逐筆掃描整個單字列表太慢。
+建置時先準備好：
+
+  前綴索引  依字母排序的單字陣列（附對應的 words.json 位置），前綴查詢用二分搜尋找出範圍
+  後綴陣列  排序後單字以 "\\n" 相接成一段文字，記錄所有後綴依字典序的起點，
+            任意子字串查詢同樣以二分搜尋找出範圍
+
+兩者共用同一份排序後的單字。有安裝 numpy 時以倍增法建立後綴陣列，否則直接排序。
+
+索引文件格式（little-endian）:
+  檔頭      magic "VSIX"、版本、單字數、文字長度（bytes）、後綴數
+  文字      排序後單字以 "\\n" 相接（UTF-8）
+  位置      每個單字一個 uint32，為 words.json 中的索引
+  後綴陣列  每個後綴一個 uint32，為文字中的字元位置
+
+用法: python vocab_search.py [words.json] [輸出.idx]   預設輸出 build/vocab/words_search.idx
+"""
+
+import bisect
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from vocab_core import BUILD_DIR
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MAGIC = b'VSIX'
+INDEX_VERSION = 1
+INDEX_NAME = 'words_search.idx'
+
+_HEADER = struct.Struct('<4sHHIII')
+_SEPARATOR = '\n'
+
+
+def normalize(text: str) -> str:
+    """查詢與單字使用相同的正規化（小寫、去除前後空白）"""
+    return text.strip().lower()
+
+
+def _suffix_array_numpy(text: str) -> List[int]:
+    """倍增法建立後綴陣列；每個分隔符號給予不同且最小的排名，比較不會越過單字邊界"""
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+    n = len(codes)
+    is_sep = codes == ord(_SEPARATOR)
+    separators = int(is_sep.sum())
+    rank = codes + separators
+    rank[is_sep] = np.arange(separators)
+
+    step = 1
+    while True:
+        second = np.full(n, -1, dtype=np.int64)
+        second[:n - step] = rank[step:]
+        order = np.lexsort((second, rank))
+        first_sorted = rank[order]
+        second_sorted = second[order]
+        changed = np.empty(n, dtype=bool)
+        changed[0] = False
+        changed[1:] = (first_sorted[1:] != first_sorted[:-1]) | (second_sorted[1:] != second_sorted[:-1])
+        rank = np.empty(n, dtype=np.int64)
+        rank[order] = np.cumsum(changed)
+        if rank.max() == n - 1:
+            break
+        step *= 2
+    # 分隔符號本身不是可查詢的後綴
+    return order[separators:].tolist()
+
+
+def _suffix_array_python(text: str) -> List[int]:
+    positions = [i for i, c in enumerate(text) if c != _SEPARATOR]
+    return sorted(positions, key=lambda i: text[i:text.find(_SEPARATOR, i)])
+
+
+def build_suffix_array(text: str) -> List[int]:
+    """文字中所有非分隔符號位置，依該位置到單字結尾的後綴排序"""
+    if not text.endswith(_SEPARATOR):
+        raise ValueError("文字必須以分隔符號結尾")
+    if np is not None:
+        return _suffix_array_numpy(text)
+    return _suffix_array_python(text)
+
+
+class SearchIndex:
+    """前綴與子字串查詢；查詢結果為 words.json 中的索引（依單字字母順序）"""
+
+    def __init__(self, words: List[str], ids: List[int], suffixes: List[int]):
+        self.words = words
+        self.ids = ids
+        self.suffixes = suffixes
+        self.text = ''.join(w + _SEPARATOR for w in words)
+        # 文字位置 -> 單字序號（含分隔符號）
+        self._word_at = array('I')
+        for number, w in enumerate(words):
+            self._word_at.extend(array('I', [number]) * (len(w) + 1))
+
+    @classmethod
+    def build(cls, entries: List[Dict]) -> 'SearchIndex':
+        pairs = sorted((normalize(e['word']), i) for i, e in enumerate(entries))
+        words = [w for w, _ in pairs]
+        ids = [i for _, i in pairs]
+        text = ''.join(w + _SEPARATOR for w in words)
+        return cls(words, ids, build_suffix_array(text))
+
+    def prefix_range(self, query: str) -> Tuple[int, int]:
+        """以 query 開頭的單字在排序陣列中的範圍 [lo, hi)"""
+        query = normalize(query)
+        lo = bisect.bisect_left(self.words, query)
+        hi = bisect.bisect_left(self.words, query + '\U0010ffff', lo)
+        return lo, hi
+
+    def prefix(self, query: str, limit: int = None) -> List[int]:
+        """以 query 開頭的單字"""
+        lo, hi = self.prefix_range(query)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self.ids[lo:hi]
+
+    def substring(self, query: str, limit: int = None) -> List[int]:
+        """包含 query 的單字（每個單字只出現一次，依字母順序）"""
+        query = normalize(query)
+        if not query:
+            return []
+        text = self.text
+        size = len(query)
+
+        def key(i):
+            return text[i:i + size]
+
+        lo = bisect.bisect_left(self.suffixes, query, key=key)
+        hi = bisect.bisect_right(self.suffixes, query, lo, key=key)
+        word_at = self._word_at
+        found = sorted({word_at[pos] for pos in self.suffixes[lo:hi]})
+        if limit is not None:
+            found = found[:limit]
+        return [self.ids[w] for w in found]
+
+    def encode(self) -> bytes:
+        text = self.text.encode('utf-8')
+        header = _HEADER.pack(MAGIC, INDEX_VERSION, 0, len(self.words), len(text), len(self.suffixes))
+        return (header + text + array('I', self.ids).tobytes()
+                + array('I', self.suffixes).tobytes())
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'SearchIndex':
+        data = Path(path).read_bytes()
+        magic, version, _, count, text_size, suffix_count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是搜尋索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+        offset = _HEADER.size
+        text = data[offset:offset + text_size].decode('utf-8')
+        offset += text_size
+        ids = array('I')
+        ids.frombytes(data[offset:offset + 4 * count])
+        offset += 4 * count
+        suffixes = array('I')
+        suffixes.frombytes(data[offset:offset + 4 * suffix_count])
+        if sys.byteorder != 'little':
+            ids.byteswap()
+            suffixes.byteswap()
+        words = text.split(_SEPARATOR)[:-1] if text else []
+        return cls(words, ids.tolist(), suffixes.tolist())
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else BUILD_DIR / INDEX_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    index = SearchIndex.build(entries)
+    index.save(output_file)
+    print(f"共 {len(index.words)} 個單字、{len(index.suffixes)} 個後綴")
+    print(f"已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB）")
+
+    loaded = SearchIndex.load(output_file)
+    for query in ('app', 'tion'):
+        print(f"  前綴 {query!r}: {[entries[i]['word'] for i in loaded.prefix(query, limit=5)]}")
+        print(f"  子字串 {query!r}: {[entries[i]['word'] for i in loaded.substring(query, limit=5)]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+words.json 的分片輸出
+除了完整的 words.json，另外輸出：
+  - 每個級別一個分片: words_level_<級別>.json（與 words.json 同一資料夾，會打包進應用程式）
+  - 固定大小的分頁分片: words_page_<序號>.json（build/vocab/pages/，應用程式不讀取，不打包）
+  - 兩個資料夾各有一份清單 words_manifest.json，記錄該資料夾中每個分片的筆數、大小與 SHA-256
+應用程式只需要某個級別時，載入對應的分片即可，不必解碼整個 words.json；
+可用的級別由清單得知。分片使用精簡格式（見 vocab_schema），由 WordEntry.decodeV2 解碼。
+
+分片以多執行緒並行寫出，每個分片先寫暫存檔再以 os.replace 原子改名；
+內容與清單記錄相同的分片不會重寫，清單中已經不存在的分片會刪除。清單最後寫出。
+
+用法: python vocab_shards.py [words.json]   由現有的 words.json 重新產生分片
+"""
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SHARD_VERSION = 2
+PAGE_SIZE = 500
+MANIFEST_NAME = 'words_manifest.json'
+# build/vocab/ 下放分頁分片的資料夾
+PAGES_DIR_NAME = 'pages'
+
+
+def _level_name(level) -> str:
+    return f"words_level_{level}.json"
+
+
+def _page_name(index: int) -> str:
+    return f"words_page_{index:03d}.json"
+
+
+def encode_shard(words: List[Dict]) -> bytes:
+    """分片使用精簡格式（schema v2），可直接由 WordEntry.decodeV2 解碼"""
+    # vocab_schema 經由 vocab_core 匯入本模組，在此延後匯入以避免循環
+    import vocab_schema
+    return vocab_schema.encode_v2(words)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _load_manifest(output_dir: Path) -> Dict:
+    try:
+        with open(output_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_group(output_dir: Path, kind: str, jobs: List[Tuple[Dict, List[Dict]]],
+                 manifest: Dict, workers: int) -> int:
+    """在 output_dir 寫出一組分片與清單（manifest 加上 kind 欄位），回傳重寫的分片數"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    old_manifest = _load_manifest(output_dir)
+    old_checksums = {
+        item['file']: item['sha256']
+        for old_kind in ('levels', 'pages')
+        for item in old_manifest.get(old_kind, [])
+    }
+
+    def write(job):
+        info, shard_words = job
+        data = encode_shard(shard_words)
+        checksum = hashlib.sha256(data).hexdigest()
+        path = output_dir / info['file']
+        written = not (old_checksums.get(info['file']) == checksum and path.exists())
+        if written:
+            _write_atomic(path, data)
+        return dict(info, count=len(shard_words), bytes=len(data), sha256=checksum), written
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(write, jobs))
+    manifest[kind] = [info for info, _ in results]
+
+    # 刪除已經不存在的分片（包括舊版清單中寫在這個資料夾的另一類分片）
+    current = {info['file'] for info, _ in results}
+    for stale in set(old_checksums) - current:
+        try:
+            (output_dir / stale).unlink()
+        except FileNotFoundError:
+            pass
+
+    _write_atomic(output_dir / MANIFEST_NAME,
+                  json.dumps(manifest, ensure_ascii=False, indent=2).encode('utf-8'))
+    return sum(1 for _, written in results if written)
+
+
+def write_shards(words: List[Dict], output_dir, page_size: int = PAGE_SIZE, workers: int = 8,
+                 pages_dir=None) -> Dict:
+    """在 output_dir 輸出級別分片、在 pages_dir（預設 build/vocab/pages/）輸出分頁分片，
+    兩邊各寫一份清單，回傳合併的清單內容（'written' 為重寫的分片數）
+    """
+    if pages_dir is None:
+        from vocab_core import BUILD_DIR
+        pages_dir = BUILD_DIR / PAGES_DIR_NAME
+
+    by_level: Dict[int, List[Dict]] = {}
+    for w in words:
+        by_level.setdefault(w['level'], []).append(w)
+    level_jobs = [({'level': level, 'file': _level_name(level)}, by_level[level]) for level in sorted(by_level)]
+    page_jobs = [
+        ({'index': index, 'file': _page_name(index), 'start': start}, words[start:start + page_size])
+        for index, start in enumerate(range(0, len(words), page_size))
+    ]
+
+    level_manifest = {'version': SHARD_VERSION, 'total': len(words)}
+    page_manifest = {'version': SHARD_VERSION, 'total': len(words), 'pageSize': page_size}
+    written = _write_group(Path(output_dir), 'levels', level_jobs, level_manifest, workers)
+    written += _write_group(Path(pages_dir), 'pages', page_jobs, page_manifest, workers)
+    return dict(page_manifest, levels=level_manifest['levels'], pagesDir=Path(pages_dir), written=written)
+
+
+def print_shard_summary(manifest: Dict) -> None:
+    """列印分片統計"""
+    shard_count = len(manifest['levels']) + len(manifest['pages'])
+    print(f"已輸出 {len(manifest['levels'])} 個級別分片、{len(manifest['pages'])} 個分頁分片"
+          f"（重寫 {manifest['written']} / {shard_count} 個）")
+    for item in manifest['levels']:
+        print(f"  {item['file']}: {item['count']} 個，{item['bytes'] / 1024:.1f} KB")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    manifest = write_shards(words, words_file.parent)
+    print_shard_summary(manifest)
+    print(f"\n清單已保存到 {words_file.parent / MANIFEST_NAME}、{manifest['pagesDir'] / MANIFEST_NAME}")
+
+
+if __name__ == '__main__':
+    main()
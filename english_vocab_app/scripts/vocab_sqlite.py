@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+將單字資料輸出為 SQLite 資料庫（words.json 以外的另一種資料格式）
+
+  entries       每筆單字一列，欄位與 words.json 相同
+  entries_fts   word / translation 的 FTS5 全文索引（external content，不重複儲存內容）
+
+另有 level、part_of_speech 與 word 的索引。FTS5 使用 trigram 斷詞，
+可以搜尋單字或中文翻譯中的任意子字串（3 個字元以上；較短的查詢見 vocab_query.search）。
+
+全部資料在同一個交易內以 executemany 批次寫入，先寫暫存檔再改名。
+
+用法: python vocab_sqlite.py [words.json] [輸出.db]   預設輸出 build/vocab/words.db
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from vocab_core import BUILD_DIR
+
+DB_NAME = 'words.db'
+SCHEMA_VERSION = 1
+
+# 資料表欄位 -> words.json 欄位
+COLUMNS = (
+    ('word', 'word'),
+    ('translation', 'translation'),
+    ('part_of_speech', 'partOfSpeech'),
+    ('example_en', 'exampleEn'),
+    ('example_zh', 'exampleZh'),
+    ('cambridge_url', 'cambridgeUrl'),
+    ('level', 'level'),
+    ('audio_url', 'audioUrl'),
+)
+
+_SCHEMA = f"""
+CREATE TABLE entries (
+    id INTEGER PRIMARY KEY,
+    word TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    part_of_speech TEXT NOT NULL,
+    example_en TEXT NOT NULL DEFAULT '',
+    example_zh TEXT NOT NULL DEFAULT '',
+    cambridge_url TEXT NOT NULL,
+    level INTEGER NOT NULL,
+    audio_url TEXT
+);
+CREATE INDEX idx_entries_level ON entries(level, part_of_speech);
+CREATE INDEX idx_entries_pos ON entries(part_of_speech);
+CREATE INDEX idx_entries_word ON entries(word);
+CREATE VIRTUAL TABLE entries_fts USING fts5(
+    word, translation, content='entries', content_rowid='id', tokenize='trigram'
+);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+def build_database(words: List[Dict], output_file) -> Dict:
+    """建立資料庫，回傳 {'path', 'rows', 'seconds', 'bytes'}"""
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    if tmp_file.exists():
+        tmp_file.unlink()
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(tmp_file)
+    try:
+        # 建立期間不需要崩潰保護，最後整個文件改名
+        conn.execute('PRAGMA journal_mode = OFF')
+        conn.execute('PRAGMA synchronous = OFF')
+        conn.executescript(_SCHEMA)
+        names = [column for column, _ in COLUMNS]
+        insert = (f"INSERT INTO entries (id, {', '.join(names)}) "
+                  f"VALUES (?, {', '.join('?' * len(names))})")
+        with conn:
+            conn.executemany(insert, (
+                (row_id, *(w.get(key) for _, key in COLUMNS))
+                for row_id, w in enumerate(words, 1)
+            ))
+            conn.execute("INSERT INTO entries_fts (rowid, word, translation) "
+                         "SELECT id, word, translation FROM entries")
+        conn.execute('ANALYZE')
+        conn.execute('VACUUM')
+    finally:
+        conn.close()
+    os.replace(tmp_file, output_file)
+
+    return {
+        'path': output_file,
+        'rows': len(words),
+        'seconds': time.perf_counter() - start,
+        'bytes': output_file.stat().st_size,
+    }
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else BUILD_DIR / DB_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        words = json.load(f)
+    result = build_database(words, output_file)
+    print(f"共 {result['rows']} 個單字，耗時 {result['seconds'] * 1000:.1f} ms")
+    print(f"已保存到 {result['path']}（{result['bytes'] / 1024:.1f} KB）")
+
+
+if __name__ == '__main__':
+    main()
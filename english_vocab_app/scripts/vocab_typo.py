@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+容錯拼字查詢（symmetric delete）
+拼字作答時需要在整個單字列表中找出編輯距離 1 或 2 以內的單字，逐一計算距離太慢。
+
+建置時對每個單字（extract_base_word 正規化後）產生刪除最多 max_distance 個字元的所有變體，
+記錄「變體 -> 單字」。查詢時對輸入做同樣的刪除：距離在 k 以內的兩個字串，
+各刪除最多 k 個字元後一定有相同的變體，因此只需查出共同變體的單字，
+再以帶狀編輯距離確認（見 vocab_confusables.edit_distance）。
+距離採 optimal string alignment：相鄰兩字母對調（recieve -> receive）算一次編輯，
+這是最常見的拼錯；對調的兩個字母各刪去一個後相同，刪除變體一樣能找到。
+
+索引文件格式（little-endian）:
+  檔頭      magic "VTYP"、版本、max_distance、單字數、單字表長度、變體數、變體表長度、倒排資料長度
+  單字表    單字以 "\\n" 相接（UTF-8），位置即為單字編號
+  變體表    依字典序排序的變體，以 "\\n" 相接（UTF-8）
+  位置      變體數 + 1 個 uint32，為各變體倒排列表在倒排資料中的起點
+  倒排資料  每個列表為遞增的單字編號，以差值 + varint 壓縮（見 vocab_zh_index）
+
+用法: python vocab_typo.py [words.json] [輸出.idx] [--max-distance 2]
+預設輸出 build/vocab/words_typo.idx
+"""
+
+import argparse
+import bisect
+import json
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from vocab_confusables import deletions, edit_distance
+from vocab_core import BUILD_DIR, extract_base_word
+from vocab_zh_index import decode_postings, encode_postings
+
+MAGIC = b'VTYP'
+INDEX_VERSION = 1
+INDEX_NAME = 'words_typo.idx'
+MAX_DISTANCE = 2
+
+_HEADER = struct.Struct('<4sHHIIIII')
+
+
+class TypoIndex:
+    """編輯距離在 max_distance 以內的單字查詢"""
+
+    def __init__(self, words: List[str], max_distance: int, variants: List[str], offsets, postings: bytes):
+        self.words = words
+        self.max_distance = max_distance
+        self.variants = variants
+        self.offsets = offsets
+        self.postings = postings
+
+    @classmethod
+    def build(cls, entries: List[Dict], max_distance: int = MAX_DISTANCE) -> 'TypoIndex':
+        words = sorted({extract_base_word(e['word']) for e in entries} - {''})
+        table: Dict[str, List[int]] = {}
+        for i, word in enumerate(words):
+            for variant in deletions(word, max_distance):
+                table.setdefault(variant, []).append(i)
+        variants = sorted(table)
+        offsets = array('I', [0])
+        blob = bytearray()
+        for variant in variants:
+            blob.extend(encode_postings(table[variant]))
+            offsets.append(len(blob))
+        return cls(words, max_distance, variants, offsets, bytes(blob))
+
+    def _postings(self, variant: str) -> List[int]:
+        i = bisect.bisect_left(self.variants, variant)
+        if i == len(self.variants) or self.variants[i] != variant:
+            return []
+        return decode_postings(self.postings, self.offsets[i], self.offsets[i + 1])
+
+    def lookup(self, query: str, max_distance: int = 1, limit: int = None) -> List[Tuple[str, int]]:
+        """距離在 max_distance 以內的單字 [(單字, 距離), ...]，依距離、字母順序排序"""
+        if max_distance > self.max_distance:
+            raise ValueError(f"索引只支援距離 {self.max_distance} 以內的查詢")
+        query = extract_base_word(query)
+        if not query:
+            return []
+        candidates = set()
+        for variant in deletions(query, max_distance):
+            candidates.update(self._postings(variant))
+        found = []
+        for i in candidates:
+            word = self.words[i]
+            distance = edit_distance(query, word, max_distance, transpositions=True)
+            if distance <= max_distance:
+                found.append((distance, word))
+        found.sort()
+        if limit is not None:
+            found = found[:limit]
+        return [(word, distance) for distance, word in found]
+
+    def encode(self) -> bytes:
+        words = '\n'.join(self.words).encode('utf-8')
+        variants = '\n'.join(self.variants).encode('utf-8')
+        header = _HEADER.pack(MAGIC, INDEX_VERSION, self.max_distance, len(self.words), len(words),
+                              len(self.variants), len(variants), len(self.postings))
+        return header + words + variants + array('I', self.offsets).tobytes() + self.postings
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'TypoIndex':
+        data = Path(path).read_bytes()
+        (magic, version, max_distance, word_count, words_size,
+         variant_count, variants_size, postings_size) = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是拼字索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+        offset = _HEADER.size
+        words = data[offset:offset + words_size].decode('utf-8').split('\n') if word_count else []
+        offset += words_size
+        variants = data[offset:offset + variants_size].decode('utf-8').split('\n') if variant_count else []
+        offset += variants_size
+        offsets = array('I')
+        offsets.frombytes(data[offset:offset + 4 * (variant_count + 1)])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        offset += 4 * (variant_count + 1)
+        return cls(words, max_distance, variants, offsets, data[offset:offset + postings_size])
+
+
+def brute_force(query: str, words: List[str], max_distance: int = 1) -> List[Tuple[str, int]]:
+    """對照組：逐一計算編輯距離（結果與 TypoIndex.lookup 相同）"""
+    query = extract_base_word(query)
+    found = sorted((d, w) for w in words
+                   for d in (edit_distance(query, w, max_distance, transpositions=True),) if d <= max_distance)
+    return [(w, d) for d, w in found]
+
+
+def main():
+    script_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description='建立容錯拼字查詢的索引')
+    parser.add_argument('words_file', nargs='?', type=Path,
+                        default=script_dir.parent / 'assets' / 'data' / 'words.json')
+    parser.add_argument('output', nargs='?', type=Path, default=BUILD_DIR / INDEX_NAME)
+    parser.add_argument('--max-distance', type=int, default=MAX_DISTANCE)
+    args = parser.parse_args()
+    if not args.words_file.exists():
+        print(f"錯誤: 找不到文件 {args.words_file}")
+        sys.exit(1)
+
+    with open(args.words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    index = TypoIndex.build(entries, args.max_distance)
+    index.save(args.output)
+    print(f"共 {len(index.words)} 個單字、{len(index.variants)} 個刪除變體")
+    print(f"已保存到 {args.output}（{args.output.stat().st_size / 1024:.1f} KB）")
+
+    loaded = TypoIndex.load(args.output)
+    for query in ('recieve', 'becuase', 'adress'):
+        print(f"  {query}: {loaded.lookup(query, max_distance=min(2, loaded.max_distance), limit=5)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+其他寫法與詞形變化 -> 單字（雜湊表）
+words.json 只保留基本形式：agree(ment) 只剩 agree、a/an 只剩 a、he (him, his, himself) 只剩 he。
+建置時把這些寫法（見 vocab_core.normalize_headword）與規則的詞形變化
+（名詞複數、動詞 -s / -ed / -ing）都對應到 words.json 的索引，
+輸入 agreement、an、his、studies、stopped 都能直接查到單字。
+
+同一個寫法對應到多個單字時，優先順序為:
+  1. 單字本身（words.json 中的基本形式）
+  2. 來源資料中的其他寫法
+  3. 規則產生的詞形變化
+同一優先順序內以 words.json 中較前面的單字為準。
+
+輸出 build/vocab/words_variants.json:
+  {"version": 1, "count": 單字數, "variants": {"agreement": 索引, ...}}
+
+用法: python vocab_variants.py [words.json] [vocab_data.txt] [輸出.json]
+"""
+
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from vocab_core import BUILD_DIR, normalize_cache_stats, normalize_headword, split_row
+from vocab_facets import normalize_pos
+
+VARIANTS_NAME = 'words_variants.json'
+VARIANTS_VERSION = 1
+
+_SIBILANT_RE = re.compile(r'(s|x|z|ch|sh)$')
+_CONSONANT_Y_RE = re.compile(r'[^aeiou]y$')
+# 單音節、子音 + 母音 + 子音結尾時重複字尾（stop -> stopped）
+_DOUBLE_RE = re.compile(r'^[^aeiou]*[aeiou][^aeiouwxy]$')
+
+
+def _plural(word: str) -> str:
+    """名詞複數"""
+    if _SIBILANT_RE.search(word):
+        return word + 'es'
+    if _CONSONANT_Y_RE.search(word):
+        return word[:-1] + 'ies'
+    return word + 's'
+
+
+def _third_person(word: str) -> str:
+    """動詞第三人稱單數（go -> goes、do -> does）"""
+    if word.endswith('o') and not word.endswith('oo'):
+        return word + 'es'
+    return _plural(word)
+
+
+def _past(word: str) -> str:
+    if word.endswith('e'):
+        return word + 'd'
+    if _CONSONANT_Y_RE.search(word):
+        return word[:-1] + 'ied'
+    if _DOUBLE_RE.match(word):
+        return word + word[-1] + 'ed'
+    return word + 'ed'
+
+
+def _progressive(word: str) -> str:
+    if word.endswith('ie'):
+        return word[:-2] + 'ying'
+    if word.endswith('e') and not word.endswith(('ee', 'ye', 'oe')) and len(word) > 2:
+        return word[:-1] + 'ing'
+    if _DOUBLE_RE.match(word):
+        return word + word[-1] + 'ing'
+    return word + 'ing'
+
+
+def inflections(word: str, part_of_speech: str) -> List[str]:
+    """依詞性產生規則的詞形變化；片語與非字母的單字不處理"""
+    if not word.isalpha():
+        return []
+    pos = normalize_pos(part_of_speech)
+    forms: List[str] = []
+    if 'n.' in pos:
+        forms.append(_plural(word))
+    if 'v.' in pos:
+        forms.append(_third_person(word))
+        forms.append(_past(word))
+        forms.append(_progressive(word))
+    return list(dict.fromkeys(forms))
+
+
+def source_headwords(lines: Iterable[str]) -> Iterable[str]:
+    """來源資料每一行的原始單字欄位"""
+    for line in lines:
+        row = split_row(line)
+        if row is not None:
+            yield row[1]
+
+
+class VariantMap:
+    """寫法 -> words.json 索引"""
+
+    def __init__(self, count: int, variants: Dict[str, int]):
+        self.count = count
+        self.variants = variants
+
+    @classmethod
+    def build(cls, entries: List[Dict], headwords: Iterable[str] = ()) -> 'VariantMap':
+        """headwords 為來源資料的原始單字欄位（例如 "agree(ment)"），用來找出其他寫法"""
+        index = {}
+        for i, entry in enumerate(entries):
+            index.setdefault(entry['word'], i)
+
+        variants = dict(index)
+        for raw in headwords:
+            base, forms, _ = normalize_headword(raw)
+            i = index.get(base)
+            if i is None:
+                continue
+            for form in forms:
+                variants.setdefault(form, i)
+        for i, entry in enumerate(entries):
+            for form in inflections(entry['word'], entry['partOfSpeech']):
+                variants.setdefault(form, i)
+        return cls(len(entries), variants)
+
+    def resolve(self, word: str) -> Optional[int]:
+        """寫法對應的 words.json 索引，找不到時回傳 None"""
+        i = self.variants.get(word.strip().lower())
+        if i is None:
+            i = self.variants.get(normalize_headword(word)[0])
+        return i
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': VARIANTS_VERSION, 'count': self.count, 'variants': self.variants},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'VariantMap':
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != VARIANTS_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {data.get('version')}")
+        return cls(data['count'], data['variants'])
+
+
+def print_cache_stats() -> None:
+    """列印 normalize_headword 的快取命中率"""
+    stats = normalize_cache_stats()
+    print(f"單字正規化快取: 命中 {stats['hits']} 次、未命中 {stats['misses']} 次"
+          f"（命中率 {stats['hit_rate']:.1%}，{stats['size']}/{stats['maxsize']}）")
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    source_file = Path(sys.argv[2]) if len(sys.argv) > 2 else script_dir / 'vocab_data.txt'
+    output_file = Path(sys.argv[3]) if len(sys.argv) > 3 else BUILD_DIR / VARIANTS_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    lines = []
+    if source_file.exists():
+        with open(source_file, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+    else:
+        print(f"找不到 {source_file}，只產生詞形變化")
+    variant_map = VariantMap.build(entries, source_headwords(lines))
+    variant_map.save(output_file)
+    print(f"共 {len(variant_map.variants)} 個寫法對應到 {variant_map.count} 個單字")
+    print(f"已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB）")
+    print_cache_stats()
+
+    loaded = VariantMap.load(output_file)
+    for word in ('agreement', 'an', 'his', 'studies', 'stopped'):
+        i = loaded.resolve(word)
+        print(f"  {word} -> {entries[i]['word'] if i is not None else None}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+中文翻譯的倒排索引（中文 -> 英文查詢）
+translation 欄位例如 "一個/一個"、"有能力的"，原本只能逐筆做子字串比對。
+建置時將每筆翻譯依義項分隔符號（/ ； , 、 等）切開，去除括號與標點後，
+取每個義項的單字元（unigram）與相鄰兩字元（bigram）作為詞彙，記錄出現的單字編號。
+
+查詢時將查詢字串切成 bigram（只有一個字時用 unigram），從最短的倒排列表開始求交集，
+再以實際的子字串比對排除誤判並排序：完全符合某個義項 > 義項開頭符合 > 義項較短 > 原順序。
+
+索引文件格式（little-endian）:
+  檔頭      magic "VZIX"、版本、詞彙數、詞彙表長度（bytes）、倒排資料長度（bytes）
+  詞彙表    依字典序排序的詞彙，以 "\\n" 相接（UTF-8）
+  位置      詞彙數 + 1 個 uint32，為各詞彙倒排列表在倒排資料中的起點
+  倒排資料  每個列表為遞增的單字編號，以差值 + varint 壓縮
+
+用法: python vocab_zh_index.py [words.json] [輸出.idx]   預設輸出 build/vocab/words_zh.idx
+"""
+
+import bisect
+import json
+import re
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+from vocab_core import BUILD_DIR
+
+MAGIC = b'VZIX'
+INDEX_VERSION = 1
+INDEX_NAME = 'words_zh.idx'
+
+_HEADER = struct.Struct('<4sHHIII')
+
+# 義項分隔符號
+SENSE_SPLIT_RE = re.compile(r'[/／;；,，、]')
+# 建立詞彙前去除的括號、空白與標點
+_DROP_RE = re.compile(r'[\s()（）「」『』\[\]【】<>《》〈〉~～…．.。:：!！?？"\'“”‘’·-]')
+
+
+def split_senses(translation: str) -> List[str]:
+    """切出義項並去除標點，略過空的義項"""
+    senses = []
+    for part in SENSE_SPLIT_RE.split(translation):
+        sense = _DROP_RE.sub('', part).lower()
+        if sense:
+            senses.append(sense)
+    return senses
+
+
+def sense_grams(sense: str) -> Iterable[str]:
+    """一個義項的 unigram 與 bigram"""
+    yield from sense
+    for i in range(len(sense) - 1):
+        yield sense[i:i + 2]
+
+
+def tokenize(translation: str) -> Set[str]:
+    """一筆翻譯的所有詞彙"""
+    grams = set()
+    for sense in split_senses(translation):
+        grams.update(sense_grams(sense))
+    return grams
+
+
+def query_grams(query: str) -> List[str]:
+    """查詢用的詞彙：bigram（只有一個字時用 unigram）"""
+    grams = []
+    for sense in split_senses(query):
+        if len(sense) == 1:
+            grams.append(sense)
+        else:
+            grams.extend(sense[i:i + 2] for i in range(len(sense) - 1))
+    return list(dict.fromkeys(grams))
+
+
+def encode_postings(ids: List[int]) -> bytes:
+    """遞增編號以差值 + varint 壓縮"""
+    out = bytearray()
+    previous = 0
+    for value in ids:
+        delta = value - previous
+        previous = value
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_postings(data, start: int, end: int) -> List[int]:
+    ids = []
+    value = 0
+    shift = 0
+    delta = 0
+    for i in range(start, end):
+        byte = data[i]
+        delta |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        value += delta
+        ids.append(value)
+        delta = shift = 0
+    return ids
+
+
+def intersect(lists: List[List[int]]) -> List[int]:
+    """多個遞增列表的交集；從最短的列表開始，在其他列表中以二分搜尋逐步前進"""
+    if not lists:
+        return []
+    lists = sorted(lists, key=len)
+    result = lists[0]
+    for other in lists[1:]:
+        matched = []
+        lo = 0
+        for value in result:
+            lo = bisect.bisect_left(other, value, lo)
+            if lo == len(other):
+                break
+            if other[lo] == value:
+                matched.append(value)
+        result = matched
+        if not result:
+            break
+    return result
+
+
+class ZhIndex:
+    """中文翻譯的倒排索引；查詢結果為 words.json 中的索引"""
+
+    def __init__(self, terms: List[str], offsets, postings: bytes):
+        self.terms = terms
+        self.offsets = offsets
+        self.postings = postings
+
+    @classmethod
+    def build(cls, entries: List[Dict]) -> 'ZhIndex':
+        table: Dict[str, List[int]] = {}
+        for i, entry in enumerate(entries):
+            for gram in tokenize(entry['translation']):
+                table.setdefault(gram, []).append(i)
+        terms = sorted(table)
+        offsets = array('I', [0])
+        blob = bytearray()
+        for term in terms:
+            blob.extend(encode_postings(table[term]))
+            offsets.append(len(blob))
+        return cls(terms, offsets, bytes(blob))
+
+    def postings_for(self, term: str) -> List[int]:
+        """某個詞彙的倒排列表（沒有時為空列表）"""
+        i = bisect.bisect_left(self.terms, term)
+        if i == len(self.terms) or self.terms[i] != term:
+            return []
+        return decode_postings(self.postings, self.offsets[i], self.offsets[i + 1])
+
+    def candidates(self, query: str) -> List[int]:
+        """包含查詢所有詞彙的單字（可能有誤判，需再比對）"""
+        grams = query_grams(query)
+        if not grams:
+            return []
+        lists = []
+        for gram in grams:
+            ids = self.postings_for(gram)
+            if not ids:
+                return []
+            lists.append(ids)
+        return intersect(lists)
+
+    def search(self, query: str, entries: List[Dict], limit: int = 20) -> List[int]:
+        """查詢中文，回傳排序後的單字索引"""
+        targets = split_senses(query)
+        if not targets:
+            return []
+        ranked = []
+        for i in self.candidates(query):
+            senses = split_senses(entries[i]['translation'])
+            best = None
+            for sense in senses:
+                if all(t in sense for t in targets):
+                    score = (sense not in targets, not sense.startswith(targets[0]), len(sense))
+                    if best is None or score < best:
+                        best = score
+            if best is not None:
+                ranked.append((best, i))
+        ranked.sort()
+        return [i for _, i in ranked[:limit]]
+
+    def encode(self) -> bytes:
+        terms = '\n'.join(self.terms).encode('utf-8')
+        header = _HEADER.pack(MAGIC, INDEX_VERSION, 0, len(self.terms), len(terms), len(self.postings))
+        return header + terms + array('I', self.offsets).tobytes() + self.postings
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.encode())
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'ZhIndex':
+        data = Path(path).read_bytes()
+        magic, version, _, count, terms_size, postings_size = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path}: 不是中文索引文件")
+        if version != INDEX_VERSION:
+            raise ValueError(f"{path}: 不支援的版本 {version}")
+        offset = _HEADER.size
+        terms = data[offset:offset + terms_size].decode('utf-8').split('\n') if count else []
+        offset += terms_size
+        offsets = array('I')
+        offsets.frombytes(data[offset:offset + 4 * (count + 1)])
+        if sys.byteorder != 'little':
+            offsets.byteswap()
+        offset += 4 * (count + 1)
+        return cls(terms, offsets, data[offset:offset + postings_size])
+
+
+def scan_search(query: str, entries: List[Dict]) -> List[int]:
+    """對照組：逐筆比對（與 ZhIndex.search 找到相同的單字，不排序）"""
+    targets = split_senses(query)
+    if not targets:
+        return []
+    return [i for i, e in enumerate(entries)
+            if any(all(t in sense for t in targets) for sense in split_senses(e['translation']))]
+
+
+def main():
+    script_dir = Path(__file__).parent
+    words_file = Path(sys.argv[1]) if len(sys.argv) > 1 else script_dir.parent / 'assets' / 'data' / 'words.json'
+    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else BUILD_DIR / INDEX_NAME
+    if not words_file.exists():
+        print(f"錯誤: 找不到文件 {words_file}")
+        sys.exit(1)
+
+    with open(words_file, 'r', encoding='utf-8') as f:
+        entries = json.load(f)
+    index = ZhIndex.build(entries)
+    index.save(output_file)
+    print(f"共 {len(entries)} 個單字、{len(index.terms)} 個詞彙，倒排資料 {len(index.postings) / 1024:.1f} KB")
+    print(f"已保存到 {output_file}（{output_file.stat().st_size / 1024:.1f} KB）")
+
+    loaded = ZhIndex.load(output_file)
+    for query in ('能力', '蘋果', '快'):
+        found = loaded.search(query, entries, limit=5)
+        print(f"  {query}: {[(entries[i]['word'], entries[i]['translation']) for i in found]}")
+
+
+if __name__ == '__main__':
+    main()